@@ -0,0 +1,136 @@
+"""
+Dávkový simulátor Arena Survival pro vyhodnocení vyváženosti obtížností.
+
+Spouští mnoho nezávislých headless her (různé seedy a obtížnosti)
+paralelně v procesech. Každý proces vlastní svou `Game` bez okna
+a výsledky průběžně posílá zpět ve formátu, který zapisuje `save_result`
+(navíc s poli "difficulty" a "seed"). Výstup je JSON Lines.
+
+Příklad:
+    python batch.py --runs 100 --difficulties Lama Superman --output results.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+
+from settings import DIFFICULTY_LEVELS
+
+# Uvítací hláška pygame by se v procesech míchala s výstupem JSON Lines
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Hra vlastněná aktuálním pracovním procesem (vytvoří se v _init_worker)
+_worker_game = None
+
+
+def _init_worker():
+    """Vytvoří headless hru v pracovním procesu."""
+    global _worker_game
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    from game import Game
+
+    _worker_game = Game(headless=True)
+
+
+def run_simulation(job):
+    """
+    Odehraje jednu headless hru a vrátí její výsledek.
+
+    Args:
+        job: Tuple (difficulty, seed, duration, dt)
+
+    Returns:
+        Slovník výsledku (schéma save_result + difficulty + seed)
+    """
+    from systems.bot import DodgeBot
+
+    difficulty, seed, duration, dt = job
+    game = _worker_game
+    game.start_simulation(player_name=f"bot-{seed}", difficulty=difficulty, seed=seed)
+    game.simulate(duration, dt=dt, policy=DodgeBot(seed))
+
+    result = game.last_result if game.state == "game_over" else game.current_result()
+    result = dict(result)
+    result["seed"] = seed
+    return result
+
+
+def build_jobs(difficulties, runs, seed, duration, dt):
+    """Vytvoří seznam úloh: `runs` seedů pro každou obtížnost."""
+    return [
+        (difficulty, seed + i, duration, dt)
+        for difficulty in difficulties
+        for i in range(runs)
+    ]
+
+
+def run_batch(jobs, workers=None):
+    """
+    Spustí úlohy v poolu procesů a průběžně vrací jejich výsledky.
+
+    Args:
+        jobs: Seznam úloh z build_jobs()
+        workers: Počet procesů (None = počet jader)
+
+    Yields:
+        Slovník výsledku pro každou dokončenou hru (v pořadí dokončení)
+    """
+    pool = multiprocessing.Pool(processes=workers, initializer=_init_worker)
+    try:
+        yield from pool.imap_unordered(run_simulation, jobs, chunksize=1)
+        # Řádné ukončení - pygame v procesech nemusí reagovat na terminate()
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paralelní dávková simulace Arena Survival")
+    parser.add_argument("--runs", type=int, default=32, help="počet her na obtížnost")
+    parser.add_argument(
+        "--difficulties", nargs="+", default=DIFFICULTY_LEVELS, choices=DIFFICULTY_LEVELS,
+    )
+    parser.add_argument("--seed", type=int, default=0, help="první seed")
+    parser.add_argument("--duration", type=float, default=600.0, help="max. simulovaný čas hry [s]")
+    parser.add_argument("--dt", type=float, default=1 / 60, help="délka kroku simulace [s]")
+    parser.add_argument("--workers", type=int, default=None, help="počet procesů (výchozí: všechna jádra)")
+    parser.add_argument("--output", default="-", help="výstupní soubor JSON Lines (- = stdout)")
+    parser.add_argument("--save", action="store_true", help="ukládat výsledky i do žebříčků")
+    args = parser.parse_args()
+
+    jobs = build_jobs(args.difficulties, args.runs, args.seed, args.duration, args.dt)
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    writer = None
+    if args.save:
+        from systems.result_writer import ResultWriter
+
+        writer = ResultWriter()
+    try:
+        for result in run_batch(jobs, args.workers):
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+            if writer is not None:
+                writer.submit(
+                    result["difficulty"],
+                    result["name"],
+                    result["score"],
+                    result["shoots"],
+                    result["accuracy"],
+                    result["game_duration_ms"],
+                    result["game_start_datetime"],
+                )
+    finally:
+        if writer is not None:
+            writer.close()
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Mikro-benchmark vyhodnocení zásahů projektilů (500 projektilů proti 5 000 nepřátel).
+
+Porovnává jeden krok zásahové fáze:
+- "spritecollide": původní smyčka `pygame.sprite.spritecollide` pro každý projektil
+- "grid": hash nepřátel + dotaz na koncový rect projektilu + resolve_hits
+- "sweep": hash nepřátel + dávkový test celé dráhy (SpatialHash.sweep) + resolve_hits
+
+Stav se mezi opakováními nemění (nic se neodstraňuje), každé měření tak
+dělá stejnou práci.
+
+Spuštění z kořene projektu:
+    python -m benchmarks.bullets
+    python -m benchmarks.bullets --bullets 200 --enemies 20000
+"""
+
+import argparse
+import os
+import random
+
+# Běh bez okna a bez zvukového zařízení
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.collision import measure, populate
+from systems.collision import SpatialHash, resolve_hits
+
+
+def add_bullets(game, count, seed=0):
+    """Rozmístí projektily náhodně po oblasti nepřátel a posune je o jeden krok."""
+    rng = random.Random(seed)
+    right = max(enemy.rect.right for enemy in game.enemies)
+    bottom = max(enemy.rect.bottom for enemy in game.enemies)
+    bullets = []
+    for _ in range(count):
+        pos = (rng.uniform(0, right), rng.uniform(0, bottom))
+        direction = pygame.Vector2(1, 0).rotate(rng.uniform(0, 360))
+        bullet = game.bullet_pool.acquire(game, pos, direction)
+        bullet.update(1 / 60)
+        bullets.append(bullet)
+    return bullets
+
+
+def spritecollide_hits(bullets, enemies):
+    """Původní verze: spritecollide pro každý projektil (bez odstranění)."""
+    kills = set()
+    consumed = []
+    for bullet in bullets:
+        hits = [e for e in pygame.sprite.spritecollide(bullet, enemies, False) if e not in kills]
+        if hits:
+            kills.update(hits)
+            consumed.append(bullet)
+    return kills, consumed
+
+
+def grid_hits(bullets, enemies, grid):
+    """Hash nepřátel a dotaz na koncový rect každého projektilu."""
+    grid.build(enemies)
+    return resolve_hits((bullet, grid.query(bullet.rect)) for bullet in bullets)
+
+
+def sweep_hits(bullets, enemies, grid):
+    """Hash nepřátel a dávkový test dráhy všech projektilů."""
+    grid.build(enemies)
+    return resolve_hits(grid.sweep(
+        (
+            bullet, bullet.prev_pos.x, bullet.prev_pos.y, bullet.pos.x, bullet.pos.y,
+            bullet.rect.width / 2, bullet.rect.height / 2,
+        )
+        for bullet in bullets
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark zásahů projektilů")
+    parser.add_argument("--bullets", type=int, default=500)
+    parser.add_argument("--enemies", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pygame.init()
+    from game import Game
+
+    game = Game(headless=True)
+    game.start_simulation("bench", seed=0)
+    game.step(0)
+    populate(game, args.enemies)
+    bullets = add_bullets(game, args.bullets)
+    grid = SpatialHash()
+
+    variants = [
+        ("spritecollide", lambda: spritecollide_hits(bullets, game.enemies)),
+        ("grid", lambda: grid_hits(bullets, game.enemies, grid)),
+        ("sweep", lambda: sweep_hits(bullets, game.enemies, grid)),
+    ]
+    print(f"{args.bullets} projektilů, {args.enemies} nepřátel")
+    print(f"{'varianta':<15} {'krok [ms]':>10} {'zabití':>8} {'projektilů':>11}")
+    for name, func in variants:
+        kills, consumed = func()
+        ms = measure(func, args.repeat)
+        print(f"{name:<15} {ms:>10.2f} {len(kills):>8} {len(consumed):>11}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
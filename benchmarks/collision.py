@@ -0,0 +1,102 @@
+"""
+Benchmark detekce kolizí pro Arena Survival.
+
+Měří cenu jednoho snímku kolizní fáze (`Game.handle_collisions`)
+pro 100, 1 000 a 10 000 nepřátel a porovnává ji s původním párovým
+porovnáním O(n²).
+
+Spuštění z kořene projektu:
+    python -m benchmarks.collision
+    python -m benchmarks.collision --counts 100 1000 --pairwise
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+
+# Běh bez okna a bez zvukového zařízení
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from entities.enemy import Enemy
+
+
+def populate(game, count, size=(30, 30), spacing=40, seed=0):
+    """
+    Naplní hru nepřáteli v mřížce tak, aby se navzájem nepřekrývali.
+
+    Díky tomu je stav stabilní a každý opakovaný snímek dělá stejnou práci.
+    """
+    rng = random.Random(seed)
+    game.reset_game()
+    columns = max(1, int(math.sqrt(count)))
+    for i in range(count):
+        x = (i % columns) * spacing + rng.randint(0, spacing - size[0] - 1)
+        y = (i // columns) * spacing + rng.randint(0, spacing - size[1] - 1)
+        enemy = Enemy(game, (x, y), size=size)
+        game.enemies.add(enemy)
+        game.all_sprites.add(enemy)
+    # Hráč mimo oblast nepřátel, aby nenastal game over
+    game.player.pos.update(-1000, -1000)
+    game.player.rect.center = game.player.pos
+
+
+def pairwise_collisions(enemies):
+    """Původní párové porovnání nepřítel-nepřítel (referenční verze)."""
+    enemies_list = list(enemies)
+    to_remove = set()
+    for i in range(len(enemies_list)):
+        a = enemies_list[i]
+        for j in range(i + 1, len(enemies_list)):
+            b = enemies_list[j]
+            if a.rect.colliderect(b.rect):
+                to_remove.add(a)
+                to_remove.add(b)
+    return to_remove
+
+
+def measure(func, repeat):
+    """Vrátí medián doby běhu funkce v milisekundách."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark kolizní fáze Game.update")
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--pairwise",
+        action="store_true",
+        help="změřit i původní O(n²) porovnání (u 10k nepřátel trvá desítky sekund)",
+    )
+    args = parser.parse_args()
+
+    pygame.init()
+    from game import Game
+
+    game = Game()
+
+    print(f"{'nepřátel':>10} {'hash [ms]':>12} {'párově [ms]':>12}")
+    for count in args.counts:
+        populate(game, count)
+        grid_ms = measure(game.handle_collisions, args.repeat)
+        pair_ms = "-"
+        if args.pairwise:
+            repeat = max(1, args.repeat // 10) if count > 1000 else args.repeat
+            pair_ms = f"{measure(lambda: pairwise_collisions(game.enemies), repeat):.2f}"
+        print(f"{count:>10} {grid_ms:>12.2f} {pair_ms:>12}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
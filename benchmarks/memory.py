@@ -0,0 +1,79 @@
+"""
+Paměť na jednu entitu (nepřítel, projektil) pro soak testy s tisíci entit.
+
+Vytvoří N nepřátel a N projektilů stejnou cestou jako hra (pooly,
+skupiny hry) a přes `tracemalloc` změří, kolik bajtů Pythonu připadá
+na jednu entitu včetně jejího členství ve skupinách.
+
+Spuštění z kořene projektu:
+    python -m benchmarks.memory
+    python -m benchmarks.memory --count 50000
+"""
+
+import argparse
+import gc
+import os
+import tracemalloc
+
+# Běh bez okna a bez zvukového zařízení
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+
+def measure_entities(game, count, kind):
+    """
+    Změří průměrnou paměť na entitu.
+
+    Args:
+        game: Headless Game se spuštěnou hrou
+        count: Počet vytvořených entit
+        kind: "enemy" nebo "bullet"
+
+    Returns:
+        Bajty na entitu
+    """
+    direction = pygame.Vector2(1, 0)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    created = []
+    for i in range(count):
+        pos = (i % 800, (i // 800) % 600)
+        if kind == "enemy":
+            entity = game.enemy_pool.acquire(game, pos, (30, 30))
+            game.enemies.add(entity)
+        else:
+            entity = game.bullet_pool.acquire(game, pos, direction)
+            game.bullets.add(entity)
+        game.all_sprites.add(entity)
+        created.append(entity)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Seznam created patří jen k měření, ne k entitám
+    overhead = created.__sizeof__()
+    return (after - before - overhead) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paměť na entitu")
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    pygame.init()
+    from game import Game
+
+    game = Game(headless=True)
+    print(f"{'entita':<10} {'bajtů/entitu':>14}")
+    for kind in ("enemy", "bullet"):
+        game.start_simulation("bench", seed=0)
+        game.step(0)
+        per_entity = measure_entities(game, args.count, kind)
+        print(f"{kind:<10} {per_entity:>14.0f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Měření doby startu Arena Survival (od spuštění do prvního snímku menu).
+
+Spouští `main.py --measure-startup` v samostatných procesech (bez okna,
+SDL dummy driver) a hlásí medián a maximum doby do prvního snímku
+i celkovou dobu procesu včetně startu interpretu. Skončí s kódem 1,
+pokud medián překročí cíl STARTUP_TARGET_MS.
+
+Spuštění z kořene projektu:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 20 --target 300
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from settings import STARTUP_TARGET_MS
+
+MAIN = Path(__file__).resolve().parent.parent / "main.py"
+
+
+def measure_once():
+    """
+    Spustí hru jednou a vrátí (první snímek v ms, celá doba procesu v ms).
+
+    Raises:
+        RuntimeError: Pokud hra nevypsala naměřenou dobu
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, str(MAIN), "--measure-startup"],
+        cwd=MAIN.parent, env=env, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    match = re.search(r"([\d.]+) ms", completed.stdout)
+    if match is None:
+        raise RuntimeError(f"main.py nevypsal dobu startu:\n{completed.stdout}{completed.stderr}")
+    return float(match.group(1)), wall_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Doba startu do prvního snímku")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--target", type=float, default=STARTUP_TARGET_MS, help="cíl pro medián [ms]")
+    args = parser.parse_args()
+
+    first_frames = []
+    walls = []
+    for _ in range(args.runs):
+        first_frame, wall = measure_once()
+        first_frames.append(first_frame)
+        walls.append(wall)
+    first_frames.sort()
+    walls.sort()
+    median = first_frames[len(first_frames) // 2]
+
+    print(f"{'':<22} {'medián [ms]':>12} {'max [ms]':>10}")
+    print(f"{'první snímek':<22} {median:>12.1f} {first_frames[-1]:>10.1f}")
+    print(f"{'proces celkem':<22} {walls[len(walls) // 2]:>12.1f} {walls[-1]:>10.1f}")
+    ok = median <= args.target
+    print(f"cíl {args.target:.0f} ms: {'splněn' if ok else 'PŘEKROČEN'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,361 @@
+"""
+Sada benchmarků horkých cest simulace a vykreslování Arena Survival.
+
+Každý scénář opakovaně měří jednu operaci (snímek simulace, vykreslení
+menu, uložení výsledku...) a hlásí počet operací za sekundu a rozložení
+doby operace (p50/p95/p99 v ms). Výsledky lze uložit jako baseline
+a při dalším běhu s ní porovnat - zpomalení nad práh se nahlásí jako
+regrese a skript skončí s kódem 1. Baseline platí jen pro stroj,
+na kterém vznikla (výchozí soubor benchmarks/baseline.json).
+
+Spuštění z kořene projektu (bez okna, SDL dummy driver):
+    python -m benchmarks.suite
+    python -m benchmarks.suite --save-baseline
+    python -m benchmarks.suite --only chase bullets --repeat 100
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Běh bez okna a bez zvukového zařízení
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from benchmarks.collision import populate
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Dočasné adresáře žebříčků vytvořené scénáři (smažou se na konci)
+_temp_dirs = []
+
+
+class Scenario:
+    """
+    Jeden měřený scénář.
+
+    Attributes:
+        name: Název scénáře (klíč v baseline)
+        setup: Funkce setup(game) volaná jednou před měřením
+        op: Měřená operace op(game)
+        prepare: Neměřená příprava před každou operací (volitelné)
+    """
+
+    def __init__(self, name, setup, op, prepare=None):
+        self.name = name
+        self.setup = setup
+        self.op = op
+        self.prepare = prepare
+
+
+def _measure_round(game, scenario, repeat, warmup):
+    """Připraví scénář a vrátí seřazené doby `repeat` operací v ns."""
+    scenario.setup(game)
+    op, prepare = scenario.op, scenario.prepare
+    for _ in range(warmup):
+        if prepare is not None:
+            prepare(game)
+        op(game)
+
+    samples = []
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare(game)
+        start = time.perf_counter_ns()
+        op(game)
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+    return samples
+
+
+def run_scenario(game, scenario, repeat, rounds=3, warmup=5):
+    """
+    Změří scénář.
+
+    Scénář se změří v `rounds` kolech (každé od čistého setupu) a použije
+    se kolo s nejnižším mediánem - šum od ostatních procesů tak výsledek
+    jen zhoršuje, nikdy nezlepšuje.
+
+    Returns:
+        Slovník s ops_per_sec, p50_ms, p95_ms, p99_ms a počtem operací
+    """
+    samples = min(
+        (_measure_round(game, scenario, repeat, warmup) for _ in range(rounds)),
+        key=lambda round_samples: round_samples[len(round_samples) // 2],
+    )
+    total = sum(samples)
+    last = len(samples) - 1
+
+    def percentile(p):
+        return round(samples[min(last, p * len(samples) // 100)] / 1e6, 4)
+
+    return {
+        "ops": len(samples),
+        "ops_per_sec": round(len(samples) / (total / 1e9), 1) if total else float("inf"),
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+    }
+
+
+# ----------------------------------------------------------------------
+# Scénáře simulace
+
+def _chase_setup(count):
+    def setup(game):
+        game.start_simulation("bench", seed=0)
+        game.step(0)
+        populate(game, count, spacing=36)
+    return setup
+
+
+def _step_frame(game):
+    game.update(1 / 60)
+
+
+def _bullet_storm(enemies, bullets):
+    """Nepřátelé v mřížce a před každým snímkem doplněný roj projektilů."""
+    rng = random.Random(1)
+
+    def setup(game):
+        _chase_setup(enemies)(game)
+
+    def prepare(game):
+        # Doplnit nepřátele i projektily, které minulý snímek zničil
+        if len(game.enemies) < enemies // 2:
+            populate(game, enemies, spacing=36)
+        game.shots_left = bullets
+        while len(game.bullets) < bullets:
+            pos = (rng.uniform(0, game.config.width), rng.uniform(0, game.config.height))
+            direction = pygame.Vector2(1, 0).rotate(rng.uniform(0, 360))
+            bullet = game.bullet_pool.acquire(game, pos, direction)
+            game.bullets.add(bullet)
+            game.all_sprites.add(bullet)
+
+    return setup, prepare
+
+
+# ----------------------------------------------------------------------
+# Scénáře vykreslování
+
+def _render_setup(game):
+    _chase_setup(100)(game)
+
+
+def _render_frame(game):
+    game.draw()
+
+
+def _menu_prepare(game):
+    game.menu.cache.invalidate()
+
+
+def _menu_draw(game):
+    game.menu.draw(game.screen)
+
+
+def _hud_draw(game):
+    game.draw_hud()
+
+
+# ----------------------------------------------------------------------
+# Scénáře žebříčku
+
+def _leaderboard_setup(rows):
+    def setup(game):
+        from systems import leaderboard
+
+        directory = Path(tempfile.mkdtemp(prefix="arena-bench-"))
+        _temp_dirs.append(directory)
+        leaderboard.LEADERBOARDS_DIR = directory
+        leaderboard.invalidate_cache()
+        rng = random.Random(rows)
+        batch = []
+        for i in range(rows):
+            batch.append((
+                rng.choice(leaderboard.DIFFICULTIES), f"p{i}", rng.randint(0, 50),
+                rng.randint(0, 20), rng.randint(0, 100), rng.randint(1000, 600000),
+                "2024-01-01T00:00:00",
+            ))
+            if len(batch) == 10000:
+                leaderboard.save_results(batch)
+                batch = []
+        leaderboard.save_results(batch)
+    return setup
+
+
+def _leaderboard_save(game):
+    from systems import leaderboard
+
+    leaderboard.save_result("Machr", "bench", 10, 12, 83, 45000, "2024-01-01T00:00:00")
+
+
+def _leaderboard_query_uncached(game):
+    from systems import leaderboard
+
+    leaderboard.invalidate_cache()
+    leaderboard.get_leaderboard("Machr", 5)
+
+
+def _leaderboard_query_cached(game):
+    from systems import leaderboard
+
+    leaderboard.get_leaderboard("Machr", 5)
+
+
+# ----------------------------------------------------------------------
+# Scénáře binárního archivu výsledků
+
+# Archiv otevřený pro zápis posledním setupem (zavře se na konci)
+_archive = None
+
+
+def _archive_setup(rows):
+    def setup(game):
+        global _archive
+        from systems.archive import ResultArchive
+        from systems.leaderboard import DIFFICULTIES
+
+        directory = Path(tempfile.mkdtemp(prefix="arena-bench-"))
+        _temp_dirs.append(directory)
+        if _archive is not None:
+            _archive.close()
+        _archive = ResultArchive(directory / "archive.bin", writable=True)
+        rng = random.Random(rows)
+        _archive.extend(
+            (
+                rng.choice(DIFFICULTIES), f"p{i}", rng.randint(0, 50),
+                rng.randint(0, 20), rng.randint(0, 100), rng.randint(1000, 600000),
+                "2024-01-01T00:00:00",
+            )
+            for i in range(rows)
+        )
+    return setup
+
+
+def _archive_append(game):
+    _archive.append("Machr", "bench", 10, 12, 83, 45000, "2024-01-01T00:00:00")
+
+
+def _archive_top(game):
+    _archive.top("Machr", 5)
+
+
+def build_scenarios():
+    """Vrátí seznam všech scénářů v pořadí spouštění."""
+    scenarios = []
+    for count in (100, 1000, 5000):
+        scenarios.append(Scenario(f"chase-{count}", _chase_setup(count), _step_frame))
+    for enemies, bullets in ((1000, 20), (1000, 200)):
+        setup, prepare = _bullet_storm(enemies, bullets)
+        scenarios.append(Scenario(f"bullets-{bullets}x{enemies}", setup, _step_frame, prepare))
+    scenarios.append(Scenario("render-frame-100", _render_setup, _render_frame))
+    scenarios.append(Scenario("render-menu", lambda game: None, _menu_draw, _menu_prepare))
+    scenarios.append(Scenario("render-hud", _render_setup, _hud_draw))
+    for rows in (1000, 100000):
+        setup = _leaderboard_setup(rows)
+        scenarios.append(Scenario(f"leaderboard-save-{rows}", setup, _leaderboard_save))
+        scenarios.append(Scenario(f"leaderboard-query-{rows}", setup, _leaderboard_query_uncached))
+    scenarios.append(Scenario("leaderboard-query-cached", _leaderboard_setup(1000), _leaderboard_query_cached))
+    setup = _archive_setup(100000)
+    scenarios.append(Scenario("archive-append-100000", setup, _archive_append))
+    scenarios.append(Scenario("archive-top-100000", setup, _archive_top))
+    return scenarios
+
+
+# ----------------------------------------------------------------------
+def compare(results, baseline, threshold):
+    """
+    Porovná výsledky s baseline podle mediánu doby operace.
+
+    Medián je proti občasným výkyvům (GC, plánovač) stabilnější než
+    průměrné ops/s.
+
+    Returns:
+        Seznam názvů scénářů, které zpomalily o více než `threshold` (0.2 = 20 %)
+    """
+    regressions = []
+    print(f"\n{'scénář':<28} {'baseline p50':>13} {'nyní p50':>10} {'změna':>8}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or not base["p50_ms"]:
+            continue
+        change = result["p50_ms"] / base["p50_ms"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESE"
+        print(f"{name:<28} {base['p50_ms']:>13.3f} {result['p50_ms']:>10.3f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarky simulace, vykreslování a žebříčku")
+    parser.add_argument("--only", nargs="+", help="spustit jen scénáře začínající těmito názvy")
+    parser.add_argument("--repeat", type=int, default=200, help="počet měřených operací na scénář")
+    parser.add_argument("--rounds", type=int, default=3, help="počet kol měření (použije se nejlepší)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="soubor baseline (JSON)")
+    parser.add_argument("--save-baseline", action="store_true", help="uložit výsledky jako novou baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="povolené zpomalení mediánu (0.2 = 20 %%)")
+    parser.add_argument("--json", type=Path, help="zapsat výsledky i do JSON souboru")
+    args = parser.parse_args()
+
+    pygame.init()
+    from game import Game
+
+    game = Game()
+    game.persist_results = False
+
+    scenarios = build_scenarios()
+    if args.only:
+        scenarios = [s for s in scenarios if s.name.startswith(tuple(args.only))]
+
+    from systems import leaderboard
+
+    # Scénáře žebříčku přesměrují databázi do dočasného adresáře
+    leaderboards_dir = leaderboard.LEADERBOARDS_DIR
+    results = {}
+    print(f"{'scénář':<28} {'ops/s':>12} {'p50 [ms]':>10} {'p95 [ms]':>10} {'p99 [ms]':>10}")
+    for scenario in scenarios:
+        try:
+            result = run_scenario(game, scenario, args.repeat, args.rounds)
+        finally:
+            leaderboard.LEADERBOARDS_DIR = leaderboards_dir
+            leaderboard.invalidate_cache()
+        results[scenario.name] = result
+        print(
+            f"{scenario.name:<28} {result['ops_per_sec']:>12.1f} {result['p50_ms']:>10.3f}"
+            f" {result['p95_ms']:>10.3f} {result['p99_ms']:>10.3f}"
+        )
+    pygame.quit()
+    if _archive is not None:
+        _archive.close()
+    for directory in _temp_dirs:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    regressions = []
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nBaseline uložena do {args.baseline}")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegrese: {', '.join(regressions)}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
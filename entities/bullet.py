@@ -21,6 +21,8 @@ class Bullet(Entity):
         timer: float - čas existence v sekundách
     """
 
+    __slots__ = ("direction", "timer")
+
     def __init__(self, game, pos, direction):
         """
         Inicializuje projektil.
@@ -35,6 +37,17 @@ class Bullet(Entity):
         self.direction = direction
         self.timer = 0  # Odpočet života projektilu
 
+    def reset(self, game, pos, direction):
+        """
+        Připraví projektil z poolu k novému použití (stejné argumenty jako __init__).
+        """
+        self.game = game
+        self.pos.update(pos)
+        self.prev_pos.update(pos)
+        self.rect.center = self.pos
+        self.direction = direction
+        self.timer = 0
+
     def update(self, dt):
         """
         Aktualizuje pozici a životnost projektilu.
@@ -45,11 +58,12 @@ class Bullet(Entity):
         Projektil se pohybuje konstantní rychlostí daným směrem.
         Po vypršení BULLET_LIFETIME se sám odstraní.
         """
-        # Pohyb v daném směru
+        # Pohyb v daném směru (prev_pos = začátek dráhy pro průběžnou kolizi)
+        self.prev_pos.update(self.pos)
         self.pos += self.direction * BULLET_SPEED * dt
         self.rect.center = self.pos
 
         # Odpočet životnosti
         self.timer += dt
         if self.timer >= BULLET_LIFETIME:
-            self.kill()  # Odstranění ze všech sprite skupin
+            self.kill()  # Odstranění ze všech skupin
@@ -6,16 +6,30 @@ Nepřátelé se neustále pohybují směrem k hráči.
 
 import pygame
 from entities.entity import Entity
+from entities.entity import shared_image
 from settings import ENEMY_SPEED
 
+# Barva nepřátel
+ENEMY_COLOR = (255, 60, 60)
+
 class Enemy(Entity):
     """
     Nepřátelská entita, která pronásleduje hráče.
     
     Automaticky se pohybuje směrem k pozici hráče konstantní rychlostí.
     Při kontaktu s hráčem způsobí game over.
+    
+    Attributes:
+        store: EnemyStore hry (nebo None)
+        store_index: Index řádku ve vektorovém úložišti
+            (None = nepřítel není v úložišti)
     """
 
+    __slots__ = ("store", "store_index")
+
+    # Vlastní pozici drží slot "pos" z Entity, který zakrývá vlastnost pos níže
+    _pos = Entity.pos
+
     def __init__(self, game, pos, size=(30, 30)):
         """
         Inicializuje nepřítele.
@@ -25,8 +39,50 @@ class Enemy(Entity):
             pos: Tuple (x, y) - počáteční pozice (obvykle na okraji obrazovky)
             size: Tuple (width, height) - velikost nepřítele (pro obtížnost)
         """
+        self.store_index = None
+        # Setter pos jen přepisuje tento vektor, musí proto existovat předem
+        self._pos = pygame.Vector2()
         # Červený čtverec - velikost dle obtížnosti
-        super().__init__(game, pos, size, (255, 60, 60))
+        super().__init__(game, pos, size, ENEMY_COLOR)
+        self._register_store(size)
+
+    def reset(self, game, pos, size=(30, 30)):
+        """
+        Připraví nepřítele z poolu k novému použití (stejné argumenty jako __init__).
+        """
+        self.game = game
+        if self.rect.size != tuple(size):
+            self.image = shared_image(size, ENEMY_COLOR)
+            self.rect = self.image.get_rect()
+        self.pos = pos
+        self.prev_pos.update(pos)
+        self.rect.center = self.pos
+        self._register_store(size)
+
+    def _register_store(self, size):
+        """Registrace do vektorového úložiště, pokud ho hra používá."""
+        self.store = self.game.enemy_store
+        if self.store is not None:
+            self.store.add(self, self._pos, size, ENEMY_SPEED)
+
+    @property
+    def pos(self):
+        """Přesná pozice nepřítele (při použití úložiště čtená z jeho polí)."""
+        if self.store_index is not None:
+            return pygame.Vector2(*self.store.pos[self.store_index])
+        return self._pos
+
+    @pos.setter
+    def pos(self, value):
+        self._pos.update(value)
+        if self.store_index is not None:
+            self.store.pos[self.store_index] = value
+
+    def on_removed(self):
+        """Po odstranění ze skupin uvolní i řádek ve vektorovém úložišti."""
+        if self.store_index is not None:
+            self.store.remove(self)
+        super().on_removed()
 
     def update(self, dt):
         """
@@ -36,14 +92,18 @@ class Enemy(Entity):
             dt: Delta time v sekundách
             
         Vypočítá směr k hráči, normalizuje ho a aplikuje rychlost.
+        Nepřátele ve vektorovém úložišti posouvá dávkově `EnemyStore.step`.
         """
+        if self.store_index is not None:
+            return
+
         # Výpočet směru k hráči
-        direction = (self.game.player.pos - self.pos)
+        direction = (self.game.player.pos - self._pos)
         
         # Normalizace směru (jednotkový vektor)
         if direction.length() > 0:
            direction = direction.normalize()
 
-        # Pohyb směrem k hráči
-        self.pos += direction * ENEMY_SPEED * dt
-        self.rect.center = self.pos
+        # Pohyb směrem k hráči (vlastní vektor na místě, bez setteru)
+        self._pos += direction * ENEMY_SPEED * dt
+        self.rect.center = self._pos
@@ -7,19 +7,45 @@ Poskytuje společnou funkcionalitu pro všechny herní objekty
 
 import pygame
 
-class Entity(pygame.sprite.Sprite):
+# Sdílené obrázky podle (size, color) - entity stejného vzhledu sdílí jeden Surface
+_image_cache = {}
+
+
+def shared_image(size, color):
+    """
+    Vrátí vyplněný Surface dané velikosti a barvy sdílený všemi entitami.
+
+    Surface se nesmí měnit - změna by se projevila u všech entit.
+    """
+    key = (tuple(size), tuple(color))
+    image = _image_cache.get(key)
+    if image is None:
+        image = pygame.Surface(size)
+        image.fill(color)
+        _image_cache[key] = image
+    return image
+
+
+class Entity:
     """
     Rodičovská třída pro všechny herní objekty.
     
-    Dědí z pygame.sprite.Sprite pro podporu sprite skupin a kolizí.
+    Kompaktní objekt se `__slots__` (bez `__dict__`); členství ve skupinách
+    spravují skupiny hry (viz entities.group.EntityGroup).
     
     Attributes:
         game: Reference na hlavní herní objekt
         image: Pygame Surface - vizuální reprezentace entity
         pos: pygame.Vector2 - přesná pozice entity
+        prev_pos: pygame.Vector2 - pozice na začátku posledního kroku
+            simulace (pro interpolaci při vykreslování)
         rect: pygame.Rect - obdélník pro kolize a vykreslování
+        pool: EntityPool, do kterého se entita po odstranění vrátí (nebo None)
+        groups: N-tice skupin, ve kterých entita je
     """
 
+    __slots__ = ("game", "image", "pos", "prev_pos", "rect", "pool", "groups")
+
     def __init__(self, game, pos, size, color):
         """
         Inicializuje entitu.
@@ -30,17 +56,39 @@ class Entity(pygame.sprite.Sprite):
             size: Tuple (width, height) - rozměry entity
             color: Tuple (r, g, b) - barva entity
         """
-        super().__init__()
         self.game = game
+        self.pool = None
+        self.groups = ()
 
-        # Vytvoření obrázku (surface) s danou barvou
-        self.image = pygame.Surface(size)
-        self.image.fill(color)
+        # Obrázek (surface) s danou barvou - sdílený mezi entitami
+        self.image = shared_image(size, color)
 
         # Pozice a rect pro kolize
         self.pos = pygame.Vector2(pos)  # Přesná pozice s desetinnými čísly
+        self.prev_pos = pygame.Vector2(pos)  # Pozice před posledním krokem
         self.rect = self.image.get_rect(center=pos)  # Obdélník pro kolize
 
+    def alive(self):
+        """Vrátí True, pokud je entita alespoň v jedné skupině."""
+        return bool(self.groups)
+
+    def kill(self):
+        """Odstraní entitu ze všech skupin (a vrátí ji do poolu)."""
+        groups, self.groups = self.groups, ()
+        for group in groups:
+            group.remove_internal(self)
+        self.on_removed()
+
+    def on_removed(self):
+        """
+        Volá se, když entita opustí poslední skupinu.
+
+        Entitu z poolu vrátí zpět do poolu k dalšímu použití.
+        """
+        if self.pool is not None:
+            pool, self.pool = self.pool, None
+            pool.release(self)
+
     def update(self, dt):
         """
         Aktualizuje stav entity.
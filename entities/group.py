@@ -0,0 +1,136 @@
+"""
+Skupiny herních entit (náhrada pygame.sprite.Group a RenderUpdates).
+
+Skupina drží entity ve slovníku podle pořadí vložení (stejné pořadí
+iterace jako pygame.sprite.Group) a entita si pamatuje n-tici skupin,
+ve kterých je. Entita tak nepotřebuje vlastní slovník skupin ani
+`__dict__` jako pygame.sprite.Sprite.
+"""
+
+
+class EntityGroup:
+    """
+    Kontejner entit pro update, kolize a vykreslování.
+
+    Entita musí mít atributy `groups` (n-tice skupin), `image` a `rect`
+    a metodu `on_removed()` (viz Entity).
+
+    Attributes:
+        entity_map: Slovník entita -> Rect z minulého vykreslení (nebo None)
+    """
+
+    def __init__(self):
+        """Inicializuje prázdnou skupinu."""
+        self.entity_map = {}
+
+    def __iter__(self):
+        # Kopie - entity se mohou během procházení odstranit (kill)
+        return iter(list(self.entity_map))
+
+    def __len__(self):
+        return len(self.entity_map)
+
+    def __contains__(self, entity):
+        return entity in self.entity_map
+
+    def sprites(self):
+        """Vrátí seznam entit (rozhraní jako pygame.sprite.Group)."""
+        return list(self.entity_map)
+
+    def add(self, *entities):
+        """Přidá entity do skupiny (entita, která už ve skupině je, se přeskočí)."""
+        for entity in entities:
+            if entity not in self.entity_map:
+                self.entity_map[entity] = None
+                entity.groups += (self,)
+
+    def remove(self, *entities):
+        """
+        Odebere entity ze skupiny.
+
+        Entita, která tím opustí poslední skupinu, se vrátí do poolu.
+        """
+        for entity in entities:
+            if entity in self.entity_map:
+                self.remove_internal(entity)
+                entity.groups = tuple(g for g in entity.groups if g is not self)
+                if not entity.groups:
+                    entity.on_removed()
+
+    def remove_internal(self, entity):
+        """Odebere entitu jen ze slovníku skupiny (n-tici skupin řeší volající)."""
+        del self.entity_map[entity]
+
+    def empty(self):
+        """Odebere všechny entity ze skupiny."""
+        self.remove(*self.entity_map)
+
+    def update(self, dt):
+        """Zavolá update(dt) všech entit ve skupině."""
+        for entity in list(self.entity_map):
+            entity.update(dt)
+
+    def draw(self, surface):
+        """
+        Vykreslí všechny entity na surface.
+
+        Returns:
+            Prázdný seznam (změněné oblasti sleduje jen RenderGroup)
+        """
+        surface.blits([(entity.image, entity.rect) for entity in self.entity_map], False)
+        return []
+
+
+class RenderGroup(EntityGroup):
+    """
+    Skupina, která si pamatuje, kde byla každá entita vykreslena minule
+    (pro DirtyRenderer, obdoba pygame.sprite.RenderUpdates).
+
+    Attributes:
+        lost_rects: Oblasti odstraněných entit, které je třeba smazat
+    """
+
+    def __init__(self):
+        """Inicializuje prázdnou skupinu."""
+        super().__init__()
+        self.lost_rects = []
+
+    def remove_internal(self, entity):
+        """Odebere entitu a zapamatuje si oblast, kde byla naposledy vykreslena."""
+        lost_rect = self.entity_map.pop(entity)
+        if lost_rect:
+            self.lost_rects.append(lost_rect)
+
+    def clear(self, surface, background):
+        """Smaže oblasti minulého vykreslení všech entit pozadím."""
+        blit = surface.blit
+        for rect in self.lost_rects:
+            blit(background, rect, rect)
+        for rect in self.entity_map.values():
+            if rect:
+                blit(background, rect, rect)
+
+    def draw(self, surface):
+        """
+        Vykreslí entity a vrátí změněné oblasti obrazovky.
+
+        Returns:
+            Seznam Rect - sjednocení staré a nové oblasti každé entity
+            a oblasti odstraněných entit
+        """
+        blit = surface.blit
+        dirty = self.lost_rects
+        self.lost_rects = []
+        entity_map = self.entity_map
+        for entity, old_rect in entity_map.items():
+            new_rect = blit(entity.image, entity.rect)
+            if old_rect:
+                if new_rect.colliderect(old_rect):
+                    dirty.append(new_rect.union(old_rect))
+                else:
+                    dirty.append(new_rect)
+                    dirty.append(old_rect)
+            else:
+                dirty.append(new_rect)
+            entity_map[entity] = new_rect
+        return dirty
@@ -4,10 +4,14 @@ Třída hráče pro Arena Survival.
 Zpracovává pohyb pomocí klávesnice (WASD) a střelbu směrem k myši.
 """
 
+import math
 import pygame
 from entities.entity import Entity
-from entities.bullet import Bullet
-from settings import PLAYER_SPEED, WIDTH, HEIGHT, SHOOT_DISTANCE
+from systems import assets
+from settings import PLAYER_SPEED, SHOOT_DISTANCE
+
+# Složka jednotkového vektoru při diagonálním pohybu (stejně jako Vector2.normalize)
+DIAGONAL = 1 / math.sqrt(2)
 
 class Player(Entity):
     """
@@ -19,6 +23,8 @@ class Player(Entity):
         Klik myši - Střelba
     """
 
+    __slots__ = ()
+
     def __init__(self, game, pos):
         """
         Inicializuje hráče.
@@ -29,8 +35,7 @@ class Player(Entity):
         """
         # Modrý čtverec 40x40 pixelů
         super().__init__(game, pos, (40, 40), (50, 200, 255))
-        self.image = pygame.image.load("assets/robot.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (40, 40))
+        self.image = assets.load_image("robot.png", (40, 40))
 
     def update(self, dt):
         """
@@ -44,55 +49,68 @@ class Player(Entity):
         - Normalizaci diagonálního pohybu
         - Omezení pohybu uvnitř herní plochy
         """
-        # Získání stavu klávesnice
-        keys = pygame.key.get_pressed()
-        # Inicializace rychlosti na nulu
-        vel = pygame.Vector2(0, 0)
+        # Získání stavu kláves (živá klávesnice, nebo vstupy simulace)
+        inputs = self.game.inputs
+        if inputs is None:
+            keys = pygame.key.get_pressed()
+            up, down = keys[pygame.K_w], keys[pygame.K_s]
+            left, right = keys[pygame.K_a], keys[pygame.K_d]
+        else:
+            up, down, left, right = inputs.up, inputs.down, inputs.left, inputs.right
 
-        # Vstup pohybu (WASD)
-        if keys[pygame.K_w]: vel.y = -1  # Nahoru
-        if keys[pygame.K_s]: vel.y = 1   # Dolů
-        if keys[pygame.K_a]: vel.x = -1  # Doleva
-        if keys[pygame.K_d]: vel.x = 1   # Doprava
+        # Směr pohybu (WASD) - bez alokace Vector2 v každém snímku
+        vx = 0
+        vy = 0
+        if up: vy = -1      # Nahoru
+        if down: vy = 1     # Dolů
+        if left: vx = -1    # Doleva
+        if right: vx = 1    # Doprava
 
         # Normalizace rychlosti, aby diagonální pohyb nebyl rychlejší
-        if vel.length() > 0:
-            vel = vel.normalize()
+        if vx and vy:
+            vx *= DIAGONAL
+            vy *= DIAGONAL
 
-        # Aplikace rychlosti na pozici
-        self.pos += vel * dt * PLAYER_SPEED
-        
-        # Omezení pohybu uvnitř herní plochy
+        # Aplikace rychlosti na pozici (bez vstupu se hráč nehýbe, ale clamp
+        # a rect platí i tak - např. po zmenšení arény)
+        pos = self.pos
+        x = pos.x + vx * dt * PLAYER_SPEED
+        y = pos.y + vy * dt * PLAYER_SPEED
+
+        # Clamp pozice, aby hráč nemohl opustit obrazovku
+        width, height = self.game.config.size
         half_width = self.rect.width / 2
         half_height = self.rect.height / 2
-        
-        # Clamp pozice, aby hráč nemohl opustit obrazovku
-        self.pos.x = max(half_width, min(self.pos.x, WIDTH - half_width))
-        self.pos.y = max(half_height, min(self.pos.y, HEIGHT - half_height))
-        
+        pos.x = max(half_width, min(x, width - half_width))
+        pos.y = max(half_height, min(y, height - half_height))
+
         # Aktualizace rect pro kolize
-        self.rect.center = self.pos
+        self.rect.center = pos
 
     def shoot(self):
         """
         Vystřelí projektil směrem k pozici myši.
         
-        Vytvoří nový Bullet objekt a přidá ho do příslušných sprite skupin.
+        Vezme Bullet z poolu hry a přidá ho do příslušných skupin.
         """
-        # Získání pozice myši
-        mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
+        # Získání pozice myši (živá myš, nebo vstupy simulace)
+        inputs = self.game.inputs
+        if inputs is None:
+            mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
+        else:
+            mouse_pos = pygame.Vector2(inputs.mouse_pos)
         
         # Výpočet směru od hráče k myši
         direction = mouse_pos - self.pos
 
         # Normalizace směru (jednotkový vektor)
-        print(direction.length())
         if 0 < direction.length() < SHOOT_DISTANCE:
             direction = direction.normalize()
 
-            # Vytvoření a přidání projektilu do hry
-            if self.game.shots_left > 0:
-                bullet = Bullet(self.game, self.pos, direction)
+            # Vytvoření a přidání projektilu do hry (je-li munice a volný limit)
+            limit = self.game.config.max_bullets
+            if self.game.shots_left > 0 and (limit is None or len(self.game.bullets) < limit):
+                bullet = self.game.bullet_pool.acquire(self.game, self.pos, direction)
                 self.game.shoots += 1
                 self.game.shots_left -= 1
                 self.game.bullets.add(bullet)
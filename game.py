@@ -1,19 +1,40 @@
 """
 Hlavní herní třída pro Arena Survival.
 
-Spravuje herní smyčku, sprite skupiny, kolize a vykreslování.
+Spravuje herní smyčku, skupiny entit, kolize a vykreslování.
 """
 
+import random
+import time
 import pygame
 from datetime import datetime
-from settings import WIDTH, HEIGHT, FPS, DIFFICULTY_LEVELS, ENEMY_SIZE_BY_DIFFICULTY, MAX_SHOOTS
-from entities.player import Player
-from systems.spawner import Spawner
-from systems.leaderboard import save_result
+from settings import (
+    FPS, DIFFICULTY_LEVELS, MAX_SHOOTS, USE_ENTITY_STORE,
+    RENDER_MODE, STATIC_SCREEN_TIMEOUT_MS, PRELOAD_ASSETS, RECORD_REPLAYS,
+    PROFILER_ENABLED, PROFILER_WINDOW, PROFILER_DUMP_PATH,
+    TICK_RATE, MAX_CATCHUP_STEPS, RENDER_INTERPOLATION, BULLET_COLLISION,
+)
+from entities.enemy import Enemy
+from entities.bullet import Bullet
+from entities.group import EntityGroup, RenderGroup
+from systems.collision import SpatialHash, resolve_hits
+from systems.inputs import IDLE_INPUT, read_live_input
+from systems.profiler import FrameProfiler
+from systems.config import GameConfig
+from systems.quality import QualityGovernor
+from systems.pool import EntityPool
+from systems import assets
 from ui.menu import Menu
-from ui.settings_menu import SettingsMenu
-from ui.score_menu import ScoreMenu
-from ui.widgets import draw_hud, draw_input_panel, draw_panel
+from ui.widgets import draw_hud, draw_input_panel, draw_panel, draw_profiler
+from ui.screen_cache import ScreenCache
+from ui.hud import Hud
+
+# Stavy se statickou obrazovkou - překreslují se jen při změně
+STATIC_STATES = ("menu", "name_entry", "settings", "scores", "game_over")
+
+# Události, po kterých je obsah okna ztracený a musí se překreslit celý
+# (WINDOWEXPOSED přibylo až v pygame 2.0.1)
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, getattr(pygame, "WINDOWEXPOSED", pygame.VIDEOEXPOSE))
 
 class Game:
     """
@@ -22,48 +43,123 @@ class Game:
     Attributes:
         screen: Pygame surface pro vykreslování
         clock: Pygame Clock pro kontrolu FPS
-        all_sprites: Skupina všech viditelných sprite objektů
+        all_sprites: Skupina všech viditelných entit
         enemies: Skupina nepřátelských entit
         bullets: Skupina projektilů
         player: Instance hráče
         spawner: Systém pro generování nepřátel
         running: Flag pro běh herní smyčky
         score: Aktuální skóre hráče
+        headless: True, pokud hra běží bez okna (simulace)
+        inputs: Vstupy hráče pro aktuální krok (None = živá klávesnice a myš)
+        rng: Generátor náhodných čísel hry (spawner), seedovaný pro každou hru
     """
 
-    def __init__(self):
-        """Inicializuje hru, vytváří okno a herní objekty."""
-        # Vytvoření herního okna
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Arena Survival – OOP Version")
+    def __init__(self, headless=False, seed=None, config=None, started_at=None):
+        """
+        Inicializuje hru, vytváří okno a herní objekty.
+
+        Args:
+            headless: Spustí hru bez okna, zvuku a vykreslování textu;
+                hra se pak řídí přes step() se simulovaným časem
+            seed: Seed generátoru náhodných čísel pro každou hru
+                (None = každá hra dostane náhodný seed)
+            config: GameConfig s velikostí arény, spawnem a limity
+                (None = výchozí hodnoty ze settings.py)
+            started_at: time.perf_counter() při spuštění programu pro měření
+                doby do prvního snímku (None = okamžik vytvoření Game)
+
+        Hráč, spawner, zvuky a obrázky se vytvoří/načtou až se startem
+        první hry, menu nastavení a výsledků až při prvním otevření.
+        """
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.first_frame_ms = None  # Doba od spuštění do prvního snímku
+        self.headless = headless
+        self.config = config if config is not None else GameConfig()
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.current_seed = None  # Seed právě běžící hry
+        self.recorder = None  # InputRecorder, pokud se hra nahrává
+        if headless:
+            # Bez okna - scéna se kreslí jen do paměti; displej (ani případné
+            # okno jiné hry v procesu) zůstává nedotčený
+            self.screen = pygame.Surface(self.config.size)
+        else:
+            # Vytvoření herního okna
+            self.screen = pygame.display.set_mode(self.config.size)
+            pygame.display.set_caption("Arena Survival – OOP Version")
         self.clock = pygame.time.Clock()
         
         # Herní menu a nastavení
         self.state = "menu"  # Začínáme menu
         self.menu = Menu(self)
         self.waiting_for_name = False  # Flag pro čekání na jméno před hrou
-        self.settings_menu = SettingsMenu(self)
-        self.score_menu = ScoreMenu(self)
+        self._settings_menu = None  # Vytvoří se při prvním otevření
+        self._score_menu = None
+        self.name_entry_cache = ScreenCache()
+        self.game_over_cache = ScreenCache()
+        self.hud = Hud()  # Popisky HUD se překreslují jen při změně hodnoty
 
         # Herní nastavení
         self.difficulties = DIFFICULTY_LEVELS
         self.difficulty_index = 0  # Výchozí: "Lama"
-        self.sound_on = True
-        self.sounds = self._load_sounds()
+        self.sound_on = not headless
+        self.sounds = {} if headless else None  # None = načte se se startem hry
         self.player_name = ""
         self.last_result = None
+        self.persist_results = not headless  # Ukládat výsledky do žebříčku
+        self._result_writer = None  # Zápis výsledků na pozadí (vznikne s prvním výsledkem)
+        self.inputs = None  # None = živá klávesnice a myš
+        self.pending_shots = 0  # Kliknutí myši od minulého kroku
+        self.sim_ticks = 0.0  # Herní čas v ms - součet dt od startu hry
+        self.accumulator = 0.0  # Reálný čas (s), který simulace ještě nedohnala
+        self.interpolate = RENDER_INTERPOLATION and not headless
+
+        # Snižování zátěže při přetížení (spawn, vynechané snímky)
+        self.quality = QualityGovernor(
+            self.config.frame_budget_ms, enabled=self.config.adaptive and not headless
+        )
 
-        # Sprite skupiny pro správu kolizí a vykreslování
-        self.all_sprites = pygame.sprite.Group()  # Všechny viditelné objekty
-        self.enemies = pygame.sprite.Group()       # Pouze nepřátelé
-        self.bullets = pygame.sprite.Group()       # Pouze projektily
+        # Měření času fází snímku (F3 ve hře)
+        self.profiler = FrameProfiler(window=PROFILER_WINDOW, enabled=PROFILER_ENABLED)
+        self.profiler_summary = None  # Poslední souhrn pro overlay
+        self.profiler_refresh = 0.0  # Čas (perf_counter) příštího přepočtu souhrnu
 
-        # Vytvoření hráče ve středu obrazovky
-        self.player = Player(self, (WIDTH // 2, HEIGHT // 2))
-        self.all_sprites.add(self.player)
+        # Renderer špinavých obdélníků (None = celá obrazovka každý snímek)
+        self.renderer = None
+        if RENDER_MODE == "dirty" and not headless:
+            from systems.renderer import DirtyRenderer
 
-        # Inicializace systému pro spawn nepřátel
-        self.spawner = Spawner(self)
+            self.renderer = DirtyRenderer(self.config.size)
+
+        # Skupiny entit pro správu kolizí a vykreslování
+        if self.renderer is not None:
+            # RenderGroup si pamatuje minulé pozice pro dirty rects
+            self.all_sprites = RenderGroup()
+        else:
+            self.all_sprites = EntityGroup()  # Všechny viditelné objekty
+        self.enemies = EntityGroup()       # Pouze nepřátelé
+        self.bullets = EntityGroup()       # Pouze projektily
+
+        # Volitelné vektorové úložiště nepřátel (vyžaduje NumPy)
+        self.enemy_store = None
+        if USE_ENTITY_STORE:
+            from systems import entity_store
+
+            if entity_store.is_available():
+                self.enemy_store = entity_store.EnemyStore()
+
+        # Pooly pro recyklaci projektilů a nepřátel
+        self.bullet_pool = EntityPool(Bullet)
+        self.bullet_pool.preallocate(MAX_SHOOTS, self, (0, 0), pygame.Vector2(1, 0))
+        self.enemy_pool = EntityPool(Enemy)
+
+        # Hráč a spawner vzniknou až v reset_game() při startu hry
+        self.player = None
+        self.spawner = None
+
+        # Prostorový hash nepřátel pro detekci kolizí
+        self.enemy_grid = SpatialHash()
 
         # Herní stav
         self.running = True
@@ -74,61 +170,312 @@ class Game:
         self.shots_left = MAX_SHOOTS
 
     # ------------------------------------------------------------------
-    def run(self):
+    def run(self, exit_after_first_frame=False):
         """
         Hlavní herní smyčka.
+
+        Args:
+            exit_after_first_frame: Skončit hned po prvním snímku
+                (měření doby startu, viz first_frame_ms)
         
         Běží, dokud je self.running True. Každý snímek:
         1. Omezuje FPS a vypočítá delta time
         2. Zpracovává vstupy
-        3. Aktualizuje herní stav
-        4. Vykresluje scénu
+        3. Aktualizuje herní stav v pevných krocích 1 / TICK_RATE
+        4. Vykresluje scénu (interpolovanou mezi posledními dvěma kroky)
         """
-        while self.running:
-            # Delta time v sekundách - čas od posledního snímku
-            dt = self.clock.tick(FPS) / 1000
-            self.handle_events()
+        try:
+            previous_state = None
+            while self.running:
+                if self.state in STATIC_STATES and self.state == previous_state:
+                    # Statická obrazovka - místo tikání FPS čekáme na událost
+                    events = self._wait_for_events()
+                    dt = 0
+                else:
+                    # Delta time v sekundách - čas od posledního snímku
+                    dt = self.clock.tick(self.config.fps) / 1000
+                    events = pygame.event.get()
+                self.profiler.start_frame()
+                self.handle_events(events)
+                self.profiler.lap("events")
+
+                # Po změně obrazovky je třeba překreslit vše
+                force = self.state != previous_state or any(
+                    event.type in EXPOSE_EVENTS for event in events
+                )
+                if self.state != previous_state:
+                    previous_state = self.state
+                    if self.renderer is not None:
+                        self.renderer.invalidate()
             
-            if self.state == "menu":
-                self.menu.draw(self.screen)
-                pygame.display.flip()
-
-            elif self.state == "name_entry":
-                self.draw_name_entry()
-                pygame.display.flip()
-
-            elif self.state == "game":
-                # Hra je spuštěna
-                if self.game_start_time is None:
-                    # Poprvé vstupujeme do běhu hry
-                    self.game_start_time = pygame.time.get_ticks()
-                    self.game_start_datetime = datetime.now().isoformat()
-                    self.reset_game()
-                self.update(dt)
-                self.draw()
+                if self.state == "menu":
+                    if self.menu.draw(self.screen, force):
+                        pygame.display.flip()
+
+                elif self.state == "name_entry":
+                    if self.draw_name_entry(force):
+                        pygame.display.flip()
+
+                elif self.state == "game":
+                    # Hra je spuštěna - simulace dožene uplynulý čas po pevných krocích
+                    if self.game_start_time is None:
+                        self.begin_game()
+                    work_start = time.perf_counter()
+                    alpha = self.advance(dt)
+                    if self.state == "game" and self.quality.should_render():
+                        self.draw(alpha)
+                    self.quality.record((time.perf_counter() - work_start) * 1000)
+                    self.profiler.end_frame()
                 
-            elif self.state == "settings":
-                self.settings_menu.draw(self.screen)
-                pygame.display.flip()
+                elif self.state == "settings":
+                    if self.settings_menu.draw(self.screen, force):
+                        pygame.display.flip()
                 
-            elif self.state == "scores":
-                self.score_menu.draw(self.screen)
-                pygame.display.flip()
+                elif self.state == "scores":
+                    if self.score_menu.draw(self.screen, force):
+                        pygame.display.flip()
+
+                elif self.state == "game_over":
+                    if self.draw_game_over(force):
+                        pygame.display.flip()
+
+                if self.first_frame_ms is None:
+                    # První snímek je na obrazovce - doba startu programu
+                    self.first_frame_ms = (time.perf_counter() - self.started_at) * 1000
+                    if exit_after_first_frame:
+                        self.running = False
+        finally:
+            # Před ukončením (i po výjimce) dopsat všechny čekající výsledky a záznam
+            if self._result_writer is not None:
+                self._result_writer.close()
+            self._stop_recording()
+            if PROFILER_DUMP_PATH and self.profiler.count:
+                self.profiler.dump(PROFILER_DUMP_PATH)
 
-            elif self.state == "game_over":
-                self.draw_game_over()
-                pygame.display.flip()
+    # ------------------------------------------------------------------
+    @property
+    def result_writer(self):
+        """Zápis výsledků na pozadí (vytvoří se při prvním použití)."""
+        if self._result_writer is None:
+            from systems.result_writer import ResultWriter
+
+            self._result_writer = ResultWriter()
+        return self._result_writer
+
+    # ------------------------------------------------------------------
+    @property
+    def settings_menu(self):
+        """Menu nastavení (vytvoří se při prvním použití)."""
+        if self._settings_menu is None:
+            from ui.settings_menu import SettingsMenu
+
+            self._settings_menu = SettingsMenu(self)
+        return self._settings_menu
+
+    # ------------------------------------------------------------------
+    @property
+    def score_menu(self):
+        """Menu výsledků (vytvoří se při prvním použití)."""
+        if self._score_menu is None:
+            from ui.score_menu import ScoreMenu
+
+            self._score_menu = ScoreMenu(self)
+        return self._score_menu
+
+    # ------------------------------------------------------------------
+    def _load_game_resources(self):
+        """Načte zvuky (a s PRELOAD_ASSETS i obrázky) před první hrou."""
+        if self.sounds is None:
+            self.sounds = self._load_sounds()
+        if PRELOAD_ASSETS:
+            assets.preload()
+
+    # ------------------------------------------------------------------
+    def _wait_for_events(self):
+        """
+        Uspí smyčku do příchodu události (nejdéle STATIC_SCREEN_TIMEOUT_MS).
+
+        Returns:
+            Seznam událostí ke zpracování
+        """
+        first = pygame.event.wait(STATIC_SCREEN_TIMEOUT_MS)
+        # Čekání se nesmí započítat do dt prvního herního snímku
+        self.clock.tick()
+        if first.type == pygame.NOEVENT:
+            return []
+        return [first] + pygame.event.get()
+
+    # ------------------------------------------------------------------
+    def advance(self, dt):
+        """
+        Posune simulaci o reálný čas dt v pevných krocích 1 / TICK_RATE.
+
+        Nespotřebovaný zbytek času se přenáší do dalšího snímku. Za jeden
+        snímek proběhne nejvýše MAX_CATCHUP_STEPS kroků; zbylé zpoždění se
+        zahodí, takže při přetížení se hra zpomalí, ale nezamrzne.
+
+        Args:
+            dt: Reálný čas od minulého snímku v sekundách
+
+        Returns:
+            Podíl (0-1) rozpracovaného kroku pro interpolaci vykreslení
+        """
+        tick = 1 / TICK_RATE
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= tick and self.state == "game":
+            if steps == MAX_CATCHUP_STEPS:
+                self.accumulator %= tick
+                break
+            # Kliknutí od minulého snímku se provedou v prvním kroku
+            self.step(tick, read_live_input(self.pending_shots))
+            self.pending_shots = 0
+            self.accumulator -= tick
+            steps += 1
+        return self.accumulator / tick
+
+    # ------------------------------------------------------------------
+    def step(self, dt, inputs=None):
+        """
+        Provede jeden krok simulace (vstupy, update, kolize) bez vykreslování.
+
+        Args:
+            dt: Délka kroku v sekundách
+            inputs: InputState se vstupy hráče (None = žádný vstup)
+
+        Returns:
+            True, pokud hra po kroku stále běží (nenastal game over)
+        """
+        if self.state != "game":
+            return False
+        if self.game_start_time is None:
+            self.begin_game()
+
+        self.inputs = inputs if inputs is not None else IDLE_INPUT
+        if self.recorder is not None:
+            self.recorder.record(dt, self.inputs)
+        for _ in range(int(self.inputs.shoot)):
+            self.player.shoot()
+
+        self.update(dt)
+        return self.state == "game"
+
+    # ------------------------------------------------------------------
+    def simulate(self, duration, dt=1 / FPS, policy=None):
+        """
+        Simuluje hru s pevným krokem co nejrychleji (bez čekání na FPS).
+
+        Args:
+            duration: Maximální simulovaný čas v sekundách
+            dt: Délka jednoho kroku v sekundách
+            policy: Funkce policy(game) -> InputState volaná každý krok
+                (None = hráč stojí a nestřílí)
+
+        Returns:
+            Počet provedených kroků
+        """
+        if self.state == "game" and self.game_start_time is None:
+            self.begin_game()  # Policy už v prvním kroku vidí novou hru
+        steps = 0
+        max_steps = int(duration / dt)
+        while steps < max_steps:
+            inputs = policy(self) if policy is not None else None
+            steps += 1
+            if not self.step(dt, inputs):
+                break
+        return steps
+
+    # ------------------------------------------------------------------
+    def start_simulation(self, player_name="Bot", difficulty=None, seed=None):
+        """
+        Přepne hru rovnou do stavu "game" bez menu a zadávání jména.
+
+        Args:
+            player_name: Jméno hráče pro výsledek
+            difficulty: Název obtížnosti (None = ponechat aktuální)
+            seed: Seed generátoru náhodných čísel (None = ponechat Game.seed)
+        """
+        if difficulty is not None:
+            self.set_difficulty(difficulty)
+        if seed is not None:
+            self.seed = seed
+        self.player_name = player_name
+        self.waiting_for_name = False
+        self.game_start_time = None
+        self.game_start_datetime = None
+        self.state = "game"
+
+    # ------------------------------------------------------------------
+    def begin_game(self):
+        """Zaznamená čas startu, nastaví seed a připraví novou hru."""
+        # Herní čas se počítá od nuly jako součet dt - stejně při hraní i replayi
+        self.sim_ticks = 0.0
+        self.accumulator = 0.0
+        self.quality.reset()
+        self.game_start_time = self.get_ticks()
+        self.game_start_datetime = datetime.now().isoformat()
+
+        self.current_seed = self.seed if self.seed is not None else random.getrandbits(63)
+        self.rng.seed(self.current_seed)
+        self.reset_game()
+
+        if RECORD_REPLAYS and not self.headless:
+            self._start_recording()
+
+    # ------------------------------------------------------------------
+    def _start_recording(self):
+        """Začne nahrávat vstupy hry do souboru v adresáři replays/."""
+        from systems.replay import InputRecorder, REPLAYS_DIR
+
+        self._stop_recording()
+        stamp = self.game_start_datetime.replace(":", "-")
+        self.recorder = InputRecorder(
+            REPLAYS_DIR / f"{stamp}.replay",
+            self.current_seed,
+            self.difficulties[self.difficulty_index],
+            self.player_name or "Anon",
+            self.config,
+        )
 
     # ------------------------------------------------------------------
-    def handle_events(self):
+    def _stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    # ------------------------------------------------------------------
+    def spawn_interval(self):
+        """
+        Vrátí aktuální interval spawnu nepřátel v sekundách.
+
+        Při přetížení ho regulátor kvality prodlouží. Nahrávaná hra používá
+        vždy konfigurovaný interval, aby šla přesně přehrát.
+        """
+        interval = self.config.spawn_interval
+        if self.recorder is None:
+            interval *= self.quality.spawn_multiplier
+        return interval
+
+    # ------------------------------------------------------------------
+    def get_ticks(self):
+        """Vrátí herní čas v ms (součet dt všech kroků od startu hry)."""
+        return int(self.sim_ticks)
+
+    # ------------------------------------------------------------------
+    def handle_events(self, events=None):
         """
         Zpracovává uživatelské vstupy a pygame eventy.
         
+        Args:
+            events: Seznam událostí (None = načíst z pygame.event.get())
+
         Kontroluje:
         - QUIT event pro ukončení hry
         - Kliknutí myši pro střelbu
         """
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             # Zavření okna
             if event.type == pygame.QUIT:
                 self.running = False
@@ -146,9 +493,13 @@ class Game:
                 self.score_menu.handle_event(event)
 
             elif self.state == "game":
-                # Střelba na kliknutí myši
+                # Střelba na kliknutí myši (provede se v příštím kroku)
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.player.shoot()
+                    self.pending_shots += 1
+                # F3 přepíná profiler a jeho overlay
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                    self.profiler_summary = None
 
             elif self.state == "game_over":
                 if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_ESCAPE):
@@ -171,113 +522,252 @@ class Game:
         - Update spawn systému
         - Detekci a zpracování kolizí
         """
+        self.sim_ticks += dt * 1000
+        if self.interpolate:
+            self._save_previous_positions()
+
         # Aktualizace všech entit
-        self.all_sprites.update(dt)
+        if self.enemy_store is not None:
+            # Nepřátele posune úložiště jedním dávkovým krokem
+            self.player.update(dt)
+            self.bullets.update(dt)
+            self.enemy_store.step(self.player.pos, dt)
+        else:
+            self.all_sprites.update(dt)
+        self.profiler.lap("update")
         self.spawner.update(dt)
+        self.profiler.lap("spawner")
+
+        # Detekce kolize nepřátel s hráčem (game over)
+        collided = self.handle_collisions()
+        self.profiler.lap("collisions")
+        if collided:
+            self.game_over()
+
+    # ------------------------------------------------------------------
+    def _save_previous_positions(self):
+        """Uloží pozice entit před krokem (nepřátelé v úložišti si je drží sami)."""
+        if self.enemy_store is not None:
+            self.player.prev_pos.update(self.player.pos)
+            sprites = self.bullets
+        else:
+            sprites = self.all_sprites
+        for sprite in sprites:
+            sprite.prev_pos.update(sprite.pos)
 
-        # Detekce kolizí projektilů s nepřáteli
-        for bullet in self.bullets:
-            hits = pygame.sprite.spritecollide(bullet, self.enemies, True)
-            if hits:
-                bullet.kill()  # Zničení projektilu
-                self.score += len(hits)  # Přičtení bodů za každého zabitého nepřítele
-                self.play_sound("hit")
+    # ------------------------------------------------------------------
+    def handle_collisions(self):
+        """
+        Detekuje a zpracuje kolize pomocí prostorového hashe nepřátel.
+
+        Returns:
+            True, pokud se hráč srazil s nepřítelem (game over)
+        """
+        # Sestavení prostorového hashe z aktuálních pozic nepřátel
+        self._build_enemy_grid()
+
+        # Detekce kolizí projektilů s nepřáteli - všechny projektily najednou
+        kills, consumed = resolve_hits(self._bullet_hits())
+        for enemy in kills:
+            enemy.kill()
+        for bullet in consumed:
+            bullet.kill()  # Zničení projektilu
+            self.play_sound("hit")
+        self.score += len(kills)  # Přičtení bodů za každého zabitého nepřítele
 
         # Detekce kolizí nepřítel-nepřítel (bez self-kolize)
-        # Použijeme párové porovnání rectů a odstraníme kolidující jedince
-        enemies_list = list(self.enemies)
-        to_remove = set()
-        for i in range(len(enemies_list)):
-            a = enemies_list[i]
-            for j in range(i + 1, len(enemies_list)):
-                b = enemies_list[j]
-                if a.rect.colliderect(b.rect):
-                    to_remove.add(a)
-                    to_remove.add(b)
+        # Porovnáváme jen páry sdílející buňku hashe a odstraníme kolidující jedince;
+        # nepřátelé zničení projektily už v hashi nekolidují
+        to_remove = self.enemy_grid.colliding(exclude=kills)
         if to_remove:
             for e in to_remove:
                 e.kill()
             self.score += len(to_remove)
 
-        # Detekce kolize nepřátel s hráčem (game over)
-        if pygame.sprite.spritecollide(self.player, self.enemies, False):
-            accuracy = int((self.score / self.shoots * 100) if self.shoots > 0 else 0)
-            difficulty = self.difficulties[self.difficulty_index]
-            
-            # Vypočti dobu hraní v milisekundách
-            game_duration_ms = pygame.time.get_ticks() - self.game_start_time if self.game_start_time else 0
-            
-            # Ulož výsledek do žebříčku
-            save_result(
-                difficulty,
-                self.player_name or "Anon",
-                self.score,
-                self.shoots,
-                accuracy,
-                game_duration_ms,
-                self.game_start_datetime or datetime.now().isoformat(),
+        # Kolize nepřátel s hráčem
+        return any(e.alive() for e in self.enemy_grid.query(self.player.rect))
+
+    # ------------------------------------------------------------------
+    def _bullet_hits(self):
+        """
+        Vrátí dvojice (projektil, zasažení nepřátelé) pro tento krok.
+
+        V režimu "swept" se testuje celá dráha všech projektilů od prev_pos
+        do pos jedním dávkovým dotazem, jinak jen jejich koncový rect.
+        """
+        if BULLET_COLLISION != "swept":
+            return [(bullet, self.enemy_grid.query(bullet.rect)) for bullet in self.bullets]
+        return self.enemy_grid.sweep(
+            (
+                bullet, bullet.prev_pos.x, bullet.prev_pos.y, bullet.pos.x, bullet.pos.y,
+                bullet.rect.width / 2, bullet.rect.height / 2,
             )
-            
-            self.last_result = {
-                "name": self.player_name or "Anon",
-                "score": self.score,
-                "shoots": self.shoots,
-                "accuracy": accuracy,
-                "difficulty": difficulty,
-                "game_duration_ms": game_duration_ms,
-            }
-            self.state = "game_over"
+            for bullet in self.bullets
+        )
 
     # ------------------------------------------------------------------
-    def draw(self):
+    def _build_enemy_grid(self):
+        """Sestaví hash nepřátel ze sprite skupiny nebo z polí úložiště."""
+        if self.enemy_store is None:
+            self.enemy_grid.build(self.enemies)
+            return
+        lefts, tops, rights, bottoms = self.enemy_store.bounds()
+        self.enemy_grid.build_from_bounds(
+            list(self.enemy_store.sprites),
+            lefts.tolist(), tops.tolist(), rights.tolist(), bottoms.tolist(),
+        )
+
+    # ------------------------------------------------------------------
+    def game_over(self):
+        """Uloží výsledek do žebříčku a přepne hru do stavu game over."""
+        result = self.current_result()
+
+        # Ulož výsledek do žebříčku (na pozadí, bez zdržení snímku)
+        if self.persist_results:
+            self.result_writer.submit(
+                result["difficulty"],
+                result["name"],
+                result["score"],
+                result["shoots"],
+                result["accuracy"],
+                result["game_duration_ms"],
+                result["game_start_datetime"],
+            )
+
+        self.last_result = result
+        self.state = "game_over"
+        self._stop_recording()
+
+    # ------------------------------------------------------------------
+    def current_result(self):
+        """
+        Vrátí výsledek aktuální hry jako slovník.
+
+        Obsahuje pole záznamu žebříčku (viz build_result) a navíc obtížnost.
+        """
+        from systems.leaderboard import build_result
+
+        accuracy = int((self.score / self.shoots * 100) if self.shoots > 0 else 0)
+        
+        # Vypočti dobu hraní v milisekundách
+        game_duration_ms = self.get_ticks() - self.game_start_time if self.game_start_time is not None else 0
+
+        result = build_result(
+            self.player_name or "Anon",
+            self.score,
+            self.shoots,
+            accuracy,
+            game_duration_ms,
+            self.game_start_datetime or datetime.now().isoformat(),
+        )
+        result["difficulty"] = self.difficulties[self.difficulty_index]
+        return result
+
+    # ------------------------------------------------------------------
+    def draw(self, alpha=1.0):
         """
         Vykresluje všechny herní objekty na obrazovku.
+
+        Args:
+            alpha: Podíl (0-1) mezi předposledním a posledním krokem
+                simulace, ve kterém se entity vykreslí (interpolace)
         
         Postup:
         1. Vyplní pozadí tmavou barvou
         2. Vykreslí všechny sprite objekty
         3. Vykreslí HUD (skóre)
         4. Aktualizuje display
+
+        S RENDER_MODE = "dirty" překreslí a aktualizuje jen změněné oblasti.
         """
+        # Pozice nepřátel z úložiště (rect jen u viditelných)
+        if self.enemy_store is not None:
+            self.enemy_store.sync_rects(self.screen.get_rect(), alpha)
+
+        # Rect entit na interpolované pozice (po vykreslení se vrátí zpět)
+        interpolated = self.interpolate and alpha < 1.0
+        if interpolated:
+            self._place_rects(alpha)
+
+        # Překreslení jen změněných oblastí, pokud je zapnutý dirty renderer
+        if self.renderer is not None:
+            self.renderer.render(self.screen, self.all_sprites, self.draw_overlay, self.profiler)
+        else:
+            self._draw_full()
+
+        if interpolated:
+            self._place_rects(1.0)
+
+    # ------------------------------------------------------------------
+    def _place_rects(self, alpha):
+        """Umístí rect entit mezi prev_pos a pos podle alpha (1.0 = aktuální pozice)."""
+        sprites = self.all_sprites if self.enemy_store is None else [self.player, *self.bullets]
+        for sprite in sprites:
+            if alpha >= 1.0:
+                sprite.rect.center = sprite.pos
+            else:
+                sprite.rect.center = sprite.prev_pos.lerp(sprite.pos, alpha)
+
+    # ------------------------------------------------------------------
+    def _draw_full(self):
+        """Vyplní celou obrazovku, vykreslí scénu a HUD a zavolá flip()."""
         # Vyplnění pozadí tmavě šedou barvou
         self.screen.fill((30, 30, 30))
         
         # Vykreslení všech sprite objektů
         self.all_sprites.draw(self.screen)
 
+        # Vykreslení munice a HUD
+        self.draw_overlay()
+        self.profiler.lap("draw")
+
+        # Aktualizace obrazovky
+        if not self.headless:
+            pygame.display.flip()
+        self.profiler.lap("flip")
+
+    # ------------------------------------------------------------------
+    def draw_overlay(self):
+        """
+        Vykreslí texty nad herní scénou (munice pod hráčem a HUD).
+
+        Returns:
+            Seznam Rect oblastí, do kterých se kreslilo
+        """
+        rects = []
+
         # Zobrazení zbývající munice pod hráčem (barevně podle stavu)
         if hasattr(self, "shots_left"):
-            font = pygame.font.SysFont(None, 20)
-            # Barvy: >5 = bílá, 3-5 = žlutá, <=2 = červená
-            if self.shots_left <= 2:
-                color = (255, 80, 80)
-            elif self.shots_left <= 5:
-                color = (255, 210, 80)
-            else:
-                color = (255, 255, 255)
-            ammo_text = font.render(str(self.shots_left), True, color)
+            ammo_text = self.hud.label("ammo_small", self.shots_left)
             px = self.player.rect.centerx
             py = self.player.rect.bottom + 8
-            self.screen.blit(ammo_text, ammo_text.get_rect(center=(px, py)))
+            rects.append(self.screen.blit(ammo_text, ammo_text.get_rect(center=(px, py))))
 
         # Vykreslení uživatelského rozhraní
-        self.draw_hud()
+        rects.extend(self.draw_hud())
 
-        # Aktualizace obrazovky
-        pygame.display.flip()            
+        # Percentily fází snímku pod HUD (přepočet nejvýše 2x za sekundu)
+        if self.profiler.enabled:
+            now = time.perf_counter()
+            if self.profiler_summary is None or now >= self.profiler_refresh:
+                self.profiler_summary = self.profiler.summary()
+                self.profiler_refresh = now + 0.5
+            rects.extend(draw_profiler(self.screen, self.profiler_summary))
+        return rects
 
     # ------------------------------------------------------------------
     def draw_hud(self):
         elapsed = 0
         if self.game_start_time is not None:
-            elapsed = int((pygame.time.get_ticks() - self.game_start_time) / 1000)
-        draw_hud(
+            elapsed = int((self.get_ticks() - self.game_start_time) / 1000)
+        return draw_hud(
             self.screen,
             score=self.score,
             time_value=elapsed,
             shoots=self.shoots,
             accuracy=int((self.score / self.shoots * 100) if self.shoots > 0 else 0),
             shots_left=self.shots_left,
+            hud=self.hud,
         )
     
     # ------------------------------------------------------------------
@@ -285,15 +775,20 @@ class Game:
         """
         Resetuje hru do počátečního stavu.
         
-        Vyčistí všechny sprite skupiny a vytvoří nové objekty.
+        Vyčistí všechny skupiny entit a vytvoří nové objekty.
         """
-        # Vyčištění všech sprite skupin
+        from entities.player import Player
+        from systems.spawner import Spawner
+
+        # Vyčištění všech skupin entit
         self.all_sprites.empty()
         self.enemies.empty()
         self.bullets.empty()
+        if self.enemy_store is not None:
+            self.enemy_store.clear()
         
         # Vytvoření nového hráče
-        self.player = Player(self, (WIDTH // 2, HEIGHT // 2))
+        self.player = Player(self, (self.config.width // 2, self.config.height // 2))
         self.all_sprites.add(self.player)
         
         # Reset spawneru
@@ -307,6 +802,7 @@ class Game:
     # ------------------------------------------------------------------
     def start_new_game(self):
         """Přechod na zadávání jména a následně na hru."""
+        self._load_game_resources()
         self.player_name = ""
         self.waiting_for_name = True
         # Resetovat čas startu, aby nová hra měřila od začátku
@@ -318,7 +814,7 @@ class Game:
     def get_enemy_size(self):
         """Vrátí velikost nepřítele podle aktuální obtížnosti."""
         difficulty = self.difficulties[self.difficulty_index]
-        return ENEMY_SIZE_BY_DIFFICULTY.get(difficulty, (30, 30))
+        return self.config.enemy_sizes.get(difficulty, (30, 30))
 
     # ------------------------------------------------------------------
     def set_difficulty(self, name):
@@ -333,7 +829,7 @@ class Game:
 
     # ------------------------------------------------------------------
     def play_sound(self, name):
-        if not self.sound_on:
+        if not self.sound_on or not self.sounds:
             return
 
         sound = self.sounds.get(name)
@@ -342,18 +838,17 @@ class Game:
 
     # ------------------------------------------------------------------
     def _load_sounds(self):
+        # Zvukové zařízení se otevírá až tady, ne při startu programu
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init()
+            except pygame.error:
+                return {}
         return {
-            "shoot": self._safe_load_sound("assets/sounds/ding.wav"),
-            "hit": self._safe_load_sound("assets/sounds/chord.wav"),
+            "shoot": assets.load_sound("sounds/ding.wav"),
+            "hit": assets.load_sound("sounds/chord.wav"),
         }
 
-    # ------------------------------------------------------------------
-    def _safe_load_sound(self, path):
-        try:
-            return pygame.mixer.Sound(path)
-        except pygame.error:
-            return None
-
     def _handle_name_event(self, event):
         if event.type != pygame.KEYDOWN:
             return
@@ -376,16 +871,24 @@ class Game:
             self.player_name += event.unicode
 
     # ------------------------------------------------------------------
-    def draw_name_entry(self):
-        draw_input_panel(
-            self.screen,
-            "Zadejte jméno hráče",
-            self.player_name or "_",
-            "Enter pro potvrzení, Backspace smaže",
-        )
+    def draw_name_entry(self, force=False):
+        def render(surface):
+            draw_input_panel(
+                surface,
+                "Zadejte jméno hráče",
+                self.player_name or "_",
+                "Enter pro potvrzení, Backspace smaže",
+            )
+
+        return self.name_entry_cache.draw(self.screen, (self.player_name,), render, force)
+
+    # ------------------------------------------------------------------
+    def draw_game_over(self, force=False):
+        key = tuple(sorted(self.last_result.items())) if self.last_result else None
+        return self.game_over_cache.draw(self.screen, key, self._render_game_over, force)
 
     # ------------------------------------------------------------------
-    def draw_game_over(self):
+    def _render_game_over(self, surface):
         name = self.last_result.get("name") if self.last_result else ""  # type: ignore[attr-defined]
         score = self.last_result.get("score", 0) if self.last_result else 0
         acc = self.last_result.get("accuracy", 0) if self.last_result else 0
@@ -402,4 +905,4 @@ class Game:
             f"Úspěšnost: {acc}%",
             f"Obtížnost: {difficulty}",
         ]
-        draw_panel(self.screen, "Konec hry", lines, "Enter nebo ESC pro návrat do menu")
\ No newline at end of file
+        draw_panel(surface, "Konec hry", lines, "Enter nebo ESC pro návrat do menu")
\ No newline at end of file
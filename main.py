@@ -1,19 +1,60 @@
 """
 Hlavní vstupní bod aplikace Arena Survival.
 
-Tento skript inicializuje pygame, spouští herní smyčku a po ukončení
-hry provádí úklid pygame.
+Tento skript načte konfiguraci (soubor a parametry příkazové řádky),
+inicializuje pygame, spouští herní smyčku a po ukončení hry provádí
+úklid pygame.
+
+Příklad:
+    python main.py --width 1920 --height 1080 --spawn-interval 0.5 --adaptive
+    python main.py --config arena.json
+    python main.py --leaderboard-server 192.168.1.10:8765
+    python main.py --measure-startup
 """
 
+import time
+
+# Okamžik spuštění - pro měření doby do prvního snímku (před importem pygame)
+STARTED_AT = time.perf_counter()
+
+import argparse
+import sys
+
 import pygame
 from game import Game
+from settings import STARTUP_TARGET_MS
+from systems.config import add_arguments, load_config
 
 if __name__ == "__main__":
-    # Inicializace všech pygame modulů
-    pygame.init()
-    
+    # Konfigurace: výchozí hodnoty <- soubor --config <- parametry
+    parser = argparse.ArgumentParser(description="Arena Survival")
+    add_arguments(parser)
+    parser.add_argument(
+        "--measure-startup",
+        action="store_true",
+        help="vypsat dobu do prvního snímku a skončit (kód 1 při překročení cíle)",
+    )
+    args = parser.parse_args()
+    try:
+        config = load_config(args.config, args)
+        if config.leaderboard_server:
+            from systems import leaderboard
+
+            leaderboard.use_server(config.leaderboard_server)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    # Inicializace jen modulů potřebných pro menu; zvuk se otevře se startem hry
+    pygame.display.init()
+    pygame.font.init()
+
     # Vytvoření instance hry a spuštění hlavní herní smyčky
-    Game().run()
-    
+    game = Game(config=config, started_at=STARTED_AT)
+    game.run(exit_after_first_frame=args.measure_startup)
+
     # Ukončení pygame a uvolnění zdrojů
     pygame.quit()
+
+    if args.measure_startup:
+        print(f"První snímek: {game.first_frame_ms:.1f} ms (cíl {STARTUP_TARGET_MS} ms)")
+        sys.exit(0 if game.first_frame_ms <= STARTUP_TARGET_MS else 1)
@@ -23,6 +23,55 @@ MAX_SHOOTS = 20      # Maximální počet střel na hru
 BULLET_LIFETIME = .5   # Doba života projektilu v sekundách
 SPAWN_INTERVAL = 2.0    # Interval pro spawn nepřátel v sekundách
 
+# Velikost buňky prostorového hashe pro detekci kolizí (v pixelech)
+COLLISION_CELL_SIZE = 64
+
+# Kolize projektilů: "swept" = celá dráha za krok (rychlý projektil nepřeskočí
+# malého nepřítele), "discrete" = jen koncová pozice
+BULLET_COLLISION = "swept"
+
+# Paměťový rozpočet cache vykreslených textů UI (v bajtech)
+TEXT_CACHE_BUDGET = 4 * 1024 * 1024
+
+# Způsob vykreslování herní scény:
+# "full" = celá obrazovka + flip() každý snímek, "dirty" = jen změněné oblasti
+RENDER_MODE = "full"
+
+# Nejdelší čekání na událost na statické obrazovce (menu) v ms
+STATIC_SCREEN_TIMEOUT_MS = 500
+
+# Načíst všechny obrázky a zvuky při spuštění první hry (False = až při prvním použití)
+PRELOAD_ASSETS = True
+
+# Cílová doba od spuštění do prvního vykresleného snímku menu (ms)
+STARTUP_TARGET_MS = 500
+
+# Nahrávat vstupy každé hry do adresáře replays/ (pro přehrání a profilování)
+RECORD_REPLAYS = False
+
+# Profiler fází snímku (klávesa F3 ve hře přepíná měření a overlay)
+PROFILER_ENABLED = False
+PROFILER_WINDOW = 600           # Počet posledních snímků pro percentily
+PROFILER_DUMP_PATH = None       # Např. "profile.csv" / "profile.json" - zápis při ukončení
+
+# Simulace běží s pevným krokem nezávisle na FPS vykreslování:
+# TICK_RATE kroků za sekundu, nejvýše MAX_CATCHUP_STEPS kroků na jeden snímek
+# (při přetížení se zahodí zbytek zpoždění a hra se zpomalí, místo aby zamrzla)
+TICK_RATE = 120
+MAX_CATCHUP_STEPS = 5
+RENDER_INTERPOLATION = True     # Vykreslovat pozice interpolované mezi kroky
+
+# Při přetížení snižovat spawn nepřátel a vykreslovat jen část snímků
+# (lze přepnout i konfigurací / parametrem --adaptive, viz systems/config.py)
+ADAPTIVE_QUALITY = False
+
+# Sdílený žebříček: adresa serveru "host:port" (python -m systems.leaderboard_server),
+# None = každá hra ukládá do vlastní databáze v leaderboards/
+LEADERBOARD_SERVER = None
+
+# Dávkový pohyb nepřátel ve vektorovém úložišti (vyžaduje NumPy)
+USE_ENTITY_STORE = False
+
 # Obtížnost a velikosti nepřátel
 DIFFICULTY_LEVELS = ["Lama", "Machr", "Superman"]
 ENEMY_SIZE_BY_DIFFICULTY = {
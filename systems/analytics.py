@@ -0,0 +1,506 @@
+"""
+Proudová analýza historie výsledků (statistiky hráčů a obtížností).
+
+Výsledky se čtou po jednom (nebo po blocích) z libovolného zdroje -
+JSON žebříčků, JSON Lines z batch.py, databáze SQLite nebo binárního
+archivu - a započítávají se do průběžných součtů a histogramů. Paměť
+tak nezávisí na počtu výsledků, takže lze zpracovat i historii o velikosti
+několika GB. S daty roste jen přehled po hráčích (záznam na jméno);
+s `track_players=False` se nepočítá a paměť je konstantní.
+
+Počítá se pro každou obtížnost z DIFFICULTIES i celkem ("all"):
+- počet her a průměrná doba hraní
+- nejlepší a průměrná doba hraní každého hráče (volitelně)
+- histogram a percentily přesnosti (přesně, přesnost je 0-100 %)
+- percentily doby hraní (z histogramu s krokem DURATION_BUCKET_MS)
+
+S nainstalovaným NumPy se výsledky zpracovávají vektorově po blocích
+(CHUNK_SIZE výsledků), z archivu přímo nad jeho binárními záznamy.
+
+Použití:
+    stats = analyze(iter_jsonl_results("results.jsonl"))
+    stats = analyze_archive()
+    summary = stats.summary()
+"""
+
+import json
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+from systems.leaderboard import DIFFICULTIES, LEADERBOARDS_DIR, get_database_path
+
+try:
+    import numpy as np
+except ImportError:  # NumPy není nainstalované
+    np = None
+
+PERCENTILES = (50, 95, 99)
+DURATION_BUCKET_MS = 100   # Rozlišení percentilů doby hraní
+ACCURACY_BIN = 10          # Šířka sloupce histogramu přesnosti v %
+CHUNK_SIZE = 8192          # Výsledků v jednom bloku pro NumPy
+READ_SIZE = 1 << 20        # Kolik znaků JSON souboru se čte najednou
+
+ALL = "all"
+
+# Mezery a čárky mezi prvky JSON pole
+_SEPARATOR = re.compile(r"[\s,]*")
+# Token useknutý koncem bloku: neukončený řetězec, \u escape nebo literál/číslo
+_TRUNCATED_TAIL = re.compile(r'"(?:[^"\\]|\\.)*\\?\Z|\\u[0-9a-fA-F]{0,3}\Z|[\w.+-]+\Z', re.DOTALL)
+
+
+def is_available():
+    """Vrátí True, pokud je k dispozici NumPy pro vektorové zpracování."""
+    return np is not None
+
+
+def _percentile_rank(p, total):
+    # Stejná volba prvku jako FrameProfiler.percentiles
+    return min(total - 1, p * total // 100)
+
+
+class DifficultyStats:
+    """
+    Průběžné statistiky jedné obtížnosti (nebo všech dohromady).
+
+    Attributes:
+        games: Počet započítaných her
+        total_ms: Součet doby hraní v ms
+        accuracy_counts: Počet her pro každou přesnost 0-100 %
+        duration_buckets: Slovník index koše -> počet her
+            (koš i = doba i * DURATION_BUCKET_MS až o krok víc)
+        players: Slovník jméno -> [počet her, nejlepší doba, součet doby]
+            (None = statistiky hráčů se nepočítají)
+    """
+
+    def __init__(self, track_players=True):
+        """
+        Inicializuje prázdné statistiky.
+
+        Args:
+            track_players: Počítat statistiky jednotlivých hráčů
+        """
+        self.games = 0
+        self.total_ms = 0
+        self.accuracy_counts = [0] * 101
+        self.duration_buckets = {}
+        self.players = {} if track_players else None
+
+    def add(self, name, duration, accuracy):
+        """
+        Započítá jeden výsledek.
+
+        Args:
+            name: Jméno hráče
+            duration: Doba hraní v ms
+            accuracy: Přesnost v % (ořízne se na 0-100)
+        """
+        self.games += 1
+        self.total_ms += duration
+        self.accuracy_counts[min(100, max(0, accuracy))] += 1
+        bucket = duration // DURATION_BUCKET_MS
+        self.duration_buckets[bucket] = self.duration_buckets.get(bucket, 0) + 1
+        if self.players is None:
+            return
+        player = self.players.get(name)
+        if player is None:
+            self.players[name] = [1, duration, duration]
+        else:
+            player[0] += 1
+            if duration > player[1]:
+                player[1] = duration
+            player[2] += duration
+
+    def add_arrays(self, names, durations, accuracies):
+        """
+        Započítá blok výsledků najednou (vyžaduje NumPy).
+
+        Args:
+            names: ndarray jmen (str, nebo UTF-8 bytes z archivu)
+            durations: ndarray dob hraní v ms
+            accuracies: ndarray přesností v %
+        """
+        if len(durations) == 0:
+            return
+        durations = np.asarray(durations, dtype=np.int64)
+        accuracies = np.clip(np.asarray(accuracies, dtype=np.int64), 0, 100)
+        self.games += len(durations)
+        self.total_ms += int(durations.sum())
+
+        counts = np.bincount(accuracies, minlength=101)
+        for accuracy in np.flatnonzero(counts).tolist():
+            self.accuracy_counts[accuracy] += int(counts[accuracy])
+
+        buckets, bucket_counts = np.unique(durations // DURATION_BUCKET_MS, return_counts=True)
+        duration_buckets = self.duration_buckets
+        for bucket, count in zip(buckets.tolist(), bucket_counts.tolist()):
+            duration_buckets[bucket] = duration_buckets.get(bucket, 0) + count
+
+        if self.players is None:
+            return
+        # Součty po hráčích: jedno seřazení jmen na blok místo smyčky po výsledcích
+        unique, inverse = np.unique(names, return_inverse=True)
+        games = np.bincount(inverse)
+        totals = np.zeros(len(unique), dtype=np.int64)
+        np.add.at(totals, inverse, durations)
+        best = np.zeros(len(unique), dtype=np.int64)
+        np.maximum.at(best, inverse, durations)
+        for name, count, top, total in zip(unique.tolist(), games.tolist(), best.tolist(), totals.tolist()):
+            if isinstance(name, bytes):
+                name = name.decode("utf-8", "ignore")
+            player = self.players.get(name)
+            if player is None:
+                self.players[name] = [count, top, total]
+            else:
+                player[0] += count
+                if top > player[1]:
+                    player[1] = top
+                player[2] += total
+
+    def merge(self, other):
+        """Přičte statistiky jiného objektu (např. z jiného procesu)."""
+        self.games += other.games
+        self.total_ms += other.total_ms
+        for accuracy, count in enumerate(other.accuracy_counts):
+            self.accuracy_counts[accuracy] += count
+        for bucket, count in other.duration_buckets.items():
+            self.duration_buckets[bucket] = self.duration_buckets.get(bucket, 0) + count
+        if self.players is None or other.players is None:
+            return
+        for name, (count, top, total) in other.players.items():
+            player = self.players.get(name)
+            if player is None:
+                self.players[name] = [count, top, total]
+            else:
+                player[0] += count
+                player[1] = max(player[1], top)
+                player[2] += total
+
+    # ------------------------------------------------------------------
+    def accuracy_histogram(self, bin_width=ACCURACY_BIN):
+        """
+        Vrátí histogram přesnosti.
+
+        Returns:
+            Seznam (dolní mez v %, počet her); 100 % má vlastní sloupec
+        """
+        histogram = [[start, 0] for start in range(0, 101, bin_width)]
+        for accuracy, count in enumerate(self.accuracy_counts):
+            histogram[accuracy // bin_width][1] += count
+        return [tuple(column) for column in histogram]
+
+    def accuracy_percentiles(self):
+        """Vrátí slovník {"p50": %, ...} přesnosti (0, pokud nejsou data)."""
+        result = {}
+        for p in PERCENTILES:
+            value = 0
+            if self.games:
+                rank = _percentile_rank(p, self.games)
+                seen = 0
+                for value, count in enumerate(self.accuracy_counts):
+                    seen += count
+                    if seen > rank:
+                        break
+            result[f"p{p}"] = value
+        return result
+
+    def duration_percentiles(self):
+        """
+        Vrátí slovník {"p50": ms, ...} doby hraní (0, pokud nejsou data).
+
+        Hodnota je dolní mez koše, výsledek je tedy přesný
+        na DURATION_BUCKET_MS.
+        """
+        result = {}
+        buckets = sorted(self.duration_buckets.items())
+        for p in PERCENTILES:
+            value = 0
+            if self.games:
+                rank = _percentile_rank(p, self.games)
+                seen = 0
+                for bucket, count in buckets:
+                    seen += count
+                    if seen > rank:
+                        value = bucket * DURATION_BUCKET_MS
+                        break
+            result[f"p{p}"] = value
+        return result
+
+    def player_summary(self):
+        """
+        Vrátí slovník jméno -> {"games", "best_duration_ms", "mean_duration_ms"}.
+
+        Returns:
+            Slovník, nebo None (statistiky hráčů se nepočítají)
+        """
+        if self.players is None:
+            return None
+        return {
+            name: {
+                "games": count,
+                "best_duration_ms": top,
+                "mean_duration_ms": round(total / count, 1),
+            }
+            for name, (count, top, total) in self.players.items()
+        }
+
+    def summary(self):
+        """Vrátí všechny statistiky jako slovník (serializovatelný do JSON)."""
+        return {
+            "games": self.games,
+            "mean_duration_ms": round(self.total_ms / self.games, 1) if self.games else 0,
+            "duration_percentiles_ms": self.duration_percentiles(),
+            "accuracy_percentiles": self.accuracy_percentiles(),
+            "accuracy_histogram": self.accuracy_histogram(),
+            "players": self.player_summary(),
+        }
+
+
+class ResultStats:
+    """
+    Statistiky výsledků po obtížnostech a celkem.
+
+    Attributes:
+        difficulties: Slovník obtížnost -> DifficultyStats (klíč ALL = všechny)
+        track_players: Počítat statistiky jednotlivých hráčů
+    """
+
+    def __init__(self, track_players=True):
+        """Inicializuje prázdné statistiky pro všechny obtížnosti."""
+        self.track_players = track_players
+        self.difficulties = {
+            difficulty: DifficultyStats(track_players) for difficulty in DIFFICULTIES
+        }
+        self.difficulties[ALL] = DifficultyStats(track_players)
+        self._names = {difficulty.lower(): difficulty for difficulty in DIFFICULTIES}
+
+    def __getitem__(self, difficulty):
+        if difficulty == ALL:
+            return self.difficulties[ALL]
+        return self.difficulties[self._canonical(difficulty)]
+
+    def _canonical(self, difficulty):
+        """Název obtížnosti ve tvaru z DIFFICULTIES (databáze ukládá malými písmeny)."""
+        name = self._names.get(difficulty.lower())
+        if name is None:
+            # Obtížnost mimo DIFFICULTIES (např. ze starší verze hry)
+            name = self._names[difficulty.lower()] = difficulty
+            self.difficulties[name] = DifficultyStats(self.track_players)
+        return name
+
+    def add(self, result):
+        """
+        Započítá jeden výsledek.
+
+        Args:
+            result: Slovník ve formátu žebříčku s klíčem "difficulty"
+        """
+        name = result.get("name", "?")
+        duration = result.get("game_duration_ms", 0)
+        accuracy = result.get("accuracy", 0)
+        self.difficulties[self._canonical(result["difficulty"])].add(name, duration, accuracy)
+        self.difficulties[ALL].add(name, duration, accuracy)
+
+    def add_arrays(self, difficulty, names, durations, accuracies):
+        """Započítá blok výsledků jedné obtížnosti (viz DifficultyStats.add_arrays)."""
+        self.difficulties[self._canonical(difficulty)].add_arrays(names, durations, accuracies)
+        self.difficulties[ALL].add_arrays(names, durations, accuracies)
+
+    def merge(self, other):
+        """Přičte statistiky jiného ResultStats."""
+        for difficulty, stats in other.difficulties.items():
+            if difficulty != ALL:
+                difficulty = self._canonical(difficulty)
+            self.difficulties[difficulty].merge(stats)
+
+    def summary(self):
+        """Vrátí slovník obtížnost -> DifficultyStats.summary()."""
+        return {difficulty: stats.summary() for difficulty, stats in self.difficulties.items()}
+
+
+# ----------------------------------------------------------------------
+# Zdroje výsledků (generátory, čtou po částech)
+
+def _is_truncated(buffer, error) -> bool:
+    """Vrátí True, pokud chyba dekódování vznikla jen useknutím bufferu."""
+    return error.pos >= len(buffer) - 1 or _TRUNCATED_TAIL.match(buffer, error.pos) is not None
+
+
+def iter_json_results(path, difficulty=None, read_size=READ_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Proudově čte JSON pole výsledků (formát leaderboards/<obtížnost>.json).
+
+    Soubor se čte po read_size znacích a prvky pole se dekódují
+    jednotlivě, celé pole se nikdy nenačte.
+
+    Args:
+        path: Cesta k JSON souboru
+        difficulty: Hodnota klíče "difficulty" doplněná do výsledků (None = nedoplňovat)
+
+    Raises:
+        ValueError: Soubor neobsahuje platné JSON pole
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = f.read(read_size).lstrip()
+        if not buffer.startswith("["):
+            raise ValueError(f"{path} neobsahuje JSON pole výsledků")
+        pos = 1
+        while True:
+            pos = _SEPARATOR.match(buffer, pos).end()
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+            try:
+                if pos == len(buffer):
+                    raise json.JSONDecodeError("Konec bloku", buffer, pos)
+                result, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                # Další blok pomůže jen prvku useknutému koncem bufferu - chyba
+                # uprostřed je poškozený soubor a další čtení by ji jen oddálilo
+                more = f.read(read_size) if _is_truncated(buffer, e) else ""
+                if not more:
+                    raise ValueError(f"{path}: neplatné nebo neukončené JSON pole ({e})") from e
+                buffer = buffer[pos:] + more
+                pos = 0
+                continue
+            if difficulty is not None:
+                result["difficulty"] = difficulty
+            yield result
+
+
+def iter_jsonl_results(path) -> Iterator[Dict[str, Any]]:
+    """Proudově čte výsledky ve formátu JSON Lines (výstup batch.py)."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_leaderboard_files(directory=None) -> Iterator[Dict[str, Any]]:
+    """
+    Proudově čte JSON žebříčky <obtížnost>.json všech obtížností.
+
+    Args:
+        directory: Adresář se žebříčky (None = leaderboards/)
+    """
+    directory = Path(directory) if directory is not None else LEADERBOARDS_DIR
+    for difficulty in DIFFICULTIES:
+        path = directory / (difficulty.lower() + ".json")
+        if path.exists():
+            yield from iter_json_results(path, difficulty)
+
+
+def iter_database_results(path=None) -> Iterator[Dict[str, Any]]:
+    """
+    Proudově čte výsledky z databáze žebříčků (vlastní připojení jen pro čtení).
+
+    Args:
+        path: Cesta k databázi (None = leaderboards/leaderboards.db)
+    """
+    path = Path(path) if path is not None else get_database_path()
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = connection.execute(
+            "SELECT difficulty, name, score, shoots, accuracy, game_duration_ms,"
+            " game_start_datetime FROM results ORDER BY id"
+        )
+        columns = [column[0] for column in cursor.description]
+        for row in cursor:
+            yield dict(zip(columns, row))
+    finally:
+        connection.close()
+
+
+def iter_archive_results(path=None) -> Iterator[Dict[str, Any]]:
+    """Proudově čte výsledky z binárního archivu (viz systems.archive)."""
+    from systems.archive import ResultArchive
+
+    with ResultArchive(path) as archive:
+        yield from archive.records(with_difficulty=True)
+
+
+# ----------------------------------------------------------------------
+def analyze(
+    results: Iterable[Dict[str, Any]], use_numpy=None, chunk_size=CHUNK_SIZE, track_players=True
+) -> ResultStats:
+    """
+    Spočítá statistiky z proudu výsledků.
+
+    Args:
+        results: Iterovatelné slovníky výsledků s klíčem "difficulty"
+        use_numpy: True/False, nebo None = podle dostupnosti NumPy
+        chunk_size: Počet výsledků v jednom bloku pro NumPy
+        track_players: Počítat statistiky hráčů (paměť roste s počtem jmen)
+
+    Returns:
+        ResultStats
+    """
+    stats = ResultStats(track_players)
+    if use_numpy is None:
+        use_numpy = is_available()
+    if not use_numpy:
+        for result in results:
+            stats.add(result)
+        return stats
+
+    # Bloky po obtížnostech: obtížnost -> (jména, doby, přesnosti)
+    pending = {}
+    size = 0
+    for result in results:
+        block = pending.get(result["difficulty"])
+        if block is None:
+            block = pending[result["difficulty"]] = ([], [], [])
+        block[0].append(result.get("name", "?"))
+        block[1].append(result.get("game_duration_ms", 0))
+        block[2].append(result.get("accuracy", 0))
+        size += 1
+        if size >= chunk_size:
+            _flush_blocks(stats, pending)
+            size = 0
+    _flush_blocks(stats, pending)
+    return stats
+
+
+def _flush_blocks(stats, pending):
+    for difficulty, (names, durations, accuracies) in pending.items():
+        stats.add_arrays(difficulty, np.array(names, dtype=object), durations, accuracies)
+    pending.clear()
+
+
+def analyze_archive(path=None, use_numpy=None, track_players=True) -> ResultStats:
+    """
+    Spočítá statistiky binárního archivu výsledků.
+
+    S NumPy čte archiv po blocích záznamů přímo jako strukturované pole
+    (bez vytváření slovníků), jinak proudově přes iter_archive_results().
+
+    Args:
+        path: Cesta k archivu (None = leaderboards/archive.bin)
+        use_numpy: True/False, nebo None = podle dostupnosti NumPy
+        track_players: Počítat statistiky hráčů (paměť roste s počtem jmen)
+    """
+    from systems.archive import NAME_BYTES, RECORD_SIZE, ResultArchive
+
+    if use_numpy is None:
+        use_numpy = is_available()
+    if not use_numpy:
+        return analyze(iter_archive_results(path), use_numpy=False, track_players=track_players)
+
+    # Stejné rozložení jako archive._RECORD
+    dtype = np.dtype({
+        "names": ["name", "duration", "accuracy", "difficulty"],
+        "formats": [f"S{NAME_BYTES}", "<u4", "<u2", "u1"],
+        "offsets": [0, NAME_BYTES + 8, NAME_BYTES + 20, NAME_BYTES + 22],
+        "itemsize": RECORD_SIZE,
+    })
+    stats = ResultStats(track_players)
+    with ResultArchive(path) as archive:
+        for block in archive.record_blocks():
+            records = np.frombuffer(block, dtype=dtype)
+            for code, difficulty in enumerate(DIFFICULTIES):
+                selected = records[records["difficulty"] == code]
+                stats.add_arrays(
+                    difficulty, selected["name"], selected["duration"], selected["accuracy"]
+                )
+    return stats
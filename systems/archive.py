@@ -0,0 +1,349 @@
+"""
+Binární archiv výsledků s pevnou délkou záznamu (pro miliony her).
+
+Archiv je jeden soubor s hlavičkou a záznamy pevné délky, takže se
+čte přes `mmap` bez kopírování celého souboru do paměti a nový záznam
+se jen dopíše na konec. Dotaz na top-N prochází záznamy proudově
+a drží v paměti jen N nejlepších; jméno a čas startu dekóduje až
+u vítězů. Export zapisuje původní JSON formát žebříčků
+(<obtížnost>.json) do zadaného adresáře.
+
+Formát souboru (little-endian):
+    hlavička: b"ARLA", verze (H), délka záznamu (H), počet záznamů (Q) - 16 bajtů
+    záznam:   jméno (32s, UTF-8 doplněné nulami), start hry (q, mikrosekundy
+              od 1970-01-01 bez časové zóny), doba hraní ms (I), skóre (I),
+              výstřely (I), přesnost (H), obtížnost (B, index v DIFFICULTIES),
+              rezerva (9x) - 64 bajtů
+
+Soubor se zvětšuje po blocích (kapacita může být větší než počet
+záznamů). Záznam se zapíše dřív než nový počet v hlavičce, čtenář
+proto nikdy nevidí rozepsaný záznam.
+"""
+
+import heapq
+import json
+import mmap
+import struct
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from systems.leaderboard import DIFFICULTIES, LEADERBOARDS_DIR, build_result
+
+ARCHIVE_FILENAME = "archive.bin"
+MAGIC = b"ARLA"
+VERSION = 1
+
+NAME_BYTES = 32
+GROW_RECORDS = 16384       # O kolik záznamů se soubor minimálně zvětší
+SCAN_CHUNK = 8192          # Kolik záznamů se čte z jednoho výřezu mapy
+
+_HEADER = struct.Struct("<4sHHQ")
+_RECORD = struct.Struct(f"<{NAME_BYTES}sqIIIHB9x")
+# Jen řadicí klíče a obtížnost - jméno se při procházení přeskočí
+_KEYS = struct.Struct(f"<{NAME_BYTES}xqIIIHB9x")
+
+RECORD_SIZE = _RECORD.size
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+NO_TIMESTAMP = -(2 ** 63)  # Prázdný nebo neplatný čas startu
+
+
+def get_archive_path() -> Path:
+    """Vrátí výchozí cestu k archivu výsledků."""
+    return LEADERBOARDS_DIR / ARCHIVE_FILENAME
+
+
+def _encode_name(name: str) -> bytes:
+    """Zkrátí jméno na NAME_BYTES bajtů UTF-8 (nerozdělí znak)."""
+    return name.encode("utf-8")[:NAME_BYTES].decode("utf-8", "ignore").encode("utf-8")
+
+
+def _encode_timestamp(text: str) -> int:
+    try:
+        return (datetime.fromisoformat(text).replace(tzinfo=None) - _EPOCH) // _MICROSECOND
+    except (TypeError, ValueError):
+        return NO_TIMESTAMP
+
+
+def _decode_timestamp(value: int) -> str:
+    if value == NO_TIMESTAMP:
+        return ""
+    return (_EPOCH + value * _MICROSECOND).isoformat()
+
+
+def _difficulty_code(difficulty: str) -> int:
+    for code, name in enumerate(DIFFICULTIES):
+        if name.lower() == difficulty.lower():
+            return code
+    raise ValueError(f"Neznámá obtížnost: {difficulty}")
+
+
+class ResultArchive:
+    """
+    Archiv výsledků v binárním souboru mapovaném do paměti.
+
+    Použití:
+        with ResultArchive(path, writable=True) as archive:
+            archive.append("Machr", "Jan", 10, 12, 83, 45000, "2024-01-01T00:00:00")
+            best = archive.top("Machr", 5)
+
+    Attributes:
+        path: Cesta k souboru archivu
+        writable: Zda je archiv otevřený pro zápis
+    """
+
+    def __init__(self, path=None, writable=False):
+        """
+        Otevře (případně vytvoří) archiv.
+
+        Args:
+            path: Cesta k souboru (None = leaderboards/archive.bin)
+            writable: True = otevřít pro zápis, neexistující soubor vytvořit
+
+        Raises:
+            FileNotFoundError: Archiv pro čtení neexistuje
+            ValueError: Soubor není archiv výsledků této verze
+        """
+        self.path = Path(path) if path is not None else get_archive_path()
+        self.writable = writable
+        if writable and not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, _RECORD.size, 0))
+                f.truncate(_HEADER.size + GROW_RECORDS * _RECORD.size)
+        self._file = open(self.path, "r+b" if writable else "rb")
+        self._map = None
+        self._remap()
+        magic, version, record_size, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != _RECORD.size:
+            self.close()
+            raise ValueError(f"{self.path} není archiv výsledků Arena Survival (verze {VERSION})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Zavře mapu i soubor (obsah je už zapsaný)."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _remap(self):
+        """Namapuje soubor znovu (po zvětšení tímto nebo jiným procesem)."""
+        if self._map is not None:
+            self._map.close()
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+
+    def __len__(self):
+        count = _HEADER.unpack_from(self._map, 0)[3]
+        # Jiný proces mohl mezitím soubor zvětšit a dopsat záznamy
+        if _HEADER.size + count * _RECORD.size > len(self._map):
+            self._remap()
+        return count
+
+    # ------------------------------------------------------------------
+    # Zápis
+
+    def append(
+        self,
+        difficulty: str,
+        player_name: str,
+        score: int,
+        shoots: int,
+        accuracy: int,
+        game_duration_ms: int,
+        game_start_datetime: str,
+    ):
+        """Připíše jeden výsledek (stejné argumenty jako save_result())."""
+        self.extend([
+            (difficulty, player_name, score, shoots, accuracy, game_duration_ms, game_start_datetime)
+        ])
+
+    def extend(self, results) -> int:
+        """
+        Připíše více výsledků najednou.
+
+        Args:
+            results: Iterovatelné tuple ve stejném pořadí jako argumenty
+                save_result() (může to být i generátor)
+
+        Returns:
+            Počet připsaných výsledků
+
+        Raises:
+            ValueError: Neznámá obtížnost nebo hodnota mimo rozsah formátu
+        """
+        if not self.writable:
+            raise ValueError(f"{self.path} je otevřený jen pro čtení")
+        count = start = len(self)
+        for difficulty, name, score, shoots, accuracy, duration, started in results:
+            offset = _HEADER.size + count * _RECORD.size
+            if offset + _RECORD.size > len(self._map):
+                self._grow(count)
+            try:
+                _RECORD.pack_into(
+                    self._map, offset, _encode_name(name), _encode_timestamp(started),
+                    duration, score, shoots, accuracy, _difficulty_code(difficulty),
+                )
+            except struct.error as e:
+                raise ValueError(f"Výsledek nelze uložit do archivu: {e}") from e
+            count += 1
+            # Počet po každém záznamu - při chybě zůstanou uložené předchozí
+            _HEADER.pack_into(self._map, 0, MAGIC, VERSION, _RECORD.size, count)
+        return count - start
+
+    def _grow(self, count):
+        """Zvětší soubor aspoň o GROW_RECORDS záznamů (nebo na dvojnásobek)."""
+        grow = max(GROW_RECORDS, count)
+        self._map.close()
+        self._map = None
+        self._file.truncate(_HEADER.size + (count + grow) * _RECORD.size)
+        self._remap()
+
+    def flush(self):
+        """Zapíše změněné stránky mapy na disk."""
+        self._map.flush()
+
+    # ------------------------------------------------------------------
+    # Čtení
+
+    def _chunks(self, struct_type):
+        """
+        Proudově rozbalí záznamy po výřezech mapy.
+
+        Vrací dvojice (index prvního záznamu, seznam rozbalených záznamů).
+        Výřez se po rozbalení uvolní, archiv lze proto mezi výřezy
+        zvětšit (append). Záznamy připsané během procházení se vynechají.
+        """
+        count = len(self)
+        for chunk_start in range(0, count, SCAN_CHUNK):
+            chunk_end = min(chunk_start + SCAN_CHUNK, count)
+            with memoryview(self._map) as view:
+                chunk = view[
+                    _HEADER.size + chunk_start * _RECORD.size:
+                    _HEADER.size + chunk_end * _RECORD.size
+                ]
+                rows = list(struct_type.iter_unpack(chunk))
+                chunk.release()
+            yield chunk_start, rows
+
+    def record_blocks(self) -> Iterator[bytes]:
+        """
+        Proudově vrací bloky celých záznamů (nejvýše SCAN_CHUNK záznamů).
+
+        Blok je kopie výřezu mapy ve formátu souboru - určeno pro
+        vektorové zpracování (např. numpy.frombuffer v systems.analytics).
+        """
+        count = len(self)
+        for chunk_start in range(0, count, SCAN_CHUNK):
+            chunk_end = min(chunk_start + SCAN_CHUNK, count)
+            yield self._map[_HEADER.size + chunk_start * _RECORD.size:_HEADER.size + chunk_end * _RECORD.size]
+
+    def _result(self, row) -> Dict[str, Any]:
+        name, started, duration, score, shoots, accuracy, _ = row
+        return build_result(
+            name.rstrip(b"\0").decode("utf-8", "ignore"),
+            score, shoots, accuracy, duration, _decode_timestamp(started),
+        )
+
+    def records(self, difficulty: str = None, with_difficulty: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Proudově vrací výsledky ve formátu žebříčku v pořadí uložení.
+
+        Args:
+            difficulty: Jen výsledky dané obtížnosti (None = všechny)
+            with_difficulty: Doplnit do výsledků klíč "difficulty"
+        """
+        code = None if difficulty is None else _difficulty_code(difficulty)
+        for _, rows in self._chunks(_RECORD):
+            for row in rows:
+                if code is None or row[6] == code:
+                    result = self._result(row)
+                    if with_difficulty:
+                        result["difficulty"] = DIFFICULTIES[row[6]]
+                    yield result
+
+    def top(self, difficulty: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Vrátí nejlepší výsledky obtížnosti bez načtení celého archivu.
+
+        Řadí stejně jako get_leaderboard(): podle doby hraní, skóre,
+        přesnosti a při shodě má přednost dříve uložený výsledek.
+
+        Args:
+            difficulty: Obtížnost (Lama, Machr, Superman)
+            limit: Maximální počet výsledků
+        """
+        code = _difficulty_code(difficulty)
+        if limit <= 0:
+            return []
+        # Min-halda N nejlepších klíčů; záporný index = při shodě vyhraje
+        # dříve uložený výsledek. Většina záznamů neprojde prvním porovnáním.
+        heap = []
+        for chunk_start, rows in self._chunks(_KEYS):
+            for index, (_, duration, score, _, accuracy, row_code) in enumerate(rows, chunk_start):
+                if row_code != code:
+                    continue
+                key = (duration, score, accuracy, -index)
+                if len(heap) < limit:
+                    heapq.heappush(heap, key)
+                elif key > heap[0]:
+                    heapq.heapreplace(heap, key)
+        heap.sort(reverse=True)
+        return [
+            self._result(_RECORD.unpack_from(self._map, _HEADER.size - negative_index * _RECORD.size))
+            for *_, negative_index in heap
+        ]
+
+    # ------------------------------------------------------------------
+    def export_json(self, directory) -> Dict[str, int]:
+        """
+        Exportuje archiv do JSON žebříčků <obtížnost>.json.
+
+        Soubory mají stejný formát jako původní žebříčky
+        (json.dump(..., ensure_ascii=False, indent=2)) a zapisují se
+        proudově po záznamech. Soubor vznikne jen pro obtížnost, která
+        má v archivu nějaký výsledek.
+
+        Args:
+            directory: Cílový adresář (existující žebříčky se nepřepisují)
+
+        Returns:
+            Slovník obtížnost -> počet exportovaných výsledků
+
+        Raises:
+            FileExistsError: Žebříček obtížnosti už v adresáři existuje
+        """
+        directory = Path(directory)
+        paths = [directory / (difficulty.lower() + ".json") for difficulty in DIFFICULTIES]
+        for path in paths:
+            if path.exists():
+                raise FileExistsError(f"Žebříček {path} už existuje, export ho nepřepíše")
+        directory.mkdir(parents=True, exist_ok=True)
+        files = [None] * len(DIFFICULTIES)
+        counts = [0] * len(DIFFICULTIES)
+        try:
+            for _, rows in self._chunks(_RECORD):
+                for row in rows:
+                    code = row[6]
+                    f = files[code]
+                    if f is None:
+                        f = files[code] = open(paths[code], "x", encoding="utf-8")
+                    text = json.dumps(self._result(row), ensure_ascii=False, indent=2)
+                    f.write(("[\n  " if counts[code] == 0 else ",\n  ") + text.replace("\n", "\n  "))
+                    counts[code] += 1
+            for f in files:
+                if f is not None:
+                    f.write("\n]")
+        finally:
+            for f in files:
+                if f is not None:
+                    f.close()
+        return dict(zip(DIFFICULTIES, counts))
@@ -0,0 +1,95 @@
+"""
+Správce herních assetů (obrázky a zvuky).
+
+Každý obrázek se načte, převede (convert_alpha) a zmenší jen jednou
+a uloží se do cache podle (cesta, velikost). Zvuky se načtou také jen
+jednou. Cesty se určují relativně k adresáři projektu, ne k aktuálnímu
+pracovnímu adresáři, takže hru lze spustit odkudkoli.
+"""
+
+from pathlib import Path
+
+import pygame
+
+# Kořen projektu a adresář s assety
+BASE_DIR = Path(__file__).resolve().parent.parent
+ASSETS_DIR = BASE_DIR / "assets"
+
+# Assety, které hra používá (pro preload())
+IMAGES = [("robot.png", (40, 40))]
+SOUNDS = ["sounds/ding.wav", "sounds/chord.wav"]
+
+_images = {}
+_sounds = {}
+
+
+def asset_path(name):
+    """Vrátí absolutní cestu k assetu zadanému relativně k adresáři assets/."""
+    return ASSETS_DIR / name
+
+
+def load_image(name, size=None):
+    """
+    Vrátí obrázek z cache, případně ho načte, převede a zmenší.
+
+    Převádí se (convert_alpha) jen při vytvořeném okně; bez okna
+    (headless hra) se použije obrázek v původním formátu a cachuje se zvlášť.
+
+    Args:
+        name: Cesta k obrázku relativně k adresáři assets/
+        size: Tuple (width, height), nebo None pro původní velikost
+
+    Returns:
+        Sdílený pygame Surface - nesmí se měnit
+    """
+    converted = pygame.display.get_init() and pygame.display.get_surface() is not None
+    key = (name, tuple(size) if size else None, converted)
+    image = _images.get(key)
+    if image is not None:
+        return image
+
+    original = _images.get((name, None, converted))
+    if original is None:
+        original = pygame.image.load(str(asset_path(name)))
+        if converted:
+            original = original.convert_alpha()
+        _images[(name, None, converted)] = original
+
+    image = pygame.transform.scale(original, size) if size else original
+    _images[key] = image
+    return image
+
+
+def load_sound(name):
+    """
+    Vrátí zvuk z cache, případně ho načte.
+
+    Args:
+        name: Cesta ke zvuku relativně k adresáři assets/
+
+    Returns:
+        pygame.mixer.Sound, nebo None, pokud zvuk nelze načíst
+        (např. chybí zvukové zařízení)
+    """
+    if name in _sounds:
+        return _sounds[name]
+    try:
+        sound = pygame.mixer.Sound(str(asset_path(name)))
+    except (pygame.error, FileNotFoundError):
+        sound = None
+    _sounds[name] = sound
+    return sound
+
+
+def preload():
+    """Načte všechny obrázky a zvuky hry předem (např. při startu)."""
+    for name, size in IMAGES:
+        load_image(name, size)
+    for name in SOUNDS:
+        load_sound(name)
+
+
+def clear():
+    """Vyprázdní cache assetů."""
+    _images.clear()
+    _sounds.clear()
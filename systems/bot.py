@@ -0,0 +1,117 @@
+"""
+Jednoduchý bot pro headless simulace.
+
+Bot míří na nejbližšího nepřítele a střílí na něj, jakmile je v dosahu
+střely. Uhýbá jen tehdy, když mu hrozí srážka - jinak stojí (nebo se
+vrací ke středu arény) a nechává nepřátele přijít na mušku. Slouží
+k vyhodnocení vyváženosti obtížností bez hráče.
+"""
+
+import math
+import random
+from settings import SHOOT_DISTANCE, BULLET_SPEED, BULLET_LIFETIME
+from systems.inputs import InputState
+
+FIRE_RANGE = BULLET_SPEED * BULLET_LIFETIME / 2  # Vzdálenost, na kterou bot střílí
+DODGE_MARGIN = 40      # Mezera mezi hráčem a nepřítelem (px), při které bot uhýbá
+WALL_MARGIN = 60       # Vzdálenost od okraje (px), odkud se bot vrací ke středu
+DIAGONAL = 0.38        # sin(22.5°) - hranice mezi přímým a šikmým směrem pohybu
+
+
+class DodgeBot:
+    """
+    Bot, který střílí na nejbližšího nepřítele a uhýbá hrozícím srážkám.
+
+    Instance se předává jako `policy` do `Game.simulate`.
+
+    Attributes:
+        rng: random.Random - vlastní generátor (kvůli opakovatelnosti)
+        fire_chance: Pravděpodobnost výstřelu, když je nepřítel v dosahu
+            a žádná střela bota neletí
+    """
+
+    def __init__(self, seed=None, fire_chance=1.0):
+        """
+        Inicializuje bota.
+
+        Args:
+            seed: Seed generátoru náhodných čísel
+            fire_chance: Pravděpodobnost výstřelu v jednom kroku
+        """
+        self.rng = random.Random(seed)
+        self.fire_chance = fire_chance
+
+    def __call__(self, game):
+        """Vrátí InputState pro aktuální krok hry."""
+        player = game.player
+        player_pos = player.pos
+        px, py = player_pos.x, player_pos.y
+        nearest = None
+        nearest_dist = None
+        away_x = away_y = 0.0
+        for enemy in game.enemies:
+            enemy_pos = enemy.pos
+            dx = px - enemy_pos.x
+            dy = py - enemy_pos.y
+            dist = math.hypot(dx, dy)
+            if nearest_dist is None or dist < nearest_dist:
+                nearest, nearest_dist = enemy, dist
+            # Uhýbat jen nepřátelům, se kterými hrozí srážka
+            gap = dist - (player.rect.width + enemy.rect.width) / 2
+            if gap < DODGE_MARGIN and dist > 0:
+                weight = (DODGE_MARGIN - gap) / DODGE_MARGIN
+                away_x += dx / dist * weight
+                away_y += dy / dist * weight
+
+        # U okraje arény se nedá couvat - pomůže směr ke středu
+        width, height = game.config.size
+        to_center_x = width / 2 - px
+        to_center_y = height / 2 - py
+        near_wall = (
+            px < WALL_MARGIN or px > width - WALL_MARGIN
+            or py < WALL_MARGIN or py > height - WALL_MARGIN
+        )
+        if away_x or away_y:
+            if near_wall:
+                length = math.hypot(to_center_x, to_center_y) or 1
+                away_x += to_center_x / length
+                away_y += to_center_y / length
+            move_x, move_y = away_x, away_y
+        elif near_wall or nearest is None:
+            move_x, move_y = to_center_x, to_center_y
+        else:
+            move_x = move_y = 0.0
+
+        # Klávesy podle směru pohybu (i šikmo, pokud jsou složky srovnatelné)
+        length = math.hypot(move_x, move_y)
+        if length > 5 or (length and (away_x or away_y)):
+            move_x /= length
+            move_y /= length
+        else:
+            move_x = move_y = 0.0
+
+        if nearest is None:
+            return InputState(
+                up=move_y < -DIAGONAL, down=move_y > DIAGONAL,
+                left=move_x < -DIAGONAL, right=move_x > DIAGONAL,
+                mouse_pos=(int(px), int(py)),
+            )
+
+        # Myš musí být blíž než SHOOT_DISTANCE - mířit proto na bod ve směru
+        # nepřítele těsně před hráčem
+        aim_x = nearest.pos.x - px
+        aim_y = nearest.pos.y - py
+        scale = (SHOOT_DISTANCE - 1) / nearest_dist if nearest_dist > 0 else 0
+        shoot = (
+            nearest_dist < FIRE_RANGE
+            and not game.bullets  # Střel je málo - další až po dopadu předchozí
+            and self.rng.random() < self.fire_chance
+        )
+        return InputState(
+            up=move_y < -DIAGONAL,
+            down=move_y > DIAGONAL,
+            left=move_x < -DIAGONAL,
+            right=move_x > DIAGONAL,
+            mouse_pos=(int(px + aim_x * scale), int(py + aim_y * scale)),
+            shoot=shoot,
+        )
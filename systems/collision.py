@@ -0,0 +1,279 @@
+"""
+Systém pro detekci kolizí pomocí prostorového hashe (uniform grid).
+
+Místo porovnávání každého páru entit (O(n²)) rozdělí herní plochu
+na čtvercové buňky a kolize testuje jen mezi entitami, které sdílejí
+alespoň jednu buňku. Výsledky jsou totožné s párovým `colliderect`.
+"""
+
+from settings import COLLISION_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Prostorový hash pro rychlé dotazy na kolize obdélníků.
+
+    Každý objekt je vložen do všech buněk, které jeho rect překrývá.
+    Dva obdélníky, které se překrývají, proto vždy sdílejí buňku.
+
+    Attributes:
+        cell_size: int - velikost hrany buňky v pixelech
+        cells: dict - mapování (cx, cy) -> seznam objektů v buňce
+    """
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        """
+        Inicializuje prázdný prostorový hash.
+
+        Args:
+            cell_size: Velikost hrany buňky v pixelech
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """Odstraní všechny objekty z hashe."""
+        self.cells.clear()
+
+    def _cell_range(self, left, top, right, bottom):
+        """Vrátí rozsah buněk (x0, y0, x1, y1), které obdélník překrývá."""
+        size = self.cell_size
+        # right/bottom jsou u pygame.Rect exkluzivní, proto -1
+        return left // size, top // size, (right - 1) // size, (bottom - 1) // size
+
+    def insert(self, obj, bounds=None):
+        """
+        Vloží objekt do všech buněk, které jeho obdélník překrývá.
+
+        Args:
+            obj: Objekt pro vložení (typicky sprite)
+            bounds: Tuple (left, top, right, bottom); pokud chybí,
+                použije se obj.rect
+        """
+        if bounds is None:
+            rect = obj.rect
+            bounds = (rect.left, rect.top, rect.right, rect.bottom)
+        self._insert_entry((obj, *bounds))
+
+    def _insert_entry(self, entry):
+        """Vloží záznam (obj, left, top, right, bottom) do buněk."""
+        _, left, top, right, bottom = entry
+        size = self.cell_size
+        cells = self.cells
+        x0 = left // size
+        y0 = top // size
+        x1 = (right - 1) // size
+        y1 = (bottom - 1) // size
+        if x0 == x1 and y0 == y1:
+            # Nejčastější případ: objekt leží celý v jedné buňce
+            key = (x0, y0)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [entry]
+            else:
+                bucket.append(entry)
+            return
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def build(self, objects):
+        """
+        Znovu sestaví hash z dané kolekce objektů.
+
+        Args:
+            objects: Iterovatelná kolekce objektů s atributem rect
+        """
+        self.clear()
+        insert = self._insert_entry
+        for obj in objects:
+            rect = obj.rect
+            insert((obj, rect.left, rect.top, rect.right, rect.bottom))
+
+    def build_from_bounds(self, objects, lefts, tops, rights, bottoms):
+        """
+        Znovu sestaví hash z paralelních seznamů objektů a jejich hranic.
+
+        Používá se s vektorovým úložištěm entit, kde rect nemusí být
+        aktuální a hranice se čtou přímo z polí.
+
+        Args:
+            objects: Seznam objektů
+            lefts, tops, rights, bottoms: Seznamy celočíselných hranic
+        """
+        self.clear()
+        insert = self._insert_entry
+        for entry in zip(objects, lefts, tops, rights, bottoms):
+            insert(entry)
+
+    def query(self, rect):
+        """
+        Vrátí objekty, jejichž obdélník koliduje s daným rectem.
+
+        Args:
+            rect: pygame.Rect pro dotaz
+
+        Returns:
+            Seznam kolidujících objektů (každý nejvýše jednou)
+        """
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        if left >= right or top >= bottom:
+            return []  # Prázdný rect nekoliduje s ničím (jako colliderect)
+        x0, y0, x1, y1 = self._cell_range(left, top, right, bottom)
+        cells = self.cells
+        seen = set()
+        hits = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for obj, l, t, r, b in cells.get((cx, cy), ()):
+                    if obj in seen:
+                        continue
+                    seen.add(obj)
+                    if left < r and l < right and top < b and t < bottom:
+                        hits.append(obj)
+        return hits
+
+    def colliding(self, exclude=()):
+        """
+        Vrátí množinu objektů, které kolidují s alespoň jedním jiným.
+
+        Odpovídá párovému porovnání všech objektů přes `colliderect`,
+        ale testuje jen páry sdílející buňku.
+
+        Args:
+            exclude: Objekty, které se mají brát jako nepřítomné (např.
+                zabité v tomto kroku) - hash se kvůli nim nemusí sestavovat znovu
+
+        Returns:
+            Množina kolidujících objektů
+        """
+        result = set()
+        for bucket in self.cells.values():
+            count = len(bucket)
+            if count < 2:
+                continue
+            if exclude:
+                bucket = [entry for entry in bucket if entry[0] not in exclude]
+                count = len(bucket)
+                if count < 2:
+                    continue
+            for i in range(count):
+                a, al, at, ar, ab = bucket[i]
+                for j in range(i + 1, count):
+                    b, bl, bt, br, bb = bucket[j]
+                    if a in result and b in result:
+                        continue  # Oba už jsou označené, test je zbytečný
+                    if al < br and bl < ar and at < bb and bt < ab:
+                        result.add(a)
+                        result.add(b)
+        return result
+
+    def sweep(self, segments):
+        """
+        Dávkově otestuje pohybující se obdélníky (projektily) proti hashi.
+
+        Každý segment popisuje obdélník s poloviční šířkou/výškou
+        (half_w, half_h), jehož střed se během kroku posunul z (x0, y0)
+        do (x1, y1). Testuje se celá dráha, takže rychlý objekt nepřeskočí
+        malý obdélník. Pohyb objektů v hashi během kroku se zanedbává.
+
+        Args:
+            segments: Iterovatelná kolekce (obj, x0, y0, x1, y1, half_w, half_h)
+
+        Returns:
+            Seznam (obj, hits) pro segmenty, které něco zasáhly; hits jsou
+            objekty překrývající pohybující se obdélník v okamžiku prvního
+            dotyku (každý nejvýše jednou)
+        """
+        size = self.cell_size
+        cells = self.cells
+        results = []
+        for obj, x0, y0, x1, y1, half_w, half_h in segments:
+            dx = x1 - x0
+            dy = y1 - y0
+            inv_dx = 1.0 / dx if dx else 0.0
+            inv_dy = 1.0 / dy if dy else 0.0
+            # Obálka celé dráhy a buňky, které překrývá
+            box_l = (x0 if dx > 0 else x1) - half_w
+            box_r = (x1 if dx > 0 else x0) + half_w
+            box_t = (y0 if dy > 0 else y1) - half_h
+            box_b = (y1 if dy > 0 else y0) + half_h
+            cx0, cx1 = int(box_l // size), int(box_r // size)
+            cy0, cy1 = int(box_t // size), int(box_b // size)
+
+            single = cx0 == cx1 and cy0 == cy1
+            seen = set()
+            contacts = []
+            first = 1.0
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    for other, l, t, r, b in cells.get((cx, cy), ()):
+                        # Rychlé vyřazení podle obálky dráhy
+                        if not (box_l < r and l < box_r and box_t < b and t < box_b):
+                            continue
+                        if not single:
+                            if other in seen:
+                                continue
+                            seen.add(other)
+                        # Průnik dráhy středu s obdélníkem rozšířeným o polovinu
+                        # pohybujícího se obdélníku (slab test, otevřené intervaly)
+                        t_in, t_out = 0.0, 1.0
+                        if dx:
+                            a = (l - half_w - x0) * inv_dx
+                            c = (r + half_w - x0) * inv_dx
+                            if a > c:
+                                a, c = c, a
+                            if a > t_in:
+                                t_in = a
+                            if c < t_out:
+                                t_out = c
+                        if dy:
+                            a = (t - half_h - y0) * inv_dy
+                            c = (b + half_h - y0) * inv_dy
+                            if a > c:
+                                a, c = c, a
+                            if a > t_in:
+                                t_in = a
+                            if c < t_out:
+                                t_out = c
+                        if t_in < t_out:
+                            contacts.append((other, t_in, t_out))
+                            if t_in < first:
+                                first = t_in
+            if contacts:
+                hits = [other for other, t_in, t_out in contacts if t_in <= first < t_out]
+                results.append((obj, hits))
+        return results
+
+
+def resolve_hits(contacts):
+    """
+    Vyhodnotí zásahy projektilů v jednom průchodu.
+
+    Nepřítel zabitý dřívějším projektilem ve stejném kroku už se dalším
+    projektilům nepočítá (stejně jako postupné `kill()` po jednotlivých
+    projektilech). Nic se neodstraňuje - to udělá volající.
+
+    Args:
+        contacts: Iterovatelná kolekce (projektil, seznam zasažených), např.
+            výsledek `SpatialHash.sweep`
+
+    Returns:
+        Tuple (kills, consumed): množina zabitých objektů a seznam
+        projektilů, které něco zasáhly (v pořadí zásahů)
+    """
+    kills = set()
+    consumed = []
+    for bullet, hits in contacts:
+        fresh = False
+        for target in hits:
+            if target not in kills:
+                kills.add(target)
+                fresh = True
+        if fresh:
+            consumed.append(bullet)
+    return kills, consumed
@@ -0,0 +1,160 @@
+"""
+Běhová konfigurace hry (velikost arény, spawn, limity entit, FPS).
+
+Výchozí hodnoty pocházejí ze `settings.py`. Přepsat je lze souborem
+JSON a/nebo parametry příkazové řádky `main.py`; parametry mají přednost
+před souborem. Příklad souboru:
+
+    {
+        "width": 1920,
+        "height": 1080,
+        "fps": 60,
+        "spawn_interval": 0.5,
+        "max_enemies": 300,
+        "max_bullets": 50,
+        "adaptive": true,
+        "enemy_sizes": {"Lama": [48, 48]},
+        "leaderboard_server": "192.168.1.10:8765"
+    }
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from settings import (
+    WIDTH, HEIGHT, FPS, SPAWN_INTERVAL, ENEMY_SIZE_BY_DIFFICULTY, ADAPTIVE_QUALITY,
+    LEADERBOARD_SERVER,
+)
+
+# Klíče souboru a jejich typy (enemy_sizes se zpracovává zvlášť)
+FIELDS = {
+    "width": int,
+    "height": int,
+    "fps": int,
+    "spawn_interval": float,
+    "max_enemies": int,
+    "max_bullets": int,
+    "adaptive": bool,
+    "leaderboard_server": str,
+}
+
+
+class GameConfig:
+    """
+    Nastavení, které lze měnit bez úpravy kódu.
+
+    Attributes:
+        width, height: Rozměry arény (okna) v pixelech
+        fps: Cílové FPS vykreslování
+        spawn_interval: Interval spawnu nepřátel v sekundách
+        max_enemies: Nejvyšší počet živých nepřátel (None = bez omezení)
+        max_bullets: Nejvyšší počet letících projektilů (None = bez omezení)
+        adaptive: Při přetížení snižovat spawn a kvalitu vykreslování
+        enemy_sizes: Slovník obtížnost -> (width, height) nepřítele
+        leaderboard_server: Adresa sdíleného serveru žebříčku (None = lokální)
+    """
+
+    def __init__(self, **overrides):
+        """
+        Vytvoří konfiguraci s výchozími hodnotami ze settings.py.
+
+        Args:
+            **overrides: Hodnoty, které se mají přepsat (viz update())
+        """
+        self.width = WIDTH
+        self.height = HEIGHT
+        self.fps = FPS
+        self.spawn_interval = SPAWN_INTERVAL
+        self.max_enemies = None
+        self.max_bullets = None
+        self.adaptive = ADAPTIVE_QUALITY
+        self.enemy_sizes = dict(ENEMY_SIZE_BY_DIFFICULTY)
+        self.leaderboard_server = LEADERBOARD_SERVER
+        self.update(overrides)
+
+    @property
+    def size(self):
+        """Tuple (width, height) arény."""
+        return self.width, self.height
+
+    @property
+    def frame_budget_ms(self):
+        """Čas na jeden snímek v ms při cílovém FPS."""
+        return 1000 / self.fps
+
+    def update(self, values):
+        """
+        Přepíše hodnoty konfigurace.
+
+        Args:
+            values: Slovník klíč -> hodnota (klíče viz FIELDS a "enemy_sizes");
+                hodnoty None se ignorují
+
+        Raises:
+            ValueError: Neznámý klíč nebo neplatná hodnota
+        """
+        for key, value in values.items():
+            if value is None:
+                continue
+            if key == "enemy_sizes":
+                for difficulty, size in value.items():
+                    width, height = (int(v) for v in size)
+                    self.enemy_sizes[difficulty] = (width, height)
+            elif key in FIELDS:
+                setattr(self, key, FIELDS[key](value))
+            else:
+                raise ValueError(f"Neznámý klíč konfigurace: {key}")
+
+        if self.width <= 0 or self.height <= 0 or self.fps <= 0 or self.spawn_interval <= 0:
+            raise ValueError("Rozměry, FPS a interval spawnu musí být kladné")
+
+    def to_dict(self):
+        """Vrátí konfiguraci jako slovník (stejný formát jako soubor)."""
+        data = {key: getattr(self, key) for key in FIELDS}
+        data["enemy_sizes"] = {name: list(size) for name, size in self.enemy_sizes.items()}
+        return data
+
+
+def load_config(path=None, args=None):
+    """
+    Sestaví konfiguraci z výchozích hodnot, souboru a parametrů.
+
+    Args:
+        path: Cesta k souboru JSON (None = bez souboru)
+        args: argparse.Namespace z parseru s add_arguments() (volitelné)
+
+    Returns:
+        GameConfig
+
+    Raises:
+        ValueError: Neplatný obsah souboru nebo parametrů
+    """
+    config = GameConfig()
+    if path is not None:
+        with open(Path(path), encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: konfigurace musí být objekt JSON")
+        config.update(data)
+    if args is not None:
+        config.update({key: getattr(args, key, None) for key in FIELDS})
+    return config
+
+
+def add_arguments(parser):
+    """Přidá do argparse parseru parametry konfigurace."""
+    parser.add_argument("--config", help="soubor s konfigurací (JSON)")
+    parser.add_argument("--width", type=int, help="šířka arény v pixelech")
+    parser.add_argument("--height", type=int, help="výška arény v pixelech")
+    parser.add_argument("--fps", type=int, help="cílové FPS")
+    parser.add_argument("--spawn-interval", type=float, help="interval spawnu nepřátel v sekundách")
+    parser.add_argument("--max-enemies", type=int, help="nejvyšší počet živých nepřátel")
+    parser.add_argument("--max-bullets", type=int, help="nejvyšší počet letících projektilů")
+    parser.add_argument(
+        "--adaptive",
+        action=argparse.BooleanOptionalAction,
+        help="při přetížení snižovat spawn a kvalitu vykreslování (--no-adaptive vypne)",
+    )
+    parser.add_argument("--leaderboard-server", metavar="HOST:PORT", help="sdílený server žebříčku")
+
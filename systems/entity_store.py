@@ -0,0 +1,183 @@
+"""
+Vektorové úložiště nepřátel (struct-of-arrays) postavené na NumPy.
+
+Pozice, velikosti a rychlosti všech nepřátel jsou uloženy v souvislých
+polích, takže pohyb k hráči se spočítá jedním dávkovým krokem místo
+volání `Enemy.update` pro každého nepřítele zvlášť. `rect` se synchronizuje
+jen u nepřátel, kteří jsou vidět na obrazovce; kolize čtou hranice
+přímo z polí.
+
+NumPy je nepovinná závislost - bez ní hra používá původní cestu
+přes `Enemy.update`.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy není nainstalované
+    np = None
+
+
+def is_available():
+    """Vrátí True, pokud je k dispozici NumPy a úložiště lze použít."""
+    return np is not None
+
+
+class EnemyStore:
+    """
+    Úložiště nepřátel ve formě paralelních NumPy polí.
+
+    Nepřítel i je popsán řádkem i ve všech polích. Při odebrání se na
+    jeho místo přesune poslední nepřítel (swap-remove), pole tak zůstávají
+    souvislá a bez děr.
+
+    Attributes:
+        pos: ndarray (capacity, 2) float64 - přesné pozice středů
+        prev: ndarray (capacity, 2) float64 - pozice před posledním step()
+        size: ndarray (capacity, 2) int64 - šířka a výška
+        speed: ndarray (capacity,) float64 - rychlost v px/s
+        sprites: Seznam sprite objektů ve stejném pořadí jako pole
+        count: Počet platných řádků
+    """
+
+    def __init__(self, capacity=256):
+        """
+        Inicializuje prázdné úložiště.
+
+        Args:
+            capacity: Počáteční kapacita polí (při zaplnění se zdvojnásobí)
+        """
+        if np is None:
+            raise RuntimeError("EnemyStore vyžaduje knihovnu NumPy")
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev = np.zeros((capacity, 2), dtype=np.float64)
+        self.size = np.zeros((capacity, 2), dtype=np.int64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.sprites = []
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        """Zdvojnásobí kapacitu všech polí."""
+        capacity = len(self.speed) * 2
+        for name in ("pos", "prev", "size", "speed"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def add(self, sprite, pos, size, speed):
+        """
+        Přidá nepřítele do úložiště a vrátí jeho index.
+
+        Args:
+            sprite: Sprite objekt nepřítele (dostane atribut store_index)
+            pos: Tuple (x, y) - pozice středu
+            size: Tuple (width, height)
+            speed: Rychlost v px/s
+        """
+        if self.count == len(self.speed):
+            self._grow()
+        index = self.count
+        self.pos[index] = pos
+        self.prev[index] = pos
+        self.size[index] = size
+        self.speed[index] = speed
+        self.sprites.append(sprite)
+        sprite.store_index = index
+        self.count += 1
+        return index
+
+    def remove(self, sprite):
+        """
+        Odebere nepřítele z úložiště (swap-remove).
+
+        Args:
+            sprite: Sprite objekt, který byl přidán přes add()
+        """
+        index = sprite.store_index
+        if index is None:
+            return
+        last = self.count - 1
+        if index != last:
+            self.pos[index] = self.pos[last]
+            self.prev[index] = self.prev[last]
+            self.size[index] = self.size[last]
+            self.speed[index] = self.speed[last]
+            moved = self.sprites[last]
+            self.sprites[index] = moved
+            moved.store_index = index
+        self.sprites.pop()
+        self.count = last
+        sprite.store_index = None
+
+    def clear(self):
+        """Odebere všechny nepřátele."""
+        for sprite in self.sprites:
+            sprite.store_index = None
+        self.sprites.clear()
+        self.count = 0
+
+    def step(self, target, dt):
+        """
+        Posune všechny nepřátele směrem k cíli jedním dávkovým výpočtem.
+
+        Odpovídá `Enemy.update`: směr k cíli se normalizuje a vynásobí
+        rychlostí a dt. Pozice před krokem se uloží do `prev`.
+
+        Args:
+            target: Tuple/Vector2 (x, y) - pozice cíle (hráče)
+            dt: Delta time v sekundách
+        """
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        self.prev[:n] = pos
+        delta = np.array((target[0], target[1]), dtype=np.float64) - pos
+        length = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+        moving = length > 0
+        direction = np.zeros_like(delta)
+        direction[moving] = delta[moving] / length[moving, None]
+        pos += direction * self.speed[:n, None] * dt
+
+    def bounds(self, alpha=1.0):
+        """
+        Vrátí celočíselné hranice (left, top, right, bottom) jako NumPy pole.
+
+        Zaokrouhlení odpovídá přiřazení `rect.center = pos` v pygame
+        (polovina se zaokrouhluje od nuly).
+
+        Args:
+            alpha: Interpolace mezi `prev` (0) a `pos` (1)
+        """
+        n = self.count
+        pos = self.pos[:n]
+        if alpha < 1.0:
+            prev = self.prev[:n]
+            pos = prev + (pos - prev) * alpha
+        center = (np.sign(pos) * np.floor(np.abs(pos) + 0.5)).astype(np.int64)
+        size = self.size[:n]
+        left = center[:, 0] - size[:, 0] // 2
+        top = center[:, 1] - size[:, 1] // 2
+        return left, top, left + size[:, 0], top + size[:, 1]
+
+    def sync_rects(self, view_rect, alpha=1.0):
+        """
+        Zapíše aktuální pozice do `rect` u nepřátel, kteří jsou vidět.
+
+        Args:
+            view_rect: pygame.Rect viditelné oblasti (obrazovky)
+            alpha: Interpolace mezi pozicí před a po posledním kroku
+        """
+        if self.count == 0:
+            return
+        left, top, right, bottom = self.bounds(alpha)
+        visible = (
+            (left < view_rect.right) & (right > view_rect.left)
+            & (top < view_rect.bottom) & (bottom > view_rect.top)
+        )
+        sprites = self.sprites
+        for index in np.flatnonzero(visible).tolist():
+            sprites[index].rect.topleft = (int(left[index]), int(top[index]))
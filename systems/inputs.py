@@ -0,0 +1,50 @@
+"""
+Stav vstupů hráče pro jeden simulační krok.
+
+Umožňuje řídit `Player` bez živé klávesnice a myši - například
+v headless simulaci, kde vstupy dodává bot nebo záznam.
+"""
+
+from typing import NamedTuple, Tuple
+
+import pygame
+
+
+class InputState(NamedTuple):
+    """
+    Vstupy hráče v jednom kroku simulace.
+
+    Attributes:
+        up, down, left, right: Stav kláves W, S, A, D
+        mouse_pos: Tuple (x, y) - pozice myši (kam hráč míří)
+        shoot: Počet kliknutí (výstřelů) v tomto kroku; True = 1
+    """
+
+    up: bool = False
+    down: bool = False
+    left: bool = False
+    right: bool = False
+    mouse_pos: Tuple[int, int] = (0, 0)
+    shoot: int = 0
+
+
+# Žádná klávesa ani klik - výchozí vstup headless simulace
+IDLE_INPUT = InputState()
+
+
+def read_live_input(shots=0):
+    """
+    Přečte aktuální stav klávesnice a myši do InputState.
+
+    Args:
+        shots: Počet kliknutí myši od minulého kroku
+    """
+    keys = pygame.key.get_pressed()
+    return InputState(
+        up=bool(keys[pygame.K_w]),
+        down=bool(keys[pygame.K_s]),
+        left=bool(keys[pygame.K_a]),
+        right=bool(keys[pygame.K_d]),
+        mouse_pos=pygame.mouse.get_pos(),
+        shoot=shots,
+    )
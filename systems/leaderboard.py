@@ -1,20 +1,87 @@
 """
 Systém pro správu žebříčků hráčů.
 
-Ukládá výsledky hráčů do JSON souborů podle obtížnosti
-a poskytuje metody pro čtení a řazení nejlepších výsledků.
+Ukládá výsledky hráčů do databáze SQLite (jedna tabulka pro všechny
+obtížnosti s indexem podle pořadí v žebříčku) a poskytuje metody pro
+čtení a řazení nejlepších výsledků. Uložení je jeden INSERT a dotaz na
+top-N čte jen prvních N řádků indexu. Starší žebříčky z JSON souborů
+(leaderboards/<obtížnost>.json) se při prvním otevření databáze importují.
 Žebříčky se řadí primárně podle doby hraní, sekundárně podle skóre, terciárně podle přesnosti.
+
+Po `use_server()` ukládají a čtou `save_result`, `save_results`
+a `get_leaderboard` žebříček ze sdíleného serveru
+(systems.leaderboard_server) místo lokální databáze.
 """
 
 import json
-import os
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import List, Dict, Any, Optional
 
 
 LEADERBOARDS_DIR = Path("leaderboards")
 DIFFICULTIES = ["Lama", "Machr", "Superman"]
+DATABASE_FILENAME = "leaderboards.db"
+
+# Sloupce výsledku ve stejném pořadí jako klíče build_result()
+RESULT_FIELDS = (
+    "name", "score", "shoots", "accuracy", "game_duration_ms", "game_start_datetime",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    difficulty TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    shoots INTEGER NOT NULL,
+    accuracy INTEGER NOT NULL,
+    game_duration_ms INTEGER NOT NULL,
+    game_start_datetime TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_rank
+    ON results (difficulty, game_duration_ms DESC, score DESC, accuracy DESC, id);
+CREATE TABLE IF NOT EXISTS imported_files (
+    path TEXT PRIMARY KEY
+);
+"""
+
+# Sdílené připojení k databázi (otevře se při prvním použití)
+_connection = None
+_connection_path = None
+_lock = threading.Lock()
+
+# Cache nejlepších výsledků v paměti: obtížnost -> (limit, výsledky)
+CACHE_SIZE = 10                # Kolik nejlepších výsledků se drží v cache
+CACHE_CHECK_INTERVAL = 1.0     # Jak často (s) kontrolovat změnu souboru databáze
+_cache = {}
+_cache_signature = None
+_cache_checked_at = None
+cache_stats = {"hits": 0, "misses": 0}
+
+# Klient sdíleného serveru žebříčku (None = lokální databáze)
+_client = None
+
+
+def use_server(address, **options):
+    """
+    Přesměruje ukládání a čtení žebříčku na sdílený server.
+
+    Args:
+        address: Adresa serveru "host:port"; None = zpět na lokální databázi
+        **options: Parametry LeaderboardClient (pool_size, timeout, retries...)
+
+    Raises:
+        ValueError: Neplatná adresa
+    """
+    global _client
+    from systems.leaderboard_client import LeaderboardClient
+
+    if _client is not None:
+        _client.close()
+    _client = LeaderboardClient(address, **options) if address else None
 
 
 def ensure_leaderboards_dir():
@@ -23,11 +90,159 @@ def ensure_leaderboards_dir():
 
 
 def get_leaderboard_path(difficulty: str) -> Path:
-    """Vrátí cestu k souboru žebříčku pro danou obtížnost."""
+    """Vrátí cestu k (původnímu) JSON souboru žebříčku pro danou obtížnost."""
     filename = difficulty.lower() + ".json"
     return LEADERBOARDS_DIR / filename
 
 
+def get_database_path() -> Path:
+    """Vrátí cestu k databázi žebříčků."""
+    return LEADERBOARDS_DIR / DATABASE_FILENAME
+
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    Vrátí sdílené připojení k databázi, případně ho otevře.
+
+    Při otevření vytvoří schéma a naimportuje dosud neimportované
+    JSON žebříčky. Volá se se zámkem _lock.
+    """
+    global _connection, _connection_path
+    path = get_database_path()
+    if _connection is not None and _connection_path == path:
+        return _connection
+    if _connection is not None:
+        _connection.close()
+
+    ensure_leaderboards_dir()
+    connection = sqlite3.connect(str(path), check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+    _connection, _connection_path = connection, path
+    _import_json_files(connection)
+    return connection
+
+
+def _file_signature():
+    """Vrátí (mtime, velikost) databáze a jejího WAL souboru."""
+    signature = []
+    path = get_database_path()
+    for candidate in (path, path.with_name(path.name + "-wal")):
+        try:
+            stat = candidate.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _validate_cache():
+    """
+    Zahodí cache, pokud databázi mezitím změnil jiný proces.
+
+    Soubor se kontroluje nejvýše jednou za CACHE_CHECK_INTERVAL sekund.
+    Volá se se zámkem _lock.
+    """
+    global _cache_signature, _cache_checked_at
+    now = time.monotonic()
+    if _cache_checked_at is not None and now - _cache_checked_at < CACHE_CHECK_INTERVAL:
+        return
+    _cache_checked_at = now
+    signature = _file_signature()
+    if signature != _cache_signature:
+        _cache.clear()
+        _cache_signature = signature
+
+
+def invalidate_cache(difficulty: str = None):
+    """
+    Zahodí výsledky v cache (pro danou obtížnost, nebo všechny).
+
+    Args:
+        difficulty: Obtížnost; None = všechny obtížnosti
+    """
+    global _cache_checked_at
+    with _lock:
+        if difficulty is None:
+            _cache.clear()
+            _cache_checked_at = None
+        else:
+            _cache.pop(difficulty.lower(), None)
+
+
+def _import_json_files(connection: sqlite3.Connection) -> int:
+    """Naimportuje JSON žebříčky, které ještě nebyly importovány."""
+    imported = 0
+    for difficulty in DIFFICULTIES:
+        path = get_leaderboard_path(difficulty)
+        if not path.exists():
+            continue
+        already = connection.execute(
+            "SELECT 1 FROM imported_files WHERE path = ?", (str(path),)
+        ).fetchone()
+        if already:
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                results = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            continue
+        with connection:
+            connection.executemany(
+                "INSERT INTO results (difficulty, name, score, shoots, accuracy,"
+                " game_duration_ms, game_start_datetime) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        difficulty.lower(),
+                        r.get("name", "?"),
+                        r.get("score", 0),
+                        r.get("shoots", 0),
+                        r.get("accuracy", 0),
+                        r.get("game_duration_ms", 0),
+                        r.get("game_start_datetime", ""),
+                    )
+                    for r in results
+                ],
+            )
+            connection.execute("INSERT INTO imported_files (path) VALUES (?)", (str(path),))
+        imported += len(results)
+    return imported
+
+
+def import_json_leaderboards() -> int:
+    """
+    Naimportuje výsledky z leaderboards/<obtížnost>.json do databáze.
+
+    Každý soubor se importuje jen jednou (podruhé se přeskočí).
+
+    Returns:
+        Počet naimportovaných výsledků
+    """
+    with _lock:
+        connection = _get_connection()
+        return _import_json_files(connection)
+
+
+def build_result(
+    player_name: str,
+    score: int,
+    shoots: int,
+    accuracy: int,
+    game_duration_ms: int,
+    game_start_datetime: str,
+) -> Dict[str, Any]:
+    """Sestaví záznam výsledku ve formátu, který se ukládá do žebříčku."""
+    return {
+        "name": player_name,
+        "score": score,
+        "shoots": shoots,
+        "accuracy": accuracy,
+        "game_duration_ms": game_duration_ms,
+        "game_start_datetime": game_start_datetime,
+    }
+
+
 def save_result(
     difficulty: str,
     player_name: str,
@@ -49,71 +264,95 @@ def save_result(
         game_duration_ms: Doba hraní v milisekundách
         game_start_datetime: ISO formát data/času startu hry
     """
-    ensure_leaderboards_dir()
-    
-    path = get_leaderboard_path(difficulty)
-    
-    # Načti existující výsledky
-    results = []
-    if path.exists():
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                results = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            results = []
-    
-    # Přidej nový výsledek
-    result = {
-        "name": player_name,
-        "score": score,
-        "shoots": shoots,
-        "accuracy": accuracy,
-        "game_duration_ms": game_duration_ms,
-        "game_start_datetime": game_start_datetime,
-    }
-    results.append(result)
-    
-    # Ulož zpět
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    save_results([
+        (difficulty, player_name, score, shoots, accuracy, game_duration_ms, game_start_datetime)
+    ])
 
 
-def get_leaderboard(difficulty: str, limit: int = 5) -> List[Dict[str, Any]]:
+def save_results(results, submission_id=None):
+    """
+    Uloží více výsledků najednou v jedné transakci.
+
+    Buď se uloží všechny, nebo žádný.
+
+    Args:
+        results: Seznam tuple ve stejném pořadí jako argumenty save_result()
+        submission_id: Id odeslání na sdílený server - opakované odeslání
+            se stejným id se uloží jen jednou (lokální databáze ho nepoužívá)
+
+    Raises:
+        ConnectionError: Sdílený server není dostupný (jen po use_server())
+    """
+    if _client is not None:
+        _client.save_results(results, submission_id)
+        return
+    save_results_local(results)
+
+
+def save_results_local(results):
+    """Uloží výsledky do lokální databáze i po use_server() (volá server žebříčku)."""
+    rows = [(difficulty.lower(),) + tuple(rest) for difficulty, *rest in results]
+    if not rows:
+        return
+    with _lock:
+        connection = _get_connection()
+        with connection:
+            connection.executemany(
+                "INSERT INTO results (difficulty, name, score, shoots, accuracy,"
+                " game_duration_ms, game_start_datetime) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        # Vlastní zápis zneplatní cache hned, ne až po kontrole souboru
+        for row in rows:
+            _cache.pop(row[0], None)
+
+
+def get_leaderboard(difficulty: str, limit: int = 5, block: bool = True) -> Optional[List[Dict[str, Any]]]:
     """
     Vrátí seznam nejlepších výsledků pro danou obtížnost.
     
     Řadí primárně podle doby hraní (delší je lepší),
     sekundárně podle skóre, terciárně podle přesnosti.
+    Při shodě má přednost dříve uložený výsledek.
     
     Args:
         difficulty: Obtížnost (Lama, Machr, Superman)
         limit: Maximální počet výsledků
+        block: False = nečekat na sdílený server (pro UI, viz
+            LeaderboardClient.get_leaderboard); lokální databáze se čte vždy
         
     Returns:
-        Seznam výsledků řazených od nejlepšího
+        Seznam výsledků řazených od nejlepšího, nebo None (block=False
+        a žebříček ze serveru se teprve načítá)
+
+    Raises:
+        ConnectionError: Sdílený server není dostupný (jen po use_server())
     """
-    ensure_leaderboards_dir()
-    
-    path = get_leaderboard_path(difficulty)
-    
-    if not path.exists():
-        return []
-    
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            results = json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return []
-    
-    # Řaď podle doby hraní (sestupně), pak skóre (sestupně), pak přesnosti (sestupně)
-    sorted_results = sorted(
-        results,
-        key=lambda x: (
-            -x.get("game_duration_ms", 0),  # Negativní pro sestupné řazení
-            -x.get("score", 0),
-            -x.get("accuracy", 0),
-        ),
-    )
-    
-    return sorted_results[:limit]
+    if _client is not None:
+        return _client.get_leaderboard(difficulty, limit, block)
+    return get_leaderboard_local(difficulty, limit)
+
+
+def get_leaderboard_local(difficulty: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """Vrátí nejlepší výsledky z lokální databáze i po use_server() (volá server žebříčku)."""
+    key = difficulty.lower()
+    with _lock:
+        _validate_cache()
+        cached = _cache.get(key)
+        if cached is not None and (cached[0] >= limit or len(cached[1]) < cached[0]):
+            cache_stats["hits"] += 1
+            return [dict(result) for result in cached[1][:limit]]
 
+        cache_stats["misses"] += 1
+        size = max(limit, CACHE_SIZE)
+        connection = _get_connection()
+        rows = connection.execute(
+            "SELECT name, score, shoots, accuracy, game_duration_ms, game_start_datetime"
+            " FROM results WHERE difficulty = ?"
+            " ORDER BY game_duration_ms DESC, score DESC, accuracy DESC, id"
+            " LIMIT ?",
+            (key, size),
+        ).fetchall()
+        results = [dict(zip(RESULT_FIELDS, row)) for row in rows]
+        _cache[key] = (size, results)
+    return [dict(result) for result in results[:limit]]
@@ -0,0 +1,273 @@
+"""
+Klient sdíleného serveru žebříčku (viz systems.leaderboard_server).
+
+Používá ho `systems.leaderboard`, pokud je nastavená adresa serveru
+(`use_server()`, parametr `--leaderboard-server`) - funkce `save_result`,
+`save_results` a `get_leaderboard` pak mají stejné rozhraní, jen data
+putují na server.
+
+Protokol: TCP, jedna zpráva JSON na řádek (UTF-8) v obou směrech.
+    {"op": "submit", "id": "...", "results": [[obtížnost, jméno, skóre,
+     výstřely, přesnost, doba ms, start], ...]}   -> {"ok": true}
+    {"op": "top", "difficulty": "Lama", "limit": 5} -> {"ok": true, "results": [...]}
+    chyba -> {"ok": false, "error": "..."}
+
+Spojení se drží v poolu a znovu používají. Při chybě spojení se
+požadavek zopakuje na novém spojení s rostoucí prodlevou; odeslání
+výsledků nese jednoznačné "id", takže ho server při opakování neuloží
+dvakrát.
+
+Menu čte žebříček bez čekání (`block=False`): dotaz běží ve vlákně na
+pozadí a menu mezitím kreslí poslední známý stav. Nedostupnost serveru
+se pamatuje déle (failure_ttl), aby se hra nepokoušela znovu připojit
+při každém překreslení.
+"""
+
+import json
+import socket
+import threading
+import time
+import uuid
+
+DEFAULT_PORT = 8765
+MAX_LINE = 1 << 20         # Nejdelší zpráva (bajty) - platí pro klienta i server
+
+
+def parse_address(address):
+    """
+    Rozloží adresu "host:port" (nebo jen "host") na (host, port).
+
+    Raises:
+        ValueError: Neplatný port
+    """
+    host, _, port = address.rpartition(":")
+    if not host:
+        return address, DEFAULT_PORT
+    try:
+        return host, int(port)
+    except ValueError:
+        raise ValueError(f"Neplatná adresa serveru žebříčku: {address}") from None
+
+
+class _Connection:
+    """Jedno spojení se serverem (socket a jeho souborové rozhraní)."""
+
+    def __init__(self, host, port, timeout):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.stream = self.sock.makefile("rwb")
+
+    def request(self, message):
+        """Pošle zprávu a vrátí odpověď (slovník)."""
+        self.stream.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.stream.flush()
+        line = self.stream.readline(MAX_LINE)
+        if not line.endswith(b"\n"):
+            raise ConnectionError("Server žebříčku ukončil spojení")
+        return json.loads(line)
+
+    def close(self):
+        try:
+            self.stream.close()
+        finally:
+            self.sock.close()
+
+
+class LeaderboardClient:
+    """
+    Klient serveru žebříčku s poolem spojení a opakováním požadavků.
+
+    Je bezpečný pro použití z více vláken (herní smyčka, ResultWriter).
+
+    Attributes:
+        host, port: Adresa serveru
+        pool_size: Nejvyšší počet současně otevřených spojení
+        timeout: Časový limit připojení a odpovědi v sekundách
+        retries: Kolikrát se požadavek zopakuje po chybě spojení
+        backoff: Prodleva před prvním opakováním v sekundách (pak dvojnásobná)
+        cache_ttl: Jak dlouho (s) platí načtený žebříček (0 = necachovat)
+        failure_ttl: Jak dlouho (s) platí zjištěná nedostupnost serveru
+        stats: Počítadla požadavků, opakování a otevřených spojení
+    """
+
+    def __init__(
+        self, address, pool_size=4, timeout=2.0, retries=3, backoff=0.1, cache_ttl=1.0, failure_ttl=30.0
+    ):
+        """
+        Inicializuje klienta (spojení se otevírají až při prvním požadavku).
+
+        Args:
+            address: Adresa serveru "host:port"
+            pool_size, timeout, retries, backoff, cache_ttl, failure_ttl: Viz Attributes
+        """
+        self.host, self.port = parse_address(address)
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache_ttl = cache_ttl
+        self.failure_ttl = failure_ttl
+        self.stats = {"requests": 0, "retries": 0, "connections": 0}
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        # Cache žebříčků: (obtížnost, limit) -> (čas načtení, výsledky nebo None = chyba)
+        self._cache = {}
+        self._fetching = set()  # Klíče cache, které se právě načítají na pozadí
+
+    def _acquire(self):
+        """Vrátí volné spojení z poolu, nebo otevře nové."""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError("Všechna spojení se serverem žebříčku jsou obsazená")
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        try:
+            connection = _Connection(self.host, self.port, self.timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.stats["connections"] += 1
+        return connection
+
+    def _release(self, connection, broken=False):
+        """Vrátí spojení do poolu (vadné spojení zavře)."""
+        if broken:
+            connection.close()
+        else:
+            with self._lock:
+                self._idle.append(connection)
+        self._slots.release()
+
+    def request(self, message):
+        """
+        Pošle požadavek a vrátí odpověď serveru.
+
+        Raises:
+            ConnectionError: Server není dostupný ani po opakováních
+            ValueError: Server požadavek odmítl
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                with self._lock:
+                    self.stats["retries"] += 1
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                connection = self._acquire()
+            except OSError as e:
+                error = e
+                continue
+            try:
+                response = connection.request(message)
+            except (OSError, ValueError) as e:
+                # Přerušené spojení (např. restart serveru) - zkusíme nové
+                self._release(connection, broken=True)
+                error = e
+                continue
+            self._release(connection)
+            if not response.get("ok"):
+                raise ValueError(response.get("error", "Server žebříčku požadavek odmítl"))
+            return response
+        raise ConnectionError(
+            f"Server žebříčku {self.host}:{self.port} není dostupný: {error}"
+        ) from error
+
+    def close(self):
+        """Zavře všechna nečinná spojení."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    # ------------------------------------------------------------------
+    def save_results(self, results, submission_id=None):
+        """
+        Odešle výsledky na server (viz leaderboard.save_results).
+
+        Args:
+            results: Seznam tuple ve stejném pořadí jako argumenty save_result()
+            submission_id: Id odeslání; opakované odeslání se stejným id
+                server uloží jen jednou (None = nové id)
+        """
+        rows = [list(result) for result in results]
+        if not rows:
+            return
+        self.request({"op": "submit", "id": submission_id or uuid.uuid4().hex, "results": rows})
+        # Odeslaný výsledek se musí projevit v dalším dotazu
+        difficulties = {row[0].lower() for row in rows}
+        with self._lock:
+            for key in list(self._cache):
+                if key[0] in difficulties:
+                    del self._cache[key]
+
+    def get_leaderboard(self, difficulty, limit=5, block=True):
+        """
+        Vrátí nejlepší výsledky obtížnosti ze serveru (viz leaderboard.get_leaderboard).
+
+        Args:
+            difficulty: Obtížnost
+            limit: Maximální počet výsledků
+            block: False = nečekat na server; neplatná cache se obnoví ve
+                vlákně na pozadí a vrátí se poslední známý stav
+
+        Returns:
+            Seznam výsledků, nebo None (block=False a žebříček se teprve načítá)
+
+        Raises:
+            ConnectionError: Server není dostupný (nebo naposledy nebyl)
+        """
+        key = (difficulty.lower(), limit)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            loaded_at, results = cached
+            ttl = self.cache_ttl if results is not None else self.failure_ttl
+            if time.monotonic() - loaded_at < ttl:
+                return self._cached_results(results)
+        if block:
+            return self._cached_results(self._fetch(key, difficulty, limit))
+
+        self._fetch_in_background(key, difficulty, limit)
+        return None if cached is None else self._cached_results(cached[1])
+
+    def _cached_results(self, results):
+        """Kopie výsledků z cache (None v cache = zjištěná nedostupnost serveru)."""
+        if results is None:
+            # Nedávný neúspěch - nečekat znovu na všechna opakování
+            raise ConnectionError(f"Server žebříčku {self.host}:{self.port} není dostupný")
+        return [dict(result) for result in results]
+
+    def _fetch(self, key, difficulty, limit):
+        """Načte žebříček ze serveru a uloží ho (nebo neúspěch) do cache."""
+        now = time.monotonic()
+        try:
+            results = self.request({"op": "top", "difficulty": difficulty, "limit": limit})["results"]
+        except (ConnectionError, ValueError):
+            with self._lock:
+                self._cache[key] = (now, None)
+            raise
+        with self._lock:
+            self._cache[key] = (now, results)
+        return results
+
+    def _fetch_in_background(self, key, difficulty, limit):
+        """Spustí načtení žebříčku ve vlákně (jedno na klíč cache)."""
+        with self._lock:
+            if key in self._fetching:
+                return
+            self._fetching.add(key)
+
+        def fetch():
+            try:
+                self._fetch(key, difficulty, limit)
+            except (ConnectionError, ValueError):
+                pass  # Neúspěch je v cache, menu ho zobrazí
+            finally:
+                with self._lock:
+                    self._fetching.discard(key)
+
+        threading.Thread(target=fetch, name="leaderboard-fetch", daemon=True).start()
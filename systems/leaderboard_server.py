@@ -0,0 +1,228 @@
+"""
+Sdílený server žebříčku pro více herních automatů v jedné síti.
+
+Server (asyncio) přijímá výsledky a dotazy na top-N od klientů
+(systems.leaderboard_client) a jako jediný zapisuje do databáze
+žebříčků - souběžné zápisy více her tak nemohou soubor poškodit.
+Výsledky došlé během krátkého okna (batch_delay) od všech klientů se
+uloží jednou transakcí přes `save_results_local`; klient dostane potvrzení
+až po zápisu. Zápis i dotazy běží ve vlákně, smyčku neblokují.
+
+Spuštění z kořene projektu:
+    python -m systems.leaderboard_server
+    python -m systems.leaderboard_server --host 0.0.0.0 --port 8765 --directory leaderboards
+
+Hry se k serveru připojí parametrem `python main.py --leaderboard-server host:port`.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+from systems import leaderboard
+from systems.leaderboard_client import DEFAULT_PORT, MAX_LINE
+
+RECENT_IDS = 10000         # Kolik posledních id odeslání si server pamatuje (opakování)
+MAX_TOP = 100              # Nejvyšší limit dotazu top (větší se ořízne)
+
+
+def _validate_results(rows):
+    """
+    Zkontroluje výsledky z požadavku submit.
+
+    Raises:
+        ValueError: Výsledek nemá formát argumentů save_result()
+    """
+    difficulties = {difficulty.lower() for difficulty in leaderboard.DIFFICULTIES}
+    results = []
+    for row in rows:
+        if not isinstance(row, list) or len(row) != 7:
+            raise ValueError("Výsledek musí mít 7 položek jako argumenty save_result()")
+        difficulty, name, score, shoots, accuracy, duration, started = row
+        if not isinstance(difficulty, str) or difficulty.lower() not in difficulties:
+            raise ValueError(f"Neznámá obtížnost: {difficulty}")
+        if not all(isinstance(value, int) for value in (score, shoots, accuracy, duration)):
+            raise ValueError("Skóre, výstřely, přesnost a doba musí být celá čísla")
+        results.append((difficulty, str(name), score, shoots, accuracy, duration, str(started)))
+    return results
+
+
+class LeaderboardServer:
+    """
+    Asyncio server žebříčku s dávkovým zápisem.
+
+    Attributes:
+        host, port: Adresa, na které server naslouchá (port 0 = libovolný volný)
+        batch_delay: Jak dlouho (s) čekat na další výsledky před zápisem
+        max_batch: Nejvíce odeslání v jedné transakci
+        stats: Počítadla odeslání, výsledků, zápisů, neúspěšných zápisů a dotazů
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, batch_delay=0.05, max_batch=500):
+        """Inicializuje server (naslouchat začne až start())."""
+        self.host = host
+        self.port = port
+        self.batch_delay = batch_delay
+        self.max_batch = max_batch
+        self.stats = {"submissions": 0, "results": 0, "writes": 0, "failed_writes": 0, "queries": 0}
+        self._server = None
+        self._pending = None
+        self._writer_task = None
+        self._clients = set()
+        # id odeslání -> Future zápisu (rozpracovaná i nedávno zapsaná)
+        self._submissions = OrderedDict()
+
+    async def start(self):
+        """Začne naslouchat; skutečný port je pak v self.port."""
+        self._pending = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._write_batches())
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port, limit=MAX_LINE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve(self):
+        """Spustí server a obsluhuje klienty, dokud není zrušen."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Přestane přijímat spojení a zapíše čekající výsledky."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._clients):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._writer_task is not None:
+            await self._pending.join()
+            self._writer_task.cancel()
+            self._writer_task = None
+
+    # ------------------------------------------------------------------
+    async def _handle_client(self, reader, writer):
+        """Obsluha jednoho spojení: požadavek na řádek, odpověď na řádek."""
+        self._clients.add(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):  # ValueError = příliš dlouhý řádek
+                    break
+                if not line:
+                    break
+                try:
+                    response = await self._dispatch(json.loads(line))
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    response = {"ok": False, "error": str(e)}
+                except Exception as e:  # Chyba zápisu - klient ji dostane, server běží dál
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _dispatch(self, message):
+        """Zpracuje jeden požadavek a vrátí odpověď."""
+        op = message.get("op")
+        if op == "submit":
+            await self._submit(message.get("id"), _validate_results(message["results"]))
+            return {"ok": True}
+        if op == "top":
+            self.stats["queries"] += 1
+            limit = message.get("limit", 5)
+            if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+                raise ValueError("Limit musí být kladné celé číslo")
+            # Celá tabulka se po síti nevydává - limit je shora omezený
+            limit = min(limit, MAX_TOP)
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, leaderboard.get_leaderboard_local, str(message["difficulty"]), limit
+            )
+            return {"ok": True, "results": results}
+        if op == "ping":
+            return {"ok": True}
+        raise ValueError(f"Neznámý požadavek: {op}")
+
+    async def _submit(self, submission_id, results):
+        """Zařadí výsledky do dávky a počká na jejich zápis."""
+        future = self._submissions.get(submission_id) if submission_id else None
+        if future is None:
+            # Nové odeslání (opakované se stejným id jen čeká na původní zápis)
+            future = asyncio.get_running_loop().create_future()
+            if submission_id:
+                self._submissions[submission_id] = future
+                while len(self._submissions) > RECENT_IDS:
+                    self._submissions.popitem(last=False)
+            self.stats["submissions"] += 1
+            await self._pending.put((submission_id, results, future))
+        await asyncio.shield(future)
+
+    async def _write_batches(self):
+        """Sbírá odeslání všech klientů a zapisuje je po dávkách."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pending.get()]
+            # Krátké okno pro další odeslání, pak vše čekající jednou transakcí
+            await asyncio.sleep(self.batch_delay)
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            rows = [result for _, results, _ in batch for result in results]
+            try:
+                await loop.run_in_executor(None, leaderboard.save_results_local, rows)
+            except Exception as error:
+                # Chybu zapíše server jednou; klienti, kteří ještě čekají,
+                # ji dostanou v odpovědi
+                self.stats["failed_writes"] += 1
+                print(f"Zápis {len(rows)} výsledků selhal: {error}", file=sys.stderr)
+                for submission_id, _, future in batch:
+                    # Neuložené odeslání lze zopakovat se stejným id
+                    self._submissions.pop(submission_id, None)
+                    if not future.done():
+                        future.set_exception(error)
+                        # Odpojený klient výjimku nepřevezme - označit jako
+                        # převzatou, jinak ji asyncio ohlásí při úklidu
+                        future.exception()
+            else:
+                self.stats["writes"] += 1
+                self.stats["results"] += len(rows)
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server sdíleného žebříčku Arena Survival")
+    parser.add_argument("--host", default="127.0.0.1", help="adresa pro naslouchání (0.0.0.0 = celá síť)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--directory", type=Path, help="adresář databáze žebříčků (výchozí leaderboards/)")
+    parser.add_argument("--batch-delay", type=float, default=0.05, help="okno pro sloučení zápisů v sekundách")
+    args = parser.parse_args()
+
+    if args.directory is not None:
+        leaderboard.LEADERBOARDS_DIR = args.directory
+    server = LeaderboardServer(args.host, args.port, batch_delay=args.batch_delay)
+    print(f"Server žebříčku naslouchá na {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
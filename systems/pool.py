@@ -0,0 +1,87 @@
+"""
+Pool (zásobník) herních entit pro opakované použití.
+
+Místo vytváření nového objektu při každém výstřelu nebo spawnu se
+odstraněné entity vrací do poolu a při dalším požadavku se jen
+resetují. Šetří to alokace a práci garbage collectoru.
+"""
+
+
+class EntityPool:
+    """
+    Pool entit jednoho typu.
+
+    Entita musí mít metodu reset() se stejnými argumenty jako konstruktor.
+    Do poolu se vrací sama, když opustí poslední skupinu
+    (viz Entity.on_removed).
+
+    Attributes:
+        factory: Třída (nebo funkce), která vytvoří novou entitu
+        hits: Počet požadavků obsloužených recyklovanou entitou
+        misses: Počet požadavků, kdy se musela vytvořit nová entita
+        in_use: Počet entit aktuálně vydaných z poolu
+        high_water: Nejvyšší dosažený počet současně vydaných entit
+    """
+
+    def __init__(self, factory):
+        """
+        Inicializuje prázdný pool.
+
+        Args:
+            factory: Třída (nebo funkce), která vytvoří novou entitu
+        """
+        self.factory = factory
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    def preallocate(self, count, *args, **kwargs):
+        """
+        Předem vytvoří entity, aby první požadavky nemusely alokovat.
+
+        Určeno pro entity, které se při vytvoření nikam neregistrují
+        (např. projektily).
+
+        Args:
+            count: Kolik entit vytvořit
+            *args, **kwargs: Argumenty konstruktoru
+        """
+        for _ in range(count):
+            self.free.append(self.factory(*args, **kwargs))
+
+    def acquire(self, *args, **kwargs):
+        """
+        Vrátí entitu připravenou k použití (recyklovanou nebo novou).
+
+        Args:
+            *args, **kwargs: Argumenty konstruktoru / reset()
+        """
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            entity = self.factory(*args, **kwargs)
+            self.misses += 1
+        entity.pool = self
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return entity
+
+    def release(self, entity):
+        """Vrátí entitu do poolu (volá Entity.on_removed)."""
+        self.in_use -= 1
+        self.free.append(entity)
+
+    def stats(self):
+        """Vrátí slovník s počítadly poolu."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water,
+        }
@@ -0,0 +1,169 @@
+"""
+Měření času jednotlivých fází snímku (události, update, spawner,
+kolize, vykreslení, flip).
+
+Každá fáze se měří přes `time.perf_counter_ns` jako rozdíl od konce
+předchozí fáze (lap). Časy posledních `window` snímků se drží v pevném
+kruhovém bufferu, ze kterého se počítají percentily p50/p95/p99.
+Vypnutý profiler stojí jen jedno porovnání na volání.
+"""
+
+from array import array
+from pathlib import Path
+from time import perf_counter_ns
+
+# Fáze snímku v pořadí, ve kterém se měří
+PHASES = ("events", "update", "spawner", "collisions", "draw", "flip")
+
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """
+    Profiler snímků s kruhovým bufferem časů fází.
+
+    Použití v herní smyčce:
+        profiler.start_frame()
+        ...; profiler.lap("events")
+        ...; profiler.lap("update")
+        profiler.end_frame()
+
+    Attributes:
+        enabled: Zda se měří (lze přepínat za běhu)
+        phases: Názvy měřených fází
+        window: Počet posledních snímků v bufferu
+        count: Počet snímků v bufferu (nejvýše window)
+    """
+
+    def __init__(self, phases=PHASES, window=600, enabled=False):
+        """
+        Inicializuje profiler.
+
+        Args:
+            phases: Názvy fází snímku
+            window: Velikost kruhového bufferu (počet snímků)
+            enabled: Zda se má měřit od začátku
+        """
+        self.enabled = enabled
+        self.phases = tuple(phases)
+        self.window = window
+        self._index = {name: i for i, name in enumerate(self.phases)}
+        # Jeden buffer na fázi + celkový čas snímku (poslední sloupec), v ns
+        self._samples = [array("q", bytes(8 * window)) for _ in range(len(self.phases) + 1)]
+        self._current = [0] * len(self.phases)
+        self._pos = 0
+        self.count = 0
+        self._active = False
+        self._frame_start = 0
+        self._last = 0
+
+    def toggle(self):
+        """Zapne/vypne měření a vrátí nový stav."""
+        self.enabled = not self.enabled
+        self._active = False
+        return self.enabled
+
+    def reset(self):
+        """Zahodí všechny naměřené snímky."""
+        self._pos = 0
+        self.count = 0
+        self._active = False
+
+    # ------------------------------------------------------------------
+    def start_frame(self):
+        """Začne měřit nový snímek (nedokončený předchozí se zahodí)."""
+        self._active = self.enabled
+        if not self._active:
+            return
+        self._current = [0] * len(self.phases)
+        self._frame_start = self._last = perf_counter_ns()
+
+    def lap(self, phase):
+        """Připíše fázi `phase` čas od konce předchozí fáze."""
+        if not self._active:
+            return
+        now = perf_counter_ns()
+        self._current[self._index[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """Uloží časy dokončeného snímku do kruhového bufferu."""
+        if not self._active:
+            return
+        self._active = False
+        pos = self._pos
+        for i, value in enumerate(self._current):
+            self._samples[i][pos] = value
+        self._samples[-1][pos] = self._last - self._frame_start
+        self._pos = (pos + 1) % self.window
+        self.count = min(self.count + 1, self.window)
+
+    # ------------------------------------------------------------------
+    def _ordered(self, column):
+        """Vrátí vzorky sloupce od nejstaršího po nejnovější."""
+        samples = self._samples[column]
+        if self.count < self.window:
+            return samples[: self.count]
+        return samples[self._pos :] + samples[: self._pos]
+
+    def percentiles(self, phase=None):
+        """
+        Spočítá percentily času fáze.
+
+        Args:
+            phase: Název fáze, nebo None pro celý snímek
+
+        Returns:
+            Tuple (p50, p95, p99) v milisekundách; nuly, pokud nic není změřeno
+        """
+        if not self.count:
+            return tuple(0.0 for _ in PERCENTILES)
+        column = -1 if phase is None else self._index[phase]
+        values = sorted(self._samples[column][: self.count])
+        last = len(values) - 1
+        return tuple(values[min(last, p * len(values) // 100)] / 1e6 for p in PERCENTILES)
+
+    def summary(self):
+        """
+        Vrátí percentily všech fází a celého snímku.
+
+        Returns:
+            Slovník {fáze: {"p50": ms, "p95": ms, "p99": ms}}, klíč "frame"
+            obsahuje celý snímek
+        """
+        result = {}
+        for phase in self.phases + (None,):
+            values = self.percentiles(phase)
+            result[phase or "frame"] = {f"p{p}": round(v, 4) for p, v in zip(PERCENTILES, values)}
+        return result
+
+    # ------------------------------------------------------------------
+    def dump(self, path):
+        """
+        Zapíše časy snímků v bufferu do souboru (CSV nebo JSON podle přípony).
+
+        CSV má jeden řádek na snímek a sloupec na fázi (ms). JSON obsahuje
+        navíc souhrn percentilů.
+
+        Args:
+            path: Cesta k souboru (.csv nebo .json)
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = self.phases + ("frame",)
+        rows = zip(*(self._ordered(i) for i in range(len(columns))))
+        frames = [[round(ns / 1e6, 4) for ns in row] for row in rows]
+
+        if path.suffix.lower() == ".json":
+            import json
+
+            data = {"phases": list(columns), "summary": self.summary(), "frames": frames}
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        else:
+            import csv
+
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(frames)
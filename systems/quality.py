@@ -0,0 +1,96 @@
+"""
+Adaptivní snižování zátěže při přetížení (graceful degradation).
+
+Sleduje skutečnou dobu práce snímku (simulace + vykreslení, bez čekání
+na FPS). Když klouzavý průměr dlouhodobě překračuje rozpočet snímku,
+přejde na vyšší úroveň: nejdřív zpomalí spawn nepřátel, potom začne
+vykreslovat jen každý n-tý snímek. Když je rezerva, vrací se zpět.
+"""
+
+# Úrovně: (násobek intervalu spawnu, vykreslovat každý n-tý snímek)
+LEVELS = (
+    (1.0, 1),
+    (1.5, 1),
+    (1.5, 2),
+    (2.5, 2),
+    (2.5, 3),
+)
+
+
+class QualityGovernor:
+    """
+    Volí úroveň degradace podle měřené doby snímku.
+
+    Attributes:
+        budget_ms: Rozpočet na jeden snímek v ms
+        level: Aktuální index v LEVELS
+        average_ms: Klouzavý průměr doby snímku v ms
+        enabled: Zda se úroveň přizpůsobuje (vypnutý drží úroveň 0)
+    """
+
+    def __init__(self, budget_ms, enabled=True, smoothing=0.1, hold_frames=30):
+        """
+        Inicializuje regulátor.
+
+        Args:
+            budget_ms: Rozpočet na snímek v ms (1000 / cílové FPS)
+            enabled: Zda se má úroveň přizpůsobovat
+            smoothing: Váha nového snímku v klouzavém průměru
+            hold_frames: Kolik snímků po změně úrovně se úroveň nemění
+        """
+        self.budget_ms = budget_ms
+        self.enabled = enabled
+        self.smoothing = smoothing
+        self.hold_frames = hold_frames
+        self.level = 0
+        self.average_ms = 0.0
+        self._hold = hold_frames
+        self._frame = 0
+
+    @property
+    def spawn_multiplier(self):
+        """Násobek intervalu spawnu nepřátel (1.0 = beze změny)."""
+        return LEVELS[self.level][0]
+
+    @property
+    def render_every(self):
+        """Vykreslovat jen každý n-tý snímek."""
+        return LEVELS[self.level][1]
+
+    def reset(self):
+        """Vrátí plnou kvalitu (např. na začátku nové hry)."""
+        self.level = 0
+        self.average_ms = 0.0
+        self._hold = self.hold_frames
+        self._frame = 0
+
+    def should_render(self):
+        """Vrátí True, pokud se má aktuální snímek vykreslit."""
+        self._frame += 1
+        return self._frame % self.render_every == 0
+
+    def record(self, frame_ms):
+        """
+        Započítá dobu práce snímku a případně změní úroveň.
+
+        Args:
+            frame_ms: Doba simulace a vykreslení snímku v ms
+
+        Returns:
+            True, pokud se úroveň změnila
+        """
+        if not self.enabled:
+            return False
+        self.average_ms += (frame_ms - self.average_ms) * self.smoothing
+        if self._hold > 0:
+            self._hold -= 1
+            return False
+
+        if self.average_ms > self.budget_ms * 0.9 and self.level < len(LEVELS) - 1:
+            self.level += 1
+        elif self.average_ms < self.budget_ms * 0.5 and self.level > 0:
+            self.level -= 1
+        else:
+            return False
+        self._hold = self.hold_frames
+        return True
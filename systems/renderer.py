@@ -0,0 +1,74 @@
+"""
+Vykreslování herní scény metodou špinavých obdélníků (dirty rects).
+
+Místo vyplnění celé obrazovky a `pygame.display.flip()` každý snímek
+se překreslí jen oblasti, kde se sprite nebo text změnil, a na displej
+se pošlou jen tyto obdélníky přes `pygame.display.update(rects)`.
+"""
+
+import pygame
+
+
+class DirtyRenderer:
+    """
+    Renderer, který aktualizuje jen změněné oblasti obrazovky.
+
+    Skupina entit musí být `RenderGroup` - ta si pamatuje, kde byla každá
+    entita vykreslena minule, a vrací seznam změněných oblastí.
+
+    Attributes:
+        background: Surface s předkresleným pozadím (cache)
+        full_redraw: True, pokud se má příští snímek překreslit celý
+        overlay_rects: Oblasti textů (HUD) vykreslených v minulém snímku
+    """
+
+    def __init__(self, size, bg_color=(30, 30, 30)):
+        """
+        Inicializuje renderer.
+
+        Args:
+            size: Tuple (width, height) - velikost obrazovky
+            bg_color: Barva pozadí herní scény
+        """
+        self.background = pygame.Surface(size)
+        self.background.fill(bg_color)
+        self.full_redraw = True
+        self.overlay_rects = []
+
+    def invalidate(self):
+        """Vynutí překreslení celé obrazovky (např. po návratu z menu)."""
+        self.full_redraw = True
+
+    def render(self, screen, sprites, draw_overlay, profiler=None):
+        """
+        Vykreslí snímek a aktualizuje jen změněné oblasti displeje.
+
+        Args:
+            screen: Surface obrazovky
+            sprites: RenderGroup se všemi entitami scény
+            draw_overlay: Funkce draw_overlay() -> seznam Rect, která
+                vykreslí texty nad scénou (HUD, munice)
+            profiler: FrameProfiler pro měření fází "draw" a "flip" (volitelné)
+        """
+        background = self.background
+        if self.full_redraw:
+            screen.blit(background, (0, 0))
+        else:
+            # Smazání sprite a textů z minulého snímku pozadím z cache
+            sprites.clear(screen, background)
+            for rect in self.overlay_rects:
+                screen.blit(background, rect, rect)
+
+        dirty = sprites.draw(screen)
+        overlay = draw_overlay()
+        if profiler is not None:
+            profiler.lap("draw")
+
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(dirty + self.overlay_rects + overlay)
+        self.overlay_rects = overlay
+        if profiler is not None:
+            profiler.lap("flip")
@@ -0,0 +1,180 @@
+"""
+Záznam a přehrávání vstupů hráče (replay).
+
+Záznam obsahuje seed generátoru náhodných čísel, obtížnost, jméno
+hráče, nastavení ovlivňující simulaci (rozměry arény, spawn, limity
+entit, velikosti nepřátel) a pro každý simulační krok jeho dt a vstupy (WASD, pozice myši,
+počet výstřelů). Protože spawner používá generátor se stejným seedem
+a hra počítá čas ze součtu dt, přehrání záznamu přes `Game.step` dá
+bitově stejné skóre, počet výstřelů i dobu hry - a to bez okna
+a mnohem rychleji než v reálném čase.
+
+Formát souboru (little-endian):
+    hlavička: b"ARPL", verze (B), seed (Q), délka obtížnosti (B) + UTF-8,
+              délka jména (B) + UTF-8, délka konfigurace (H) + JSON (UTF-8)
+    krok:     dt (d), klávesy (B, bity W/S/A/D), myš x (h), myš y (h),
+              výstřely (B) - 14 bajtů
+"""
+
+import json
+import struct
+from pathlib import Path
+
+from systems.config import GameConfig
+from systems.inputs import InputState
+
+REPLAYS_DIR = Path("replays")
+MAGIC = b"ARPL"
+VERSION = 2
+
+# Klíče GameConfig, na kterých závisí průběh simulace (ukládají se do hlavičky)
+CONFIG_KEYS = ("width", "height", "spawn_interval", "max_enemies", "max_bullets", "enemy_sizes")
+
+_HEADER = struct.Struct("<4sBQ")
+_TICK = struct.Struct("<dBhhB")
+
+# Bity kláves v záznamu kroku
+_UP, _DOWN, _LEFT, _RIGHT = 1, 2, 4, 8
+
+
+def _write_text(stream, text):
+    data = text.encode("utf-8")[:255]
+    stream.write(struct.pack("<B", len(data)) + data)
+
+
+def _read_text(stream):
+    (length,) = struct.unpack("<B", stream.read(1))
+    return stream.read(length).decode("utf-8")
+
+
+def _write_config(stream, config):
+    data = config.to_dict()
+    text = json.dumps({key: data[key] for key in CONFIG_KEYS}, ensure_ascii=False)
+    encoded = text.encode("utf-8")
+    stream.write(struct.pack("<H", len(encoded)) + encoded)
+
+
+def _read_config(stream):
+    (length,) = struct.unpack("<H", stream.read(2))
+    return GameConfig(**json.loads(stream.read(length).decode("utf-8")))
+
+
+class InputRecorder:
+    """
+    Zapisuje vstupy hráče po krocích do binárního souboru.
+
+    Attributes:
+        path: Cesta k souboru záznamu
+        ticks: Počet zaznamenaných kroků
+    """
+
+    def __init__(self, path, seed, difficulty, player_name, config):
+        """
+        Otevře soubor a zapíše hlavičku záznamu.
+
+        Args:
+            path: Cesta k souboru záznamu
+            seed: Seed generátoru náhodných čísel hry
+            difficulty: Název obtížnosti
+            player_name: Jméno hráče
+            config: GameConfig nahrávané hry
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, seed))
+        _write_text(self._file, difficulty)
+        _write_text(self._file, player_name)
+        _write_config(self._file, config)
+        self.ticks = 0
+
+    def record(self, dt, inputs):
+        """
+        Zapíše jeden krok simulace.
+
+        Args:
+            dt: Délka kroku v sekundách
+            inputs: InputState použitý v tomto kroku
+        """
+        keys = (
+            (_UP if inputs.up else 0)
+            | (_DOWN if inputs.down else 0)
+            | (_LEFT if inputs.left else 0)
+            | (_RIGHT if inputs.right else 0)
+        )
+        x, y = inputs.mouse_pos
+        self._file.write(_TICK.pack(dt, keys, int(x), int(y), min(int(inputs.shoot), 255)))
+        self.ticks += 1
+
+    def close(self):
+        """Dopíše a zavře soubor záznamu."""
+        if not self._file.closed:
+            self._file.close()
+
+
+def load_replay(path):
+    """
+    Načte záznam ze souboru.
+
+    Args:
+        path: Cesta k souboru záznamu
+
+    Returns:
+        Tuple (seed, difficulty, player_name, config, ticks), kde config je
+        GameConfig nahrané hry a ticks seznam dvojic (dt, InputState)
+
+    Raises:
+        ValueError: Pokud soubor není platný záznam
+    """
+    with open(path, "rb") as f:
+        magic, version, seed = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} není záznam Arena Survival (verze {VERSION})")
+        difficulty = _read_text(f)
+        player_name = _read_text(f)
+        config = _read_config(f)
+        data = f.read()
+
+    ticks = []
+    for dt, keys, x, y, shots in _TICK.iter_unpack(data[: len(data) - len(data) % _TICK.size]):
+        inputs = InputState(
+            up=bool(keys & _UP),
+            down=bool(keys & _DOWN),
+            left=bool(keys & _LEFT),
+            right=bool(keys & _RIGHT),
+            mouse_pos=(x, y),
+            shoot=shots,
+        )
+        ticks.append((dt, inputs))
+    return seed, difficulty, player_name, config, ticks
+
+
+def replay(path, game=None):
+    """
+    Přehraje záznam v headless hře a vrátí výsledek.
+
+    Args:
+        path: Cesta k souboru záznamu
+        game: Headless Game pro přehrání (None = vytvoří se nová s konfigurací
+            ze záznamu)
+
+    Returns:
+        Slovník výsledku (viz Game.current_result)
+
+    Raises:
+        ValueError: Předaná hra má jinou konfiguraci simulace než záznam
+    """
+    seed, difficulty, player_name, config, ticks = load_replay(path)
+    if game is None:
+        from game import Game
+
+        game = Game(headless=True, config=config)
+    else:
+        recorded, current = config.to_dict(), game.config.to_dict()
+        if any(recorded[key] != current[key] for key in CONFIG_KEYS):
+            raise ValueError(f"{path}: hra má jinou konfiguraci, než se kterou byl záznam pořízen")
+    game.start_simulation(player_name=player_name, difficulty=difficulty, seed=seed)
+    for dt, inputs in ticks:
+        if not game.step(dt, inputs):
+            break
+    return game.last_result if game.state == "game_over" else game.current_result()
@@ -0,0 +1,165 @@
+"""
+Zápis výsledků do žebříčku na pozadí.
+
+Uložení výsledku při game over nesmí zdržet herní smyčku, proto se
+výsledky jen vloží do omezené fronty a do databáze je zapisuje
+samostatné vlákno. Více čekajících výsledků se zapíše najednou
+v jedné transakci.
+
+Když sdílený server žebříčku neodpovídá, dávka se neztratí: writer ji
+drží a každých retry_interval sekund ji zkusí odeslat znovu se stejným
+id (server ji tak uloží jen jednou). Co se do ukončení odeslat nepodaří,
+uloží se do lokální databáze.
+"""
+
+import queue
+import threading
+import uuid
+
+from systems.leaderboard import save_results, save_results_local
+
+# Značka pro ukončení vlákna
+_STOP = object()
+
+
+class ResultWriter:
+    """
+    Vlákno, které ukládá výsledky mimo herní smyčku.
+
+    Attributes:
+        max_pending: Kapacita fronty čekajících výsledků
+        retry_interval: Po kolika sekundách znovu odeslat dávky, které
+            server nepřijal
+        written: Počet úspěšně uložených výsledků
+        batches: Počet provedených zápisů (transakcí)
+        saved_locally: Počet výsledků uložených při ukončení do záložního
+            úložiště, protože je server nepřijal
+        failed: Počet výsledků, které se nepodařilo uložit
+        last_error: Poslední výjimka při zápisu (nebo None)
+    """
+
+    def __init__(
+        self, max_pending=64, save_batch=save_results, fallback=save_results_local, retry_interval=5.0
+    ):
+        """
+        Inicializuje writer (vlákno se spustí až s prvním výsledkem).
+
+        Args:
+            max_pending: Kapacita fronty čekajících výsledků
+            save_batch: Funkce save_batch(results, submission_id), která
+                uloží seznam výsledků najednou
+            fallback: Funkce fallback(results) pro dávky, které se do
+                ukončení nepodařilo odeslat (None = zahodit je jako chybu)
+            retry_interval: Viz Attributes
+        """
+        self.max_pending = max_pending
+        self.retry_interval = retry_interval
+        self._save_batch = save_batch
+        self._fallback = fallback
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = None
+        # Dávky odmítnuté kvůli nedostupnému serveru: [(id odeslání, výsledky)]
+        self._unsent = []
+        self.written = 0
+        self.batches = 0
+        self.saved_locally = 0
+        self.failed = 0
+        self.last_error = None
+
+    @property
+    def unsent(self):
+        """Počet výsledků, které čekají na opakované odeslání na server."""
+        return sum(len(results) for _, results in list(self._unsent))
+
+    def submit(self, *result):
+        """
+        Zařadí výsledek k uložení a hned se vrátí.
+
+        Args:
+            *result: Argumenty ve stejném pořadí jako save_result()
+
+        Pokud je fronta plná, počká, až writer část výsledků zapíše.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="result-writer", daemon=True
+            )
+            self._thread.start()
+        self._queue.put(result)
+
+    def flush(self):
+        """
+        Počká, dokud writer nezpracuje všechny zařazené výsledky.
+
+        Výsledky, které server nepřijal, zůstanou v `unsent` a odešlou se později.
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Uloží zbývající výsledky (neodeslané do záložního úložiště) a ukončí vlákno."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Hlavní smyčka vlákna: sbírá výsledky z fronty a ukládá je po dávkách."""
+        while True:
+            # S neodeslanými dávkami se vlákno pravidelně probouzí k dalšímu pokusu
+            timeout = self.retry_interval if self._unsent else None
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            # Přibereme vše, co mezitím čeká, a zapíšeme to jednou transakcí
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is _STOP for item in batch)
+            results = [item for item in batch if item is not _STOP]
+            try:
+                if results:  # Samotná značka konce není dávka k zápisu
+                    self._unsent.append((uuid.uuid4().hex, results))
+                self._send_unsent()
+                if stop:
+                    self._save_unsent_locally()
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _send_unsent(self):
+        """Uloží čekající dávky v pořadí; při nedostupném serveru je ponechá na později."""
+        while self._unsent:
+            submission_id, results = self._unsent[0]
+            try:
+                self._save_batch(results, submission_id)
+            except ConnectionError as error:
+                self.last_error = error
+                return
+            except Exception as error:  # Chyba zápisu nesmí shodit vlákno
+                self.failed += len(results)
+                self.last_error = error
+            else:
+                self.written += len(results)
+                self.batches += 1
+            self._unsent.pop(0)
+
+    def _save_unsent_locally(self):
+        """Při ukončení uloží dávky, které server nepřijal, do záložního úložiště."""
+        unsent, self._unsent = self._unsent, []
+        for _, results in unsent:
+            try:
+                if self._fallback is None:
+                    raise ConnectionError("Výsledky se nepodařilo odeslat na server")
+                self._fallback(results)
+                self.saved_locally += len(results)
+            except Exception as error:
+                self.failed += len(results)
+                self.last_error = error
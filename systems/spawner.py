@@ -5,10 +5,6 @@ Pravidelně vytváří nové nepřátele na náhodných pozicích
 na okrajích herní obrazovky.
 """
 
-import random
-from entities.enemy import Enemy
-from settings import SPAWN_INTERVAL, WIDTH, HEIGHT
-
 class Spawner:
     """
     Systém pro automatické generování nepřátel.
@@ -38,14 +34,17 @@ class Spawner:
         Args:
             dt: Delta time v sekundách
             
-        Každých SPAWN_INTERVAL sekund vytvoří nového nepřítele.
+        Každých `Game.spawn_interval()` sekund vytvoří nového nepřítele,
+        pokud není dosažen limit živých nepřátel (config.max_enemies).
         """
         self.timer += dt
         
         # Pokud uplynul spawn interval, vytvořit nepřítele
-        if self.timer >= SPAWN_INTERVAL:
+        if self.timer >= self.game.spawn_interval():
             self.timer = 0  # Reset časovače
-            self.spawn_enemy()
+            limit = self.game.config.max_enemies
+            if limit is None or len(self.game.enemies) < limit:
+                self.spawn_enemy()
 
     def spawn_enemy(self):
         """
@@ -54,24 +53,28 @@ class Spawner:
         Náhodně vybere jednu ze čtyř stran obrazovky a umístí
         nepřítele na náhodnou pozici na této straně.
         """
+        # Generátor hry - se stejným seedem dává stejné pozice (replay)
+        rng = self.game.rng
+        width, height = self.game.config.size
+
         # Náhodný výběr strany obrazovky
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = rng.choice(["top", "bottom", "left", "right"])
 
         # Určení pozice podle vybrané strany
         if side == "top":
             # Horní okraj - náhodná X pozice, Y = 0
-            pos = (random.randint(0, WIDTH), 0)
+            pos = (rng.randint(0, width), 0)
         elif side == "bottom":
             # Dolní okraj - náhodná X pozice, Y = výška obrazovky
-            pos = (random.randint(0, WIDTH), HEIGHT)
+            pos = (rng.randint(0, width), height)
         elif side == "left":
             # Levý okraj - X = 0, náhodná Y pozice
-            pos = (0, random.randint(0, HEIGHT))
+            pos = (0, rng.randint(0, height))
         else:  # right
             # Pravý okraj - X = šířka obrazovky, náhodná Y pozice
-            pos = (WIDTH, random.randint(0, HEIGHT))
+            pos = (width, rng.randint(0, height))
 
-        # Vytvoření nepřítele a přidání do sprite skupin
-        enemy = Enemy(self.game, pos, size=self.game.get_enemy_size())
+        # Vytvoření nepřítele a přidání do skupin
+        enemy = self.game.enemy_pool.acquire(self.game, pos, size=self.game.get_enemy_size())
         self.game.enemies.add(enemy)
         self.game.all_sprites.add(enemy)
@@ -0,0 +1,87 @@
+"""Testy proudové analýzy výsledků (systems.analytics)."""
+
+import json
+
+import pytest
+
+from systems import analytics
+from systems.archive import ResultArchive
+
+START = "2026-01-02T03:04:05"
+RESULTS = [
+    ("Lama", "Alice", 5, 10, 50, 1200, START),
+    ("Superman", "Bob", 7, 7, 100, 900, START),
+    ("Lama", "Bob", 1, 4, 25, 3000, START),
+    ("Machr", "Alice", 3, 3, 100, 600, START),
+]
+
+
+def _archive(tmp_path):
+    path = tmp_path / "archive.bin"
+    with ResultArchive(path, writable=True) as archive:
+        archive.extend(RESULTS)
+    return path
+
+
+def test_archive_results_are_read_in_one_pass(tmp_path):
+    results = list(analytics.iter_archive_results(_archive(tmp_path)))
+
+    assert [(r["difficulty"], r["name"]) for r in results] == [(r[0], r[1]) for r in RESULTS]
+
+
+def test_player_breakdown_is_optional(tmp_path):
+    path = _archive(tmp_path)
+    for use_numpy in {False, analytics.is_available()}:
+        full = analytics.analyze_archive(path, use_numpy=use_numpy).summary()
+        lean = analytics.analyze_archive(path, use_numpy=use_numpy, track_players=False).summary()
+
+        assert full["all"]["players"]["Bob"]["games"] == 2
+        assert lean["all"]["players"] is None
+        for difficulty in full:
+            lean[difficulty].pop("players")
+            full[difficulty].pop("players")
+        assert lean == full
+
+
+def _json_leaderboard(tmp_path, count, corrupt_at=None):
+    rows = []
+    for i in range(count):
+        row = json.dumps({"name": f"hráč \"{i}\"", "score": i, "accuracy": i / 7, "ok": True})
+        rows.append('{"name": "x", "score": 1,, "ok": true}' if i == corrupt_at else row)
+    path = tmp_path / "lama.json"
+    path.write_text("[\n  " + ",\n  ".join(rows) + "\n]\n", encoding="utf-8")
+    return path
+
+
+def test_json_elements_split_between_blocks(tmp_path):
+    path = _json_leaderboard(tmp_path, 200)
+    expected = json.loads(path.read_text(encoding="utf-8"))
+    for read_size in (7, 16, 61, 1000):
+        assert list(analytics.iter_json_results(path, read_size=read_size)) == expected
+
+
+def test_corrupt_json_element_fails_without_reading_rest(tmp_path, monkeypatch):
+    path = _json_leaderboard(tmp_path, 5000, corrupt_at=100)
+    reads = []
+
+    class CountingFile:
+        def __init__(self, f):
+            self.f = f
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.f.close()
+
+        def read(self, size):
+            reads.append(size)
+            return self.f.read(size)
+
+    monkeypatch.setattr(analytics, "open", lambda *args, **kwargs: CountingFile(open(*args, **kwargs)), raising=False)
+    results = analytics.iter_json_results(path, read_size=256)
+    for i in range(100):
+        assert next(results)["score"] == i
+    with pytest.raises(ValueError):
+        next(results)
+    assert sum(reads) < path.stat().st_size / 10
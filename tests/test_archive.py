@@ -0,0 +1,35 @@
+"""Testy binárního archivu výsledků (systems.archive)."""
+
+import json
+
+import pytest
+
+from systems.archive import ResultArchive
+
+START = "2026-01-02T03:04:05.000006"
+
+
+def test_export_json_skips_empty_difficulties(tmp_path):
+    with ResultArchive(tmp_path / "archive.bin", writable=True) as archive:
+        archive.extend([
+            ("Lama", "Alice", 5, 10, 50, 1200, START),
+            ("Lama", "Bob", 7, 7, 100, 900, START),
+        ])
+        counts = archive.export_json(tmp_path / "export")
+
+    assert counts == {"Lama": 2, "Machr": 0, "Superman": 0}
+    assert sorted(path.name for path in (tmp_path / "export").iterdir()) == ["lama.json"]
+    exported = json.loads((tmp_path / "export" / "lama.json").read_text("utf-8"))
+    assert [result["name"] for result in exported] == ["Alice", "Bob"]
+
+
+def test_export_json_refuses_to_overwrite(tmp_path):
+    existing = tmp_path / "machr.json"
+    existing.write_text("[]", encoding="utf-8")
+    with ResultArchive(tmp_path / "archive.bin", writable=True) as archive:
+        archive.append("Lama", "Alice", 5, 10, 50, 1200, START)
+        with pytest.raises(FileExistsError):
+            archive.export_json(tmp_path)
+
+    assert existing.read_text("utf-8") == "[]"
+    assert not (tmp_path / "lama.json").exists()
@@ -0,0 +1,18 @@
+"""Testy bota pro headless simulace (systems.bot)."""
+
+import pytest
+
+from game import Game
+from systems.bot import DodgeBot
+
+
+@pytest.mark.parametrize("difficulty", ["Lama", "Superman"])
+def test_bot_shoots_and_scores(difficulty):
+    game = Game(headless=True)
+    game.persist_results = False
+    game.start_simulation(player_name="bot", difficulty=difficulty, seed=3)
+    game.simulate(60, dt=1 / 60, policy=DodgeBot(3))
+
+    result = game.last_result if game.state == "game_over" else game.current_result()
+    assert result["shoots"] > 0
+    assert result["score"] > 0
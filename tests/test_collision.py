@@ -0,0 +1,241 @@
+"""Testy prostorového hashe (systems.collision) proti párovému colliderect."""
+
+import random
+
+import pygame
+import pytest
+
+from systems.collision import SpatialHash
+
+CELL = 64
+
+
+class Box:
+    """Minimální objekt s rectem pro vložení do hashe."""
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+
+    def __repr__(self):
+        return f"Box({tuple(self.rect)})"
+
+
+def _random_boxes(rng, count):
+    """Obdélníky na mřížce po 8 px - časté dotyky hran i hranic buněk."""
+    boxes = []
+    for _ in range(count):
+        width = rng.choice((8, 16, 22, 30, CELL, CELL + 8, 2 * CELL + 16))
+        height = rng.choice((8, 16, 22, 30, CELL, CELL + 8, 2 * CELL + 16))
+        boxes.append(Box((rng.randrange(-8, 50) * 8, rng.randrange(-8, 50) * 8, width, height)))
+    return boxes
+
+
+def _pairwise_colliding(boxes):
+    return {a for a in boxes for b in boxes if a is not b and a.rect.colliderect(b.rect)}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_hash_matches_pairwise_colliderect(seed):
+    rng = random.Random(seed)
+    boxes = _random_boxes(rng, 60)
+    grid = SpatialHash(CELL)
+    grid.build(boxes)
+
+    assert grid.colliding() == _pairwise_colliding(boxes)
+    for probe in _random_boxes(rng, 40):
+        hits = grid.query(probe.rect)
+        assert len(hits) == len(set(hits))
+        assert set(hits) == {box for box in boxes if probe.rect.colliderect(box.rect)}
+
+
+def test_build_from_bounds_matches_build():
+    rng = random.Random(7)
+    boxes = _random_boxes(rng, 80)
+    by_rect = SpatialHash(CELL)
+    by_rect.build(boxes)
+    by_bounds = SpatialHash(CELL)
+    by_bounds.build_from_bounds(
+        boxes,
+        [b.rect.left for b in boxes], [b.rect.top for b in boxes],
+        [b.rect.right for b in boxes], [b.rect.bottom for b in boxes],
+    )
+
+    assert by_bounds.colliding() == by_rect.colliding()
+    for probe in _random_boxes(rng, 40):
+        assert set(by_bounds.query(probe.rect)) == set(by_rect.query(probe.rect))
+
+
+def test_colliding_ignores_excluded_objects():
+    rng = random.Random(11)
+    boxes = _random_boxes(rng, 60)
+    grid = SpatialHash(CELL)
+    grid.build(boxes)
+    excluded = set(rng.sample(boxes, 20))
+    remaining = [box for box in boxes if box not in excluded]
+
+    assert grid.colliding(exclude=excluded) == _pairwise_colliding(remaining)
+
+
+def test_touching_edges_do_not_collide():
+    left = Box((0, 0, CELL, CELL))       # Končí přesně na hranici buňky
+    right = Box((CELL, 0, CELL, CELL))
+    below = Box((0, CELL, CELL, CELL))
+    wide = Box((-10, 2 * CELL, 3 * CELL, 8))  # Přes několik buněk, nikoho nepřekrývá
+    grid = SpatialHash(CELL)
+    grid.build([left, right, below, wide])
+
+    assert grid.colliding() == set()
+    assert set(grid.query(pygame.Rect(CELL - 1, CELL - 1, 2, 2))) == {left, right, below}
+    assert grid.query(pygame.Rect(CELL, CELL, 0, 5)) == []
+
+
+def test_rect_spanning_several_cells_is_reported_once():
+    big = Box((10, 10, 3 * CELL, 3 * CELL))
+    small = Box((2 * CELL + 5, 2 * CELL + 5, 8, 8))
+    grid = SpatialHash(CELL)
+    grid.build([big, small])
+
+    assert grid.colliding() == {big, small}
+    assert grid.query(pygame.Rect(0, 0, 4 * CELL, 4 * CELL)).count(big) == 1
+
+
+# --- Průběžná kolize projektilů (SpatialHash.sweep) ---
+
+BULLET_HALF = 5  # Projektil 10x10
+
+
+def _enemy(center, size=22):
+    box = Box((0, 0, size, size))
+    box.rect.center = center
+    return box
+
+
+def _sweep(enemies, x0, y0, x1, y1):
+    grid = SpatialHash(CELL)
+    grid.build(enemies)
+    bullet = object()
+    results = grid.sweep([(bullet, x0, y0, x1, y1, BULLET_HALF, BULLET_HALF)])
+    return results[0][1] if results else []
+
+
+def test_fast_bullet_cannot_skip_small_enemy():
+    enemy = _enemy((100, 100))
+    # Za jeden krok projektil přeletí celého nepřítele - začátek i konec mimo
+    end = pygame.Rect(0, 0, 10, 10)
+    end.center = (160, 100)
+    assert not end.colliderect(enemy.rect)
+
+    assert _sweep([enemy], 40, 100, 160, 100) == [enemy]
+    assert _sweep([enemy], 160, 160, 40, 40) == [enemy]  # Šikmo a pozpátku
+
+
+def test_grazing_path_matches_colliderect():
+    enemy = _enemy((100, 100))  # top = 89, bottom = 111
+    # Hrana projektilu jen klouže po hraně nepřítele - colliderect nehlásí nic
+    assert _sweep([enemy], 0, 84, 200, 84) == []
+    assert _sweep([enemy], 0, 116, 200, 116) == []
+    assert _sweep([enemy], 84, 0, 84, 200) == []
+    assert _sweep([enemy], 84.5, 0, 84.5, 200) == [enemy]
+    # Dráha končí přesně v dotyku s levou hranou
+    assert _sweep([enemy], 0, 100, 84, 100) == []
+
+
+def test_zero_length_components():
+    enemy = _enemy((100, 100))
+    assert _sweep([enemy], 100, 0, 100, 200) == [enemy]   # dx == 0
+    assert _sweep([enemy], 0, 100, 200, 100) == [enemy]   # dy == 0
+    assert _sweep([enemy], 200, 0, 200, 200) == []
+    # Stojící projektil se chová jako obyčejný dotaz na rect
+    assert _sweep([enemy], 100, 100, 100, 100) == [enemy]
+    assert _sweep([enemy], 84, 100, 84, 100) == []
+
+
+def test_earliest_hit_wins():
+    near, middle, far = _enemy((60, 100)), _enemy((120, 100)), _enemy((180, 100))
+    assert _sweep([far, near, middle], 0, 100, 240, 100) == [near]
+    assert _sweep([far, near, middle], 240, 100, 0, 100) == [far]
+    # Dva nepřátelé zasažení ve stejném okamžiku se hlásí oba
+    upper, lower = _enemy((120, 90)), _enemy((120, 112))
+    assert set(_sweep([upper, lower], 0, 100, 240, 100)) == {upper, lower}
+
+
+def _overlaps(enemy, x, y):
+    """Překrývá rect projektilu se středem (x, y) nepřítele? (jako colliderect)"""
+    rect = enemy.rect
+    return (
+        rect.left - BULLET_HALF < x < rect.right + BULLET_HALF
+        and rect.top - BULLET_HALF < y < rect.bottom + BULLET_HALF
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_sweep_matches_sampled_path(seed):
+    rng = random.Random(seed)
+    enemies = [_enemy((rng.randrange(0, 400), rng.randrange(0, 400)), rng.choice((18, 22, 30))) for _ in range(30)]
+    grid = SpatialHash(CELL)
+    grid.build(enemies)
+    for _ in range(100):
+        x0, y0 = rng.randrange(0, 400), rng.randrange(0, 400)
+        x1, y1 = x0 + rng.randrange(-60, 61), y0 + rng.randrange(-60, 61)
+        # Nepřátelé, které rect projektilu překryje kdekoli na dráze (vzorkováno)
+        path = pygame.Rect(min(x0, x1), min(y0, y1), abs(x1 - x0) + 1, abs(y1 - y0) + 1).inflate(50, 50)
+        nearby = [e for e in enemies if path.colliderect(e.rect)]
+        touched = set()
+        for i in range(1001):
+            t = i / 1000
+            x, y = x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+            touched.update(e for e in nearby if _overlaps(e, x, y))
+        results = grid.sweep([(None, x0, y0, x1, y1, BULLET_HALF, BULLET_HALF)])
+        hits = set(results[0][1]) if results else set()
+
+        assert bool(hits) == bool(touched)
+        assert hits <= touched
+
+
+def _game_with_bullet_over_enemy(start, end):
+    """Hra s jedním nepřítelem 22x22 na (100, 100) a projektilem letícím ze start do end."""
+    from game import Game
+
+    game = Game(headless=True)
+    game.start_simulation(player_name="bot", seed=1)
+    game.begin_game()
+    enemy = game.enemy_pool.acquire(game, (100, 100), size=(22, 22))
+    game.enemies.add(enemy)
+    game.all_sprites.add(enemy)
+    bullet = game.bullet_pool.acquire(game, start, pygame.Vector2(1, 0))
+    bullet.pos.update(end)
+    bullet.rect.center = bullet.pos
+    game.bullets.add(bullet)
+    game.all_sprites.add(bullet)
+    return game, enemy, bullet
+
+
+@pytest.mark.parametrize("mode, skipped_hit", [("swept", True), ("discrete", False)])
+def test_bullet_collision_modes(monkeypatch, mode, skipped_hit):
+    import game as game_module
+
+    monkeypatch.setattr(game_module, "BULLET_COLLISION", mode)
+
+    # Konec dráhy na nepříteli zasahuje v obou režimech
+    game, enemy, bullet = _game_with_bullet_over_enemy((70, 100), (95, 100))
+    game.handle_collisions()
+    assert not enemy.alive() and not bullet.alive() and game.score == 1
+
+    # Přeskok nepřítele za jeden krok zachytí jen průběžná kolize;
+    # "discrete" testuje jen koncovou pozici jako dřív
+    game, enemy, bullet = _game_with_bullet_over_enemy((40, 100), (160, 100))
+    game.handle_collisions()
+    assert enemy.alive() is not skipped_hit
+    assert bullet.alive() is not skipped_hit
+    assert game.score == int(skipped_hit)
+
+
+def test_enemy_killed_by_bullet_does_not_collide_with_neighbour():
+    game, enemy, bullet = _game_with_bullet_over_enemy((70, 100), (95, 100))
+    neighbour = game.enemy_pool.acquire(game, (115, 100), size=(22, 22))  # Překrývá zasaženého
+    game.enemies.add(neighbour)
+    game.all_sprites.add(neighbour)
+    game.handle_collisions()
+
+    assert not enemy.alive() and neighbour.alive()
+    assert game.score == 1
@@ -0,0 +1,81 @@
+"""Testy vektorového úložiště nepřátel (systems.entity_store) proti Enemy.update."""
+
+import random
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from entities.enemy import Enemy
+from settings import ENEMY_SPEED
+
+entity_store = pytest.importorskip("systems.entity_store")
+if not entity_store.is_available():
+    pytest.skip("NumPy není nainstalované", allow_module_level=True)
+
+
+def _enemies(store, seed=3, count=50):
+    """Stejná sada nepřátel jednou jako objekty a jednou v úložišti."""
+    rng = random.Random(seed)
+    player = SimpleNamespace(pos=pygame.Vector2(400, 300))
+    plain = SimpleNamespace(enemy_store=None, player=player)
+    stored = SimpleNamespace(enemy_store=store, player=player)
+    objects, rows = [], []
+    for _ in range(count):
+        pos = (rng.uniform(-200, 1000), rng.uniform(-200, 800))
+        size = (rng.choice((18, 22, 30, 31)),) * 2
+        objects.append(Enemy(plain, pos, size))
+        rows.append(Enemy(stored, pos, size))
+    # Nepřítel přímo na pozici hráče se nehýbe (nulový směr)
+    objects.append(Enemy(plain, player.pos, (22, 22)))
+    rows.append(Enemy(stored, player.pos, (22, 22)))
+    return player, objects, rows
+
+
+def test_step_and_bounds_match_enemy_update():
+    store = entity_store.EnemyStore(capacity=4)  # Vynutí i zvětšování polí
+    player, objects, rows = _enemies(store)
+    dt = 1 / 120
+    for tick in range(600):
+        if tick and tick % 50 == 0:
+            player.pos.update(tick % 800, (tick * 7) % 600)  # Cíl se přesouvá
+        for enemy in objects:
+            enemy.update(dt)
+        store.step(player.pos, dt)
+
+        for enemy, row in zip(objects, rows):
+            assert tuple(row.pos) == pytest.approx(tuple(enemy.pos), abs=1e-9)
+    lefts, tops, rights, bottoms = store.bounds()
+    for enemy, row in zip(objects, rows):
+        index = row.store_index
+        bounds = (lefts[index], tops[index], rights[index], bottoms[index])
+        assert bounds == (enemy.rect.left, enemy.rect.top, enemy.rect.right, enemy.rect.bottom)
+
+
+def test_removal_keeps_rows_consistent():
+    store = entity_store.EnemyStore()
+    _, _, rows = _enemies(store, count=10)
+    positions = {row: pygame.Vector2(row.pos) for row in rows}
+    for row in rows[::3]:
+        row.on_removed()
+
+    assert len(store) == len(rows) - len(rows[::3])
+    for row in rows:
+        if row in rows[::3]:
+            assert row.store_index is None
+        else:
+            assert store.sprites[row.store_index] is row
+            assert row.pos == positions[row]
+
+
+def test_enemy_update_moves_in_place():
+    player = SimpleNamespace(pos=pygame.Vector2(0, 0))
+    enemy = Enemy(SimpleNamespace(enemy_store=None, player=player), (100, 0))
+    pos = enemy.pos
+    enemy.update(0.5)
+
+    assert enemy.pos is pos
+    assert pos == pygame.Vector2(100 - ENEMY_SPEED * 0.5, 0)
+    assert enemy.rect.center == (50, 0)
+    enemy.pos = (10, 20)
+    assert enemy.pos is pos and tuple(pos) == (10, 20)
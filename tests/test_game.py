@@ -0,0 +1,33 @@
+"""Testy třídy Game (headless režim)."""
+
+import os
+
+import pygame
+
+from game import Game
+
+
+def test_headless_game_leaves_display_alone():
+    pygame.display.init()
+    window = pygame.display.set_mode((320, 240))
+    driver = os.environ.get("SDL_VIDEODRIVER")
+
+    game = Game(headless=True)
+    game.start_simulation(player_name="bot", seed=1)
+    game.simulate(1.0)
+
+    assert pygame.display.get_init()
+    assert pygame.display.get_surface() is window
+    assert game.screen is not window
+    assert game.screen.get_size() == game.config.size
+    assert os.environ.get("SDL_VIDEODRIVER") == driver
+
+
+def test_headless_game_needs_no_display():
+    pygame.display.quit()
+    game = Game(headless=True)
+    game.start_simulation(player_name="bot", seed=1)
+    game.simulate(1.0)
+
+    assert not pygame.display.get_init()
+    assert game.player is not None
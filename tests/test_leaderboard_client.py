@@ -0,0 +1,38 @@
+"""Testy klienta sdíleného žebříčku (systems.leaderboard_client)."""
+
+import socket
+import time
+
+import pytest
+
+from systems.leaderboard_client import LeaderboardClient
+
+
+def _closed_port():
+    """Port na localhostu, na kterém nic nenaslouchá (spojení se odmítne)."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_fetch(client, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while client._fetching and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_nonblocking_read_does_not_wait_for_unavailable_server():
+    client = LeaderboardClient(f"127.0.0.1:{_closed_port()}", retries=2, backoff=0.2)
+
+    started = time.monotonic()
+    assert client.get_leaderboard("Lama", block=False) is None
+    assert time.monotonic() - started < 0.1
+
+    _wait_for_fetch(client)
+    started = time.monotonic()
+    for _ in range(10):
+        with pytest.raises(ConnectionError):
+            client.get_leaderboard("Lama", block=False)
+    # Nedostupnost je v cache - další překreslení se nepřipojují znovu
+    assert time.monotonic() - started < 0.1
+    assert client.stats["requests"] == 1
@@ -0,0 +1,82 @@
+"""Testy serveru sdíleného žebříčku (systems.leaderboard_server)."""
+
+import asyncio
+import gc
+import json
+
+import pytest
+
+from systems import leaderboard
+from systems.leaderboard_server import MAX_TOP, LeaderboardServer
+
+START = "2026-01-02T03:04:05"
+
+
+@pytest.fixture
+def leaderboards_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(leaderboard, "LEADERBOARDS_DIR", tmp_path)
+    leaderboard.invalidate_cache()
+    yield tmp_path
+    leaderboard.invalidate_cache()
+
+
+async def _request(port, message):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(json.dumps(message).encode("utf-8") + b"\n")
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+    return response
+
+
+def test_top_limit_is_bounded(leaderboards_dir):
+    leaderboard.save_results_local([
+        ("Lama", f"p{i}", i, 1, 1, 1000 + i, START) for i in range(MAX_TOP + 50)
+    ])
+
+    async def scenario():
+        server = LeaderboardServer(port=0)
+        await server.start()
+        try:
+            huge = await _request(server.port, {"op": "top", "difficulty": "Lama", "limit": 10 ** 8})
+            zero = await _request(server.port, {"op": "top", "difficulty": "Lama", "limit": 0})
+            text = await _request(server.port, {"op": "top", "difficulty": "Lama", "limit": "5"})
+        finally:
+            await server.close()
+        return huge, zero, text
+
+    huge, zero, text = asyncio.run(scenario())
+    assert huge["ok"] and len(huge["results"]) == MAX_TOP
+    assert not zero["ok"]
+    assert not text["ok"]
+
+
+def test_failed_write_of_disconnected_client_is_reported_once(leaderboards_dir, monkeypatch, capsys):
+    def broken_save(rows):
+        raise OSError("disk je plný")
+
+    monkeypatch.setattr(leaderboard, "save_results_local", broken_save)
+    unhandled = []
+
+    async def scenario():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        server = LeaderboardServer(port=0, batch_delay=0.2)
+        await server.start()
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            submit = {"op": "submit", "id": "abc", "results": [["Lama", "x", 1, 1, 1, 1, START]]}
+            writer.write(json.dumps(submit).encode("utf-8") + b"\n")
+            await writer.drain()
+            await asyncio.sleep(0.05)
+            writer.close()  # Klient se odpojí dřív, než server dávku zapíše
+            await asyncio.sleep(0.4)
+        finally:
+            await server.close()
+        gc.collect()
+        await asyncio.sleep(0)
+        return server.stats
+
+    stats = asyncio.run(scenario())
+    assert stats["failed_writes"] == 1
+    assert capsys.readouterr().err.count("disk je plný") == 1
+    assert unhandled == []
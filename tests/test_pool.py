@@ -0,0 +1,79 @@
+"""Testy recyklace entit přes EntityPool (systems.pool)."""
+
+from types import SimpleNamespace
+
+import pygame
+
+from entities.bullet import Bullet
+from entities.enemy import Enemy
+from entities.group import EntityGroup, RenderGroup
+from systems.pool import EntityPool
+
+
+def _spawn(pool, groups, *args, **kwargs):
+    entity = pool.acquire(*args, **kwargs)
+    for group in groups:
+        group.add(entity)
+    return entity
+
+
+def test_killed_enemy_is_reset_on_reuse():
+    game = SimpleNamespace(enemy_store=None)
+    pool = EntityPool(Enemy)
+    enemies, render = EntityGroup(), RenderGroup()
+    screen = pygame.Surface((400, 400))
+
+    enemy = _spawn(pool, (enemies, render), game, (50, 60), size=(30, 30))
+    enemy.prev_pos.update(40, 50)
+    render.draw(screen)
+    drawn = enemy.rect.copy()
+    enemy.kill()
+
+    assert pool.stats() == {"hits": 0, "misses": 1, "in_use": 0, "free": 1, "high_water": 1}
+    assert render.lost_rects == [drawn]
+    assert enemy.groups == () and enemy.pool is None
+
+    other_game = SimpleNamespace(enemy_store=None)
+    reused = pool.acquire(other_game, (200, 150), size=(18, 18))
+
+    assert reused is enemy
+    assert reused.game is other_game
+    assert reused.rect.size == (18, 18) and reused.rect.center == (200, 150)
+    assert tuple(reused.pos) == (200, 150) and tuple(reused.prev_pos) == (200, 150)
+    assert reused.groups == () and not reused.alive()
+    assert reused not in enemies and reused not in render
+    assert reused.pool is pool
+
+    # Znovu přidaná entita nezdědí starou oblast vykreslení
+    render.add(reused)
+    dirty = render.draw(screen)
+    assert dirty == [drawn, reused.rect]
+    assert render.lost_rects == []
+
+    assert pool.stats() == {"hits": 1, "misses": 1, "in_use": 1, "free": 0, "high_water": 1}
+    second = pool.acquire(game, (10, 10), size=(30, 30))
+    assert second is not reused
+    assert pool.stats() == {"hits": 1, "misses": 2, "in_use": 2, "free": 0, "high_water": 2}
+    reused.kill()  # Není v žádné skupině - do poolu ji vrátí přímo kill()
+    assert pool.stats() == {"hits": 1, "misses": 2, "in_use": 1, "free": 1, "high_water": 2}
+
+
+def test_killed_bullet_is_reset_on_reuse():
+    game = SimpleNamespace()
+    pool = EntityPool(Bullet)
+    pool.preallocate(2, game, (0, 0), pygame.Vector2(1, 0))
+    bullets = EntityGroup()
+
+    bullet = _spawn(pool, (bullets,), game, (100, 100), pygame.Vector2(1, 0))
+    bullet.update(0.1)
+    assert bullet.timer > 0 and bullet.prev_pos != bullet.pos
+    bullet.kill()
+
+    direction = pygame.Vector2(0, -1)
+    reused = pool.acquire(game, (30, 40), direction)
+    assert reused is bullet
+    assert tuple(reused.pos) == (30, 40) and tuple(reused.prev_pos) == (30, 40)
+    assert reused.rect.center == (30, 40) and reused.rect.size == (10, 10)
+    assert reused.direction is direction and reused.timer == 0
+    assert reused.groups == () and reused not in bullets
+    assert pool.stats() == {"hits": 2, "misses": 0, "in_use": 1, "free": 1, "high_water": 1}
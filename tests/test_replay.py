@@ -0,0 +1,62 @@
+"""Testy záznamu a přehrávání vstupů (systems.replay)."""
+
+import pytest
+
+from game import Game
+from systems.config import GameConfig
+from systems.inputs import InputState
+from systems.replay import InputRecorder, load_replay, replay
+
+
+def _policy(game, tick):
+    """Deterministické vstupy: hráč krouží arénou a střílí na střed."""
+    phase = (tick // 60) % 4
+    return InputState(
+        up=phase == 0,
+        right=phase == 1,
+        down=phase == 2,
+        left=phase == 3,
+        mouse_pos=(game.config.width // 2, game.config.height // 2),
+        shoot=1 if tick % 10 == 0 else 0,
+    )
+
+
+def _record(path, config, seconds=20):
+    game = Game(headless=True, seed=1234, config=config)
+    game.persist_results = False
+    game.start_simulation(player_name="Tester", difficulty="Machr")
+    game.begin_game()
+    recorder = InputRecorder(path, game.current_seed, "Machr", "Tester", game.config)
+    game.recorder = recorder
+    tick = 0
+    while tick < seconds * 120 and game.step(1 / 120, _policy(game, tick)):
+        tick += 1
+    recorder.close()  # Game over už záznam zavřel sám
+    return game.last_result if game.state == "game_over" else game.current_result()
+
+
+def test_replay_reproduces_non_default_config(tmp_path):
+    config = GameConfig(
+        width=640, height=480, spawn_interval=0.4, max_enemies=12, max_bullets=5,
+        enemy_sizes={"Machr": [18, 18]},
+    )
+    path = tmp_path / "custom.replay"
+    recorded = _record(path, config)
+
+    _, _, _, stored, _ = load_replay(path)
+    assert stored.size == (640, 480)
+    assert stored.spawn_interval == 0.4
+    assert stored.max_enemies == 12
+    assert stored.max_bullets == 5
+    assert stored.enemy_sizes["Machr"] == (18, 18)
+
+    replayed = replay(path)
+    for key in ("score", "shoots", "game_duration_ms"):
+        assert replayed[key] == recorded[key]
+
+
+def test_replay_rejects_game_with_different_config(tmp_path):
+    path = tmp_path / "custom.replay"
+    _record(path, GameConfig(width=640, height=480), seconds=1)
+    with pytest.raises(ValueError):
+        replay(path, game=Game(headless=True))
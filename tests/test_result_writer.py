@@ -0,0 +1,66 @@
+"""Testy zápisu výsledků na pozadí (systems.result_writer)."""
+
+import time
+
+from systems.result_writer import ResultWriter
+
+RESULT = ("Lama", "Alice", 5, 10, 50, 1200, "2026-01-02T03:04:05")
+OTHER = ("Machr", "Bob", 7, 7, 100, 900, "2026-01-02T03:04:06")
+
+
+class FlakyServer:
+    """save_batch, který prvních `failures` pokusů hlásí nedostupný server."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.attempts = []
+        self.saved = []
+
+    def __call__(self, results, submission_id):
+        self.attempts.append(submission_id)
+        if len(self.attempts) <= self.failures:
+            raise ConnectionError("server není dostupný")
+        self.saved.append(list(results))
+
+
+def test_close_writes_pending_results_without_empty_batch():
+    server = FlakyServer(failures=0)
+    writer = ResultWriter(save_batch=server)
+    writer.submit(*RESULT)
+    writer.flush()
+    writer.close()
+
+    assert server.saved == [[RESULT]]
+    assert writer.written == 1
+    assert writer.batches == 1
+
+
+def test_unsent_results_are_resent_with_same_id():
+    server = FlakyServer(failures=2)
+    writer = ResultWriter(save_batch=server, retry_interval=0.01)
+    writer.submit(*RESULT)
+    writer.flush()
+    deadline = time.monotonic() + 5
+    while writer.unsent and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.close()
+
+    assert server.saved == [[RESULT]]
+    assert len(set(server.attempts)) == 1  # Server pozná opakování podle id
+    assert writer.written == 1
+    assert writer.failed == 0
+
+
+def test_results_fall_back_locally_when_server_stays_down():
+    server = FlakyServer(failures=1000)
+    local = []
+    writer = ResultWriter(save_batch=server, fallback=local.append, retry_interval=60)
+    writer.submit(*RESULT)
+    writer.flush()
+    writer.submit(*OTHER)
+    writer.close()
+
+    assert server.saved == []
+    assert local == [[RESULT], [OTHER]]
+    assert writer.saved_locally == 2
+    assert writer.failed == 0
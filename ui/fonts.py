@@ -0,0 +1,73 @@
+"""Sdílený registr fontů a LRU cache vykreslených textů pro UI."""
+
+from collections import OrderedDict
+
+import pygame
+
+from settings import TEXT_CACHE_BUDGET
+
+# Načtené fonty podle (face, size) - každý se načte jen jednou
+_fonts = {}
+
+# Vykreslené texty podle (text, size, color, face) -> Surface, v pořadí použití
+_surfaces = OrderedDict()
+_cache_bytes = 0
+
+# Statistiky cache vykreslených textů
+stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def get_font(size, face=None):
+	"""Vrátí font dané velikosti; systémový font se načte jen poprvé."""
+	key = (face, size)
+	font = _fonts.get(key)
+	if font is None:
+		font = pygame.font.SysFont(face, size)
+		_fonts[key] = font
+	return font
+
+
+def _surface_bytes(surface):
+	return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def render_text(text, size, color, face=None):
+	"""
+	Vrátí vyhlazený Surface s textem, z cache pokud už byl vykreslen.
+
+	Cache má omezený rozpočet paměti (TEXT_CACHE_BUDGET v bajtech);
+	při jeho překročení se zahazují nejdéle nepoužité texty.
+	Vrácený Surface je sdílený - volající ho nesmí měnit.
+	"""
+	global _cache_bytes
+	key = (text, size, tuple(color), face)
+	surface = _surfaces.get(key)
+	if surface is not None:
+		_surfaces.move_to_end(key)
+		stats["hits"] += 1
+		return surface
+
+	stats["misses"] += 1
+	surface = get_font(size, face).render(text, True, color)
+	_surfaces[key] = surface
+	_cache_bytes += _surface_bytes(surface)
+
+	# Vyhoď nejdéle nepoužité texty, dokud se nevejdeme do rozpočtu
+	while _cache_bytes > TEXT_CACHE_BUDGET and len(_surfaces) > 1:
+		_, old = _surfaces.popitem(last=False)
+		_cache_bytes -= _surface_bytes(old)
+		stats["evictions"] += 1
+	return surface
+
+
+def cache_size():
+	"""Vrátí (počet textů, obsazené bajty) v cache vykreslených textů."""
+	return len(_surfaces), _cache_bytes
+
+
+def clear():
+	"""Vyprázdní registr fontů i cache textů (např. po pygame.font.quit())."""
+	global _cache_bytes
+	_fonts.clear()
+	_surfaces.clear()
+	_cache_bytes = 0
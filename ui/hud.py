@@ -0,0 +1,94 @@
+"""HUD herní obrazovky s cache vykreslených popisků."""
+
+from ui.fonts import render_text
+
+WHITE = (255, 255, 255)
+
+# Pozice popisků HUD v horní liště
+POSITIONS = {
+	"score": (10, 10),
+	"time": (210, 10),
+	"shoots": (410, 10),
+	"accuracy": (610, 10),
+	"ammo": (810, 10),
+}
+
+
+def ammo_color(shots_left):
+	"""Barva munice podle stavu: >5 bílá, 3–5 žlutá, ≤2 červená."""
+	if shots_left <= 2:
+		return (255, 80, 80)
+	if shots_left <= 5:
+		return (255, 210, 80)
+	return WHITE
+
+
+def _time_text(time_value):
+	minutes = (time_value // 60) if isinstance(time_value, int) else 0
+	seconds = (time_value % 60) if isinstance(time_value, int) else 0
+	return f"Time: {minutes}:{seconds:02d}"
+
+
+# Text a barva popisku podle hodnoty
+_FORMATS = {
+	"score": lambda value: (f"Score: {value}", WHITE),
+	"time": lambda value: (_time_text(value), WHITE),
+	"shoots": lambda value: (f"Shoots: {value}", WHITE),
+	"accuracy": lambda value: (f"Accuracy: {value}%", WHITE),
+	"ammo": lambda value: (f"Ammo: {value}", ammo_color(value)),
+	"ammo_small": lambda value: (str(value), ammo_color(value)),
+}
+
+# Velikost písma popisků (munice pod hráčem je menší)
+_SIZES = {"ammo_small": 20}
+
+
+class Hud:
+	"""
+	HUD se skóre, časem, výstřely, přesností a municí.
+
+	Každý popisek si pamatuje hodnotu, pro kterou byl vykreslen, a znovu
+	se formátuje a vykresluje jen při její změně. Čas se předává v celých
+	sekundách, takže se překreslí nejvýše jednou za sekundu.
+
+	Attributes:
+		labels: Slovník název -> (hodnota, Surface)
+	"""
+
+	def __init__(self):
+		self.labels = {}
+
+	def label(self, name, value):
+		"""Vrátí Surface popisku `name` pro danou hodnotu (z cache, pokud se nezměnila)."""
+		cached = self.labels.get(name)
+		if cached is not None and cached[0] == value:
+			return cached[1]
+		text, color = _FORMATS[name](value)
+		surface = render_text(text, _SIZES.get(name, 36), color)
+		self.labels[name] = (value, surface)
+		return surface
+
+	def draw(self, screen, *, score, time_value, shoots, accuracy, shots_left=None):
+		"""
+		Vykreslí HUD do horní lišty.
+
+		Returns:
+			Seznam Rect oblastí, do kterých se kreslilo
+		"""
+		values = (
+			("score", score),
+			("time", time_value),
+			("shoots", shoots),
+			("accuracy", accuracy),
+			("ammo", shots_left),
+		)
+		rects = []
+		for name, value in values:
+			if value is None:
+				continue
+			rects.append(screen.blit(self.label(name, value), POSITIONS[name]))
+		return rects
+
+	def invalidate(self):
+		"""Zahodí vykreslené popisky (např. po vyprázdnění cache fontů)."""
+		self.labels.clear()
@@ -6,6 +6,7 @@ Poskytuje navigaci mezi různými částmi hry.
 
 import pygame
 from ui.widgets import draw_menu
+from ui.screen_cache import ScreenCache
 
 class Menu:
     """
@@ -32,6 +33,7 @@ class Menu:
             "Konec"
         ]
         self.selected = 0
+        self.cache = ScreenCache()
 
     def handle_event(self, event):
         """
@@ -69,15 +71,24 @@ class Menu:
         elif option == "Konec":
             self.game.running = False
 
-    def draw(self, screen):
+    def draw(self, screen, force=False):
         """
         Vykresluje hlavní menu na obrazovku.
         
+        Menu se překreslí jen při změně vybrané položky.
+
         Args:
             screen: Pygame Surface pro vykreslování
+            force: Zkopírovat menu na obrazovku i beze změny
+
+        Returns:
+            True, pokud se obrazovka změnila (je třeba flip)
         """
+        return self.cache.draw(screen, (self.selected,), self._render, force)
+
+    def _render(self, surface):
         draw_menu(
-            screen,
+            surface,
             "ARENA SURVIVAL",
             self.options,
             self.selected,
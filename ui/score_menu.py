@@ -7,6 +7,7 @@ Zobrazuje žebríčky nejlepších hráčů dle obtížnosti.
 import pygame
 from ui.widgets import draw_panel
 from systems.leaderboard import get_leaderboard, DIFFICULTIES
+from ui.screen_cache import ScreenCache
 
 
 class ScoreMenu:
@@ -27,6 +28,7 @@ class ScoreMenu:
         """
         self.game = game
         self.selected_difficulty = 0  # Výchozí: Lama
+        self.cache = ScreenCache()
     
     def handle_event(self, event):
         """
@@ -43,20 +45,34 @@ class ScoreMenu:
             elif event.key == pygame.K_ESCAPE or event.key == pygame.K_RETURN:
                 self.game.state = "menu"
     
-    def draw(self, screen):
+    def draw(self, screen, force=False):
         """
         Vykresluje score menu na obrazovku.
         
+        Překreslí se jen při změně obtížnosti nebo obsahu žebříčku.
+
         Args:
             screen: Pygame Surface pro vykreslování
+            force: Zkopírovat menu na obrazovku i beze změny
+
+        Returns:
+            True, pokud se obrazovka změnila (je třeba flip)
         """
         # Načti žebríček pro vybranou obtížnost
         difficulty = DIFFICULTIES[self.selected_difficulty]
-        leaderboard = get_leaderboard(difficulty, limit=5)
+        # Sdílený server se dotazuje na pozadí - menu nikdy nečeká na síť
+        try:
+            leaderboard = get_leaderboard(difficulty, limit=5, block=False)
+        except ConnectionError:
+            leaderboard = False  # Sdílený server žebříčku neodpovídá
         
         # Sestav řádky s výsledky
         lines = []
-        if leaderboard:
+        if leaderboard is None:
+            lines.append("Načítám žebříček...")
+        elif leaderboard is False:
+            lines.append("Žebříček není dostupný")
+        elif leaderboard:
             for i, result in enumerate(leaderboard):
                 name = result.get("name", "?")
                 score = result.get("score", 0)
@@ -76,15 +92,18 @@ class ScoreMenu:
             "Enter nebo ESC pro návrat"
         ]
         
-        draw_panel(
-            screen,
-            "NEJLEPŠÍ VÝSLEDKY",
-            lines,
-            hint=hint,
-            title_color=(255, 255, 255),
-            line_color=(200, 200, 200),
-            title_y=100,
-            start_y=200,
-            line_spacing=50,
-            hint_y_offset=80,
-        )
\ No newline at end of file
+        def render(surface):
+            draw_panel(
+                surface,
+                "NEJLEPŠÍ VÝSLEDKY",
+                lines,
+                hint=hint,
+                title_color=(255, 255, 255),
+                line_color=(200, 200, 200),
+                title_y=100,
+                start_y=200,
+                line_spacing=50,
+                hint_y_offset=80,
+            )
+
+        return self.cache.draw(screen, (difficulty, tuple(lines)), render, force)
@@ -0,0 +1,52 @@
+"""Cache vykreslené statické obrazovky (menu, nastavení, výsledky)."""
+
+import pygame
+
+
+class ScreenCache:
+    """
+    Uchovává vykreslenou obrazovku a překresluje ji jen při změně stavu.
+
+    Stav obrazovky popisuje klíč (např. vybraná položka menu). Dokud se
+    klíč nezmění, obrazovka se znovu nevykresluje ani neposílá na displej.
+
+    Attributes:
+        surface: Surface s posledním vykreslením
+        key: Klíč stavu, pro který bylo vykreslení vytvořeno
+    """
+
+    def __init__(self):
+        self.surface = None
+        self.key = None
+
+    def draw(self, screen, key, render, force=False):
+        """
+        Vykreslí obrazovku, pokud se její stav změnil.
+
+        Args:
+            screen: Surface obrazovky
+            key: Hashovatelný popis stavu obrazovky
+            render: Funkce render(surface), která obrazovku vykreslí
+            force: Zkopírovat cache na obrazovku i bez změny stavu
+                (např. po návratu z jiné obrazovky)
+
+        Returns:
+            True, pokud se obsah obrazovky změnil a je třeba flip()
+        """
+        size = screen.get_size()
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size)
+            self.key = None
+
+        if key != self.key:
+            render(self.surface)
+            self.key = key
+        elif not force:
+            return False
+
+        screen.blit(self.surface, (0, 0))
+        return True
+
+    def invalidate(self):
+        """Vynutí nové vykreslení při příštím volání draw()."""
+        self.key = None
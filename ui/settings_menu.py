@@ -8,6 +8,7 @@ zvuk je přepínač.
 import pygame
 from settings import DIFFICULTY_LEVELS
 from ui.widgets import draw_menu
+from ui.screen_cache import ScreenCache
 
 DIFFICULTY_LABEL = "Obtížnost"
 SOUND_LABEL = "Zvuk"
@@ -21,6 +22,7 @@ class SettingsMenu:
         self.game = game
         self.options = [DIFFICULTY_LABEL, SOUND_LABEL, BACK_LABEL]
         self.selected = 0
+        self.cache = ScreenCache()
 
     # ------------------------------------------------------------------
     def handle_event(self, event):
@@ -64,7 +66,13 @@ class SettingsMenu:
         self.game.difficulty_index = (self.game.difficulty_index + step) % total
 
     # ------------------------------------------------------------------
-    def draw(self, screen):
+    def draw(self, screen, force=False):
+        """Vykreslí menu jen při změně výběru, obtížnosti nebo zvuku."""
+        key = (self.selected, self.game.difficulty_index, self.game.sound_on)
+        return self.cache.draw(screen, key, self._render, force)
+
+    # ------------------------------------------------------------------
+    def _render(self, screen):
         option_texts = [
             f"{DIFFICULTY_LABEL}: {self._current_difficulty_name()}",
             f"{SOUND_LABEL}: {'Zapnutý' if self.game.sound_on else 'Vypnutý'}",
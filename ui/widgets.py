@@ -2,6 +2,12 @@
 
 import pygame
 
+from ui.fonts import render_text
+from ui.hud import Hud
+
+# Sdílený HUD pro volání draw_hud() bez vlastní instance
+_default_hud = Hud()
+
 
 def draw_panel(
 	screen,
@@ -25,15 +31,12 @@ def draw_panel(
 
 	screen.fill(bg_color)
 
-	font_title = pygame.font.SysFont(None, 52)
-	font_line = pygame.font.SysFont(None, 32)
-
-	title_surf = font_title.render(title, True, title_color)
+	title_surf = render_text(title, 52, title_color)
 	screen.blit(title_surf, title_surf.get_rect(center=(width // 2, title_y)))
 
 	for i, line in enumerate(lines):
 		color = highlight_color if highlight_first and i == 0 else line_color
-		line_surf = font_line.render(line, True, color)
+		line_surf = render_text(line, 32, color)
 		y = start_y + i * line_spacing
 		screen.blit(line_surf, line_surf.get_rect(center=(width // 2, y)))
 
@@ -44,7 +47,7 @@ def draw_panel(
 			hints = [hint]
 		for idx, h in enumerate(hints):
 			y = height - hint_y_offset + idx * 25
-			hint_surf = font_line.render(h, True, hint_color)
+			hint_surf = render_text(h, 32, hint_color)
 			screen.blit(hint_surf, hint_surf.get_rect(center=(width // 2, y)))
 
 
@@ -69,10 +72,7 @@ def draw_input_panel(
 
 	screen.fill(bg_color)
 
-	font_title = pygame.font.SysFont(None, 52)
-	font_hint = pygame.font.SysFont(None, 32)
-
-	title_surf = font_title.render(title, True, title_color)
+	title_surf = render_text(title, 52, title_color)
 	screen.blit(title_surf, title_surf.get_rect(center=(width // 2, height // 2 - title_offset)))
 
 	box_rect = pygame.Rect(0, 0, *box_size)
@@ -80,11 +80,11 @@ def draw_input_panel(
 	pygame.draw.rect(screen, box_color, box_rect)
 	pygame.draw.rect(screen, border_color, box_rect, 2)
 
-	text_surf = font_title.render(value, True, text_color)
+	text_surf = render_text(value, 52, text_color)
 	screen.blit(text_surf, text_surf.get_rect(center=box_rect.center))
 
 	if hint:
-		hint_surf = font_hint.render(hint, True, hint_color)
+		hint_surf = render_text(hint, 32, hint_color)
 		screen.blit(hint_surf, hint_surf.get_rect(center=(width // 2, height // 2 + hint_offset)))
 
 
@@ -110,15 +110,12 @@ def draw_menu(
 
 	screen.fill(bg_color)
 
-	font_title = pygame.font.SysFont(None, 48)
-	font_option = pygame.font.SysFont(None, 32)
-
-	title_surf = font_title.render(title, True, title_color)
+	title_surf = render_text(title, 48, title_color)
 	screen.blit(title_surf, title_surf.get_rect(center=(width // 2, title_y)))
 
 	for i, option in enumerate(options):
 		color = selected_color if i == selected else option_color
-		option_surf = font_option.render(option, True, color)
+		option_surf = render_text(option, 32, color)
 		y = start_y + i * option_spacing
 		screen.blit(option_surf, option_surf.get_rect(center=(width // 2, y)))
 
@@ -129,37 +126,39 @@ def draw_menu(
 			hints = [hint]
 		for idx, h in enumerate(hints):
 			y = height - hint_y_offset + idx * 22
-			hint_surf = font_option.render(h, True, hint_color)
+			hint_surf = render_text(h, 32, hint_color)
 			screen.blit(hint_surf, hint_surf.get_rect(center=(width // 2, y)))
 
 
-def draw_hud(screen, *, score, time_value, shoots, accuracy, shots_left=None):
+def draw_hud(screen, *, score, time_value, shoots, accuracy, shots_left=None, hud=None):
 	"""Vykreslí HUD se skóre, časem (mm:ss), počtem výstřelů a úspěšností.
 
 	Ammo je barevně zvýrazněno: >5 bílá, 3–5 žlutá, ≤2 červená.
+	Popisky se vykreslují přes `hud` (ui.hud.Hud, výchozí je sdílená instance),
+	který je překresluje jen při změně hodnoty.
+	Vrací seznam Rect oblastí, do kterých se kreslilo.
 	"""
-	font = pygame.font.SysFont(None, 36)
-	minutes = (time_value // 60) if isinstance(time_value, int) else 0
-	seconds = (time_value % 60) if isinstance(time_value, int) else 0
-	time_str = f"{minutes}:{seconds:02d}"
-
-	white = (255, 255, 255)
-	labels = [
-		(f"Score: {score}", (10, 10), white),
-		(f"Time: {time_str}", (210, 10), white),
-		(f"Shoots: {shoots}", (410, 10), white),
-		(f"Accuracy: {accuracy}%", (610, 10), white),
-	]
-
-	if shots_left is not None:
-		if shots_left <= 2:
-			ammo_color = (255, 80, 80)
-		elif shots_left <= 5:
-			ammo_color = (255, 210, 80)
-		else:
-			ammo_color = white
-		labels.append((f"Ammo: {shots_left}", (810, 10), ammo_color))
-
-	for text, pos, color in labels:
-		surf = font.render(text, True, color)
-		screen.blit(surf, pos)
+	hud = hud or _default_hud
+	return hud.draw(
+		screen,
+		score=score,
+		time_value=time_value,
+		shoots=shoots,
+		accuracy=accuracy,
+		shots_left=shots_left,
+	)
+
+
+def draw_profiler(screen, summary, *, pos=(10, 50), line_spacing=18, color=(120, 255, 120)):
+	"""Vykreslí tabulku percentilů fází snímku (p50/p95/p99 v ms) pod HUD.
+
+	`summary` je výstup FrameProfiler.summary().
+	Vrací seznam Rect oblastí, do kterých se kreslilo.
+	"""
+	x, y = pos
+	rects = []
+	for i, (phase, values) in enumerate(summary.items()):
+		text = f"{phase:<10} {values['p50']:6.2f} {values['p95']:6.2f} {values['p99']:6.2f} ms"
+		surf = render_text(text, 20, color, "monospace")
+		rects.append(screen.blit(surf, (x, y + i * line_spacing)))
+	return rects